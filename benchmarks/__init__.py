@@ -0,0 +1,3 @@
+"""
+Бенчмарки производительности генератора отчетов
+"""
\ No newline at end of file
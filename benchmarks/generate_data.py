@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import random
+from typing import List, Optional
+
+
+# Размеры наборов данных, доступные по имени
+SIZES = {
+    '10k': 10_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000,
+}
+
+# Базовые колонки синтетического файла
+BASE_COLUMNS = ['id', 'email', 'name', 'department', 'hours_worked', 'hourly_rate']
+
+DEPARTMENTS = ['Marketing', 'Design', 'Sales', 'Engineering', 'Support', 'Finance', 'HR', 'Legal']
+
+FIRST_NAMES = ['Alice', 'Bob', 'Carol', 'Dan', 'Eve', 'Frank', 'Grace', 'Heidi', 'Ivan', 'Judy']
+LAST_NAMES = ['Johnson', 'Smith', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson']
+
+# Количество строк, записываемых в файл за один раз
+WRITE_BATCH_SIZE = 10_000
+
+
+def parse_size(size: str) -> int:
+    """
+    Преобразует размер набора данных в количество строк.
+    
+    Args:
+        size: Имя размера (10k, 1m, 10m) или число строк
+        
+    Returns:
+        Количество строк
+        
+    Raises:
+        ValueError: Если размер не распознан
+    """
+    if size.lower() in SIZES:
+        return SIZES[size.lower()]
+    
+    rows = int(size)
+    
+    if rows < 0:
+        raise ValueError(f"Некорректный размер набора данных: {size}")
+    
+    return rows
+
+
+def dataset_name(rows: int, extra_columns: int = 0, bad_line_rate: float = 0.0,
+                 bad_value_rate: float = 0.0, seed: int = 0, quoted_rate: float = 0.0) -> str:
+    """
+    Формирует имя файла набора данных по его параметрам.
+    
+    Args:
+        rows: Количество строк
+        extra_columns: Количество дополнительных колонок
+        bad_line_rate: Доля строк с неверным числом колонок
+        bad_value_rate: Доля строк с нечисловым значением часов
+        seed: Начальное значение генератора случайных чисел
+        quoted_rate: Доля строк, все поля которых записаны в кавычках
+        
+    Returns:
+        Имя CSV файла
+    """
+    quoted = f"_q{quoted_rate:g}" if quoted_rate else ''
+    
+    return f"employees_{rows}_c{extra_columns}_l{bad_line_rate:g}_v{bad_value_rate:g}_s{seed}{quoted}.csv"
+
+
+def generate_csv(file_path: str, rows: int, extra_columns: int = 0, bad_line_rate: float = 0.0,
+                 bad_value_rate: float = 0.0, seed: int = 0, quoted_rate: float = 0.0) -> int:
+    """
+    Генерирует синтетический CSV файл с данными сотрудников.
+    
+    Args:
+        file_path: Путь к создаваемому файлу
+        rows: Количество строк данных
+        extra_columns: Количество дополнительных колонок после базовых,
+            которые отчеты не используют
+        bad_line_rate: Доля строк с неверным числом колонок
+        bad_value_rate: Доля строк с нечисловым значением часов
+        seed: Начальное значение генератора случайных чисел
+        quoted_rate: Доля строк, записанных как в выгрузках HR систем: все
+            поля в кавычках, а имя вида "Фамилия, Имя" содержит разделитель.
+            Такие строки разбираются только в диалекте rfc4180
+        
+    Returns:
+        Размер файла в байтах
+    """
+    rng = random.Random(seed)
+    header = BASE_COLUMNS + [f'extra_{index}' for index in range(extra_columns)]
+    extra = ',' + ','.join(f'value{index}' for index in range(extra_columns)) if extra_columns else ''
+    
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(','.join(header) + '\n')
+        
+        for start in range(0, rows, WRITE_BATCH_SIZE):
+            lines: List[str] = []
+            
+            for row_id in range(start + 1, min(start + WRITE_BATCH_SIZE, rows) + 1):
+                roll = rng.random()
+                
+                if roll < bad_line_rate:
+                    lines.append(f"{row_id},broken line\n")
+                    continue
+                
+                first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                hours = 'n/a' if roll < bad_line_rate + bad_value_rate else str(rng.randint(40, 200))
+                department, rate = rng.choice(DEPARTMENTS), rng.randint(10, 100)
+                
+                # Случайное число для кавычек берется, только если они
+                # заданы, чтобы наборы данных без кавычек не менялись
+                if quoted_rate and rng.random() < quoted_rate:
+                    values = [str(row_id), f"user{row_id}@example.com", f"{last_name}, {first_name} {row_id}",
+                              department, hours, str(rate)] + [f'value{index}' for index in range(extra_columns)]
+                    lines.append(','.join(f'"{value}"' for value in values) + '\n')
+                    continue
+                
+                lines.append(f"{row_id},user{row_id}@example.com,{first_name} {last_name} {row_id},{department},"
+                             f"{hours},{rate}{extra}\n")
+            
+            file.write(''.join(lines))
+    
+    return os.path.getsize(file_path)
+
+
+def ensure_dataset(data_dir: str, rows: int, extra_columns: int = 0, bad_line_rate: float = 0.0,
+                   bad_value_rate: float = 0.0, seed: int = 0, quoted_rate: float = 0.0) -> str:
+    """
+    Возвращает путь к набору данных, генерируя его, если он еще не создан.
+    
+    Args:
+        data_dir: Каталог наборов данных
+        rows: Количество строк
+        extra_columns: Количество дополнительных колонок
+        bad_line_rate: Доля строк с неверным числом колонок
+        bad_value_rate: Доля строк с нечисловым значением часов
+        seed: Начальное значение генератора случайных чисел
+        quoted_rate: Доля строк, все поля которых записаны в кавычках
+        
+    Returns:
+        Путь к CSV файлу
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    file_path = os.path.join(data_dir, dataset_name(rows, extra_columns, bad_line_rate, bad_value_rate, seed,
+                                                    quoted_rate))
+    
+    if not os.path.exists(file_path):
+        temp_path = file_path + '.tmp'
+        generate_csv(temp_path, rows, extra_columns, bad_line_rate, bad_value_rate, seed, quoted_rate)
+        os.replace(temp_path, file_path)
+    
+    return file_path
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Генератор синтетических CSV файлов с данными сотрудников')
+    parser.add_argument('output', help='Путь к создаваемому CSV файлу')
+    parser.add_argument('--rows', default='10k', help='Количество строк: 10k, 1m, 10m или число (по умолчанию 10k)')
+    parser.add_argument('--extra-columns', type=int, default=0, help='Количество дополнительных колонок')
+    parser.add_argument('--bad-line-rate', type=float, default=0.0, help='Доля строк с неверным числом колонок')
+    parser.add_argument('--bad-value-rate', type=float, default=0.0, help='Доля строк с нечисловым значением часов')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора случайных чисел')
+    parser.add_argument('--quoted-rate', type=float, default=0.0,
+                        help='Доля строк, все поля которых записаны в кавычках (имя содержит запятую)')
+    args = parser.parse_args(argv)
+    
+    size = generate_csv(args.output, parse_size(args.rows), args.extra_columns, args.bad_line_rate,
+                        args.bad_value_rate, args.seed, args.quoted_rate)
+    print(f"Создан файл {args.output} ({size} байт)")
+
+
+if __name__ == '__main__':
+    main()
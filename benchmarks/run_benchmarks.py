@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.generate_data import ensure_dataset, parse_size
+from main import save_to_file
+from src.reports.formatters import FormatterFactory
+from src.reports.report_generator import PayoutReportGenerator
+from src.utils.csv_reader import CSVDialect, CSVReader, RFC4180_DIALECT
+from src.utils.diagnostics import Diagnostics
+from src.utils.pipeline import PipelineStage, open_pipeline_output, pipeline_report
+from src.utils.profiling import peak_rss
+
+
+# Версия формата файла результатов
+RESULTS_VERSION = 1
+
+DEFAULT_SIZES = ['10k', '1m']
+DEFAULT_DATA_DIR = os.path.join('benchmarks', 'data')
+
+# Допустимое замедление этапа относительно базовых результатов при сравнении
+DEFAULT_THRESHOLD = 1.10
+
+# Доли строк с полями в кавычках в наборах данных этапов разбора rfc4180:
+# выгрузка, где в кавычках отдельные строки, и выгрузка, где в кавычках
+# все строки. Основной набор данных кавычек не содержит
+QUOTED_DATASETS = {
+    'parse_rfc4180_mixed': 0.1,
+    'parse_rfc4180_quoted': 1.0,
+}
+
+
+def _payout_generator(context: Dict[str, Any]) -> PayoutReportGenerator:
+    generator = PayoutReportGenerator()
+    generator.diagnostics = context['diagnostics']
+    
+    return generator
+
+
+def _read_file(context: Dict[str, Any]) -> Any:
+    return CSVReader.read_file(context['file_path'], diagnostics=context['diagnostics'])
+
+
+def _count_rows(file_path: str, dialect: CSVDialect) -> int:
+    return sum(1 for _ in CSVReader.iter_rows(file_path, diagnostics=Diagnostics(), dialect=dialect))
+
+
+def _parse_simple(context: Dict[str, Any]) -> Any:
+    return _count_rows(context['file_path'], CSVDialect())
+
+
+def _parse_rfc4180(context: Dict[str, Any]) -> Any:
+    return _count_rows(context['file_path'], CSVDialect(RFC4180_DIALECT))
+
+
+def _parse_rfc4180_mixed(context: Dict[str, Any]) -> Any:
+    return _count_rows(context['quoted_files']['parse_rfc4180_mixed'], CSVDialect(RFC4180_DIALECT))
+
+
+def _parse_rfc4180_quoted(context: Dict[str, Any]) -> Any:
+    return _count_rows(context['quoted_files']['parse_rfc4180_quoted'], CSVDialect(RFC4180_DIALECT))
+
+
+def _generate(context: Dict[str, Any]) -> Any:
+    return _payout_generator(context).generate(context['read_file'])
+
+
+def _format_json(context: Dict[str, Any]) -> Any:
+    return FormatterFactory.get_formatter('json').format(context['generate'])
+
+
+def _format_text(context: Dict[str, Any]) -> Any:
+    return FormatterFactory.get_formatter('text').format(context['generate'])
+
+
+def _format_columnar(context: Dict[str, Any]) -> Any:
+    return FormatterFactory.get_formatter('columnar').format(context['generate'])
+
+
+def _save_to_file(context: Dict[str, Any]) -> Any:
+    return save_to_file(context['format_json'], context['output_file'])
+
+
+def _streaming(context: Dict[str, Any]) -> Any:
+    generator = _payout_generator(context)
+    employees = CSVReader.iter_rows(context['file_path'], generator.required_columns,
+                                    diagnostics=context['diagnostics'])
+    
+    with open(context['output_file'], 'w', encoding='utf-8') as file:
+        FormatterFactory.get_formatter('json').write(generator.generate_stream(employees), file)
+
+
+def _pipeline(context: Dict[str, Any]) -> Any:
+    generator = _payout_generator(context)
+    employees = PipelineStage('read', CSVReader.iter_rows(context['file_path'], generator.required_columns,
+                                                          diagnostics=context['diagnostics']))
+    
+    with open_pipeline_output(context['output_file']) as file:
+        FormatterFactory.get_formatter('json').write(pipeline_report(generator.generate_stream(employees)), file)
+
+
+# Этапы в порядке выполнения: каждый получает результаты предыдущих
+# этапов в контексте под их именами. Этапы parse_simple и parse_rfc4180
+# сравнивают разбор в диалектах simple и rfc4180: они выполняются первыми
+# и не сохраняют строки, чтобы оба шли при одинаковом состоянии памяти.
+# Этапы parse_rfc4180_mixed и parse_rfc4180_quoted разбирают в диалекте
+# rfc4180 наборы данных того же размера со строками в кавычках
+# (QUOTED_DATASETS), для которых быстрый путь без модуля csv не подходит.
+# Этап streaming измеряет весь путь от чтения до записи без промежуточных
+# списков, как его выполняет main.py, а этап pipeline - тот же путь
+# с этапами в отдельных потоках (--pipeline)
+STAGES: List[Tuple[str, Callable[[Dict[str, Any]], Any]]] = [
+    ('parse_simple', _parse_simple),
+    ('parse_rfc4180', _parse_rfc4180),
+    ('parse_rfc4180_mixed', _parse_rfc4180_mixed),
+    ('parse_rfc4180_quoted', _parse_rfc4180_quoted),
+    ('read_file', _read_file),
+    ('generate', _generate),
+    ('format_json', _format_json),
+    ('format_text', _format_text),
+    ('format_columnar', _format_columnar),
+    ('save_to_file', _save_to_file),
+    ('streaming', _streaming),
+    ('pipeline', _pipeline),
+]
+
+
+def run_stages(file_path: str, output_file: str, quoted_files: Dict[str, str],
+               trace_memory: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Выполняет все этапы один раз.
+    
+    Args:
+        file_path: Путь к CSV файлу
+        output_file: Путь к файлу, в который сохраняется отчет
+        quoted_files: Пути к наборам данных со строками в кавычках по имени этапа
+        trace_memory: Измерять ли пиковое потребление памяти каждого этапа
+            через tracemalloc. Замедляет выполнение, поэтому время при этом
+            не учитывается
+        
+    Returns:
+        Словарь измерений по имени этапа: время (seconds) или пиковая
+        память в байтах (peak_memory)
+    """
+    context: Dict[str, Any] = {
+        'file_path': file_path,
+        'output_file': output_file,
+        'quoted_files': quoted_files,
+        'diagnostics': Diagnostics(),
+    }
+    measurements: Dict[str, Dict[str, float]] = {}
+    
+    for name, stage in STAGES:
+        if trace_memory:
+            tracemalloc.start()
+        
+        started = time.perf_counter()
+        context[name] = stage(context)
+        elapsed = time.perf_counter() - started
+        
+        if trace_memory:
+            measurements[name] = {'peak_memory': tracemalloc.get_traced_memory()[1]}
+            tracemalloc.stop()
+        else:
+            measurements[name] = {'seconds': elapsed}
+    
+    return measurements
+
+
+def benchmark_file(file_path: str, rows: int, quoted_files: Dict[str, str], repeat: int = 3,
+                   measure_memory: bool = True) -> Dict[str, Any]:
+    """
+    Измеряет время и память этапов обработки одного файла.
+    
+    Args:
+        file_path: Путь к CSV файлу
+        rows: Количество строк в файле
+        quoted_files: Пути к наборам данных со строками в кавычках
+            того же размера по имени этапа
+        repeat: Количество повторов измерения времени
+        measure_memory: Выполнять ли отдельный проход с измерением памяти
+        
+    Returns:
+        Словарь результатов по этапам: лучшее и медианное время, все
+        замеры, строк в секунду и пиковая память в байтах
+    """
+    runs: Dict[str, List[float]] = {name: [] for name, _ in STAGES}
+    
+    with tempfile.TemporaryDirectory(prefix='reports-bench-') as work_dir:
+        output_file = os.path.join(work_dir, 'report.json')
+        
+        for _ in range(max(repeat, 1)):
+            for name, measurement in run_stages(file_path, output_file, quoted_files).items():
+                runs[name].append(measurement['seconds'])
+        
+        memory = run_stages(file_path, output_file, quoted_files, trace_memory=True) if measure_memory else {}
+    
+    stages = {}
+    
+    for name, times in runs.items():
+        best = min(times)
+        stages[name] = {
+            'best': best,
+            'median': statistics.median(times),
+            'runs': times,
+            'rows_per_second': rows / best if best > 0 else None,
+            'peak_memory': memory.get(name, {}).get('peak_memory'),
+        }
+    
+    return stages
+
+
+def run(sizes: List[str], data_dir: str = DEFAULT_DATA_DIR, extra_columns: int = 0, bad_line_rate: float = 0.0,
+        bad_value_rate: float = 0.0, repeat: int = 3, measure_memory: bool = True, seed: int = 0) -> Dict[str, Any]:
+    """
+    Выполняет бенчмарки для наборов данных заданных размеров.
+    
+    Args:
+        sizes: Размеры наборов данных (10k, 1m, 10m или число строк)
+        data_dir: Каталог, в котором хранятся сгенерированные наборы данных
+        extra_columns: Количество дополнительных колонок
+        bad_line_rate: Доля строк с неверным числом колонок
+        bad_value_rate: Доля строк с нечисловым значением часов
+        repeat: Количество повторов измерения времени
+        measure_memory: Измерять ли пиковую память этапов
+        seed: Начальное значение генератора случайных чисел
+        
+    Returns:
+        Результаты в виде, пригодном для сохранения в JSON
+    """
+    results = []
+    
+    for size in sizes:
+        rows = parse_size(size)
+        file_path = ensure_dataset(data_dir, rows, extra_columns, bad_line_rate, bad_value_rate, seed)
+        quoted_files = {name: ensure_dataset(data_dir, rows, extra_columns, bad_line_rate, bad_value_rate, seed,
+                                             quoted_rate)
+                        for name, quoted_rate in QUOTED_DATASETS.items()}
+        
+        results.append({
+            'dataset': os.path.basename(file_path),
+            'rows': rows,
+            'bytes': os.path.getsize(file_path),
+            'stages': benchmark_file(file_path, rows, quoted_files, repeat, measure_memory),
+        })
+    
+    return {
+        'version': RESULTS_VERSION,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'config': {
+            'extra_columns': extra_columns,
+            'bad_line_rate': bad_line_rate,
+            'bad_value_rate': bad_value_rate,
+            'repeat': repeat,
+            'seed': seed,
+            'quoted_datasets': QUOTED_DATASETS,
+        },
+        'max_rss': peak_rss(),
+        'results': results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Сравнивает лучшее время этапов с базовыми результатами.
+    
+    Сравниваются только наборы данных и этапы, присутствующие в обоих
+    результатах.
+    
+    Args:
+        results: Текущие результаты
+        baseline: Базовые результаты, например предыдущей версии
+        threshold: Допустимое отношение текущего времени к базовому
+        
+    Returns:
+        Список сравнений: набор данных, этап, базовое и текущее время,
+        их отношение и признак регрессии
+    """
+    baseline_results = {result['dataset']: result for result in baseline.get('results', [])}
+    comparisons = []
+    
+    for result in results['results']:
+        previous = baseline_results.get(result['dataset'])
+        
+        if previous is None:
+            continue
+        
+        for name, stage in result['stages'].items():
+            previous_stage = previous['stages'].get(name)
+            
+            if not previous_stage or not previous_stage['best']:
+                continue
+            
+            ratio = stage['best'] / previous_stage['best']
+            comparisons.append({
+                'dataset': result['dataset'],
+                'stage': name,
+                'baseline': previous_stage['best'],
+                'current': stage['best'],
+                'ratio': ratio,
+                'regression': ratio > threshold,
+            })
+    
+    return comparisons
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Формирует текстовую таблицу результатов.
+    
+    Args:
+        results: Результаты бенчмарков
+        
+    Returns:
+        Текст таблицы
+    """
+    lines = [f"{'Набор данных':<45}{'Этап':<22}{'Лучшее, с':>12}{'Медиана, с':>12}{'Строк/с':>14}{'Память, МБ':>12}"]
+    
+    for result in results['results']:
+        for name, stage in result['stages'].items():
+            memory = f"{stage['peak_memory'] / 2 ** 20:.1f}" if stage['peak_memory'] is not None else '-'
+            rate = f"{stage['rows_per_second']:.0f}" if stage['rows_per_second'] else '-'
+            lines.append(f"{result['dataset']:<45}{name:<22}{stage['best']:>12.4f}{stage['median']:>12.4f}"
+                         f"{rate:>14}{memory:>12}")
+    
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарки этапов генерации отчета по заработной плате')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help='Размеры наборов данных: 10k, 1m, 10m или число строк (по умолчанию 10k 1m)')
+    parser.add_argument('--extra-columns', type=int, default=0, help='Количество дополнительных колонок')
+    parser.add_argument('--bad-line-rate', type=float, default=0.0, help='Доля строк с неверным числом колонок')
+    parser.add_argument('--bad-value-rate', type=float, default=0.0, help='Доля строк с нечисловым значением часов')
+    parser.add_argument('--repeat', type=int, default=3, help='Количество повторов измерения времени (по умолчанию 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора случайных чисел')
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR,
+                        help=f'Каталог сгенерированных наборов данных (по умолчанию {DEFAULT_DATA_DIR})')
+    parser.add_argument('--output', help='Путь к JSON файлу для сохранения результатов')
+    parser.add_argument('--compare', help='Путь к JSON файлу базовых результатов для сравнения')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Допустимое замедление относительно базовых результатов (по умолчанию {DEFAULT_THRESHOLD})')
+    parser.add_argument('--no-memory', action='store_true', help='Не измерять пиковую память этапов')
+    args = parser.parse_args(argv)
+    
+    try:
+        sizes = [str(parse_size(size)) for size in args.sizes]
+    except ValueError:
+        print(f"Ошибка: Некорректный размер набора данных: {' '.join(args.sizes)}")
+        return 1
+    
+    results = run(sizes, args.data_dir, args.extra_columns, args.bad_line_rate, args.bad_value_rate,
+                  args.repeat, not args.no_memory, args.seed)
+    print(format_results(results))
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+        print(f"Результаты сохранены в файл {args.output}")
+    
+    if not args.compare:
+        return 0
+    
+    with open(args.compare, 'r', encoding='utf-8') as file:
+        comparisons = compare(results, json.load(file), args.threshold)
+    
+    for comparison in comparisons:
+        status = 'РЕГРЕССИЯ' if comparison['regression'] else 'ok'
+        print(f"{comparison['dataset']} {comparison['stage']}: {comparison['baseline']:.4f} -> "
+              f"{comparison['current']:.4f} с (x{comparison['ratio']:.2f}) {status}")
+    
+    return 1 if any(comparison['regression'] for comparison in comparisons) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.generate_data import generate_csv
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(ROOT_DIR, 'main.py')
+
+# Допустимое время запуска main.py на небольшом файле сверх запуска пустого
+# интерпретатора, в миллисекундах
+STARTUP_BUDGET_MS = 100
+
+# Количество строк небольшого файла
+SMALL_FILE_ROWS = 100
+
+
+def run_once(args: List[str], env: Dict[str, str], import_time: bool = False) -> subprocess.CompletedProcess:
+    """
+    Запускает интерпретатор с аргументами.
+    
+    Args:
+        args: Аргументы интерпретатора
+        env: Переменные окружения
+        import_time: Включить ли вывод -X importtime
+        
+    Returns:
+        Результат запуска; stderr содержит вывод -X importtime
+    """
+    command = [sys.executable] + (['-X', 'importtime'] if import_time else []) + args
+    
+    return subprocess.run(command, env=env, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, check=True)
+
+
+def time_runs(args: List[str], env: Dict[str, str], repeat: int) -> List[float]:
+    """
+    Измеряет время запусков интерпретатора.
+    
+    Args:
+        args: Аргументы интерпретатора
+        env: Переменные окружения
+        repeat: Количество запусков
+        
+    Returns:
+        Время каждого запуска в миллисекундах
+    """
+    times = []
+    
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_once(args, env)
+        times.append((time.perf_counter() - started) * 1000)
+    
+    return times
+
+
+def parse_import_times(output: str) -> List[Dict[str, Any]]:
+    """
+    Разбирает вывод -X importtime.
+    
+    Args:
+        output: Вывод интерпретатора в stderr
+        
+    Returns:
+        Список импортов в порядке завершения: имя модуля, глубина
+        вложенности, собственное и накопленное время в микросекундах
+    """
+    imports = []
+    
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        imports.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            'self_us': int(self_time),
+            'cumulative_us': int(cumulative),
+        })
+    
+    return imports
+
+
+def run(repeat: int = 10, rows: int = SMALL_FILE_ROWS, top: int = 15) -> Dict[str, Any]:
+    """
+    Измеряет запуск main.py на небольшом файле.
+    
+    Кэш разобранных файлов не используется, как при запуске без
+    --cache-dir и переменной окружения REPORTS_CACHE_DIR.
+    
+    Args:
+        repeat: Количество запусков
+        rows: Количество строк файла
+        top: Количество самых долгих импортов верхнего уровня в результатах
+        
+    Returns:
+        Результаты в виде, пригодном для сохранения в JSON
+    """
+    with tempfile.TemporaryDirectory(prefix='reports-startup-') as work_dir:
+        file_path = os.path.join(work_dir, 'employees.csv')
+        generate_csv(file_path, rows)
+        env = {name: value for name, value in os.environ.items() if name != 'REPORTS_CACHE_DIR'}
+        main_args = [MAIN_SCRIPT, file_path, '--report', 'payout']
+        
+        interpreter = time_runs(['-c', 'pass'], env, repeat)
+        main = time_runs(main_args, env, repeat)
+        imports = parse_import_times(run_once(main_args, env, import_time=True).stderr)
+    
+    overhead = statistics.median(main) - statistics.median(interpreter)
+    top_level = [item for item in imports if item['depth'] == 0]
+    top_level.sort(key=lambda item: item['cumulative_us'], reverse=True)
+    
+    return {
+        'python': sys.version.split()[0],
+        'rows': rows,
+        'interpreter_ms': {'best': min(interpreter), 'median': statistics.median(interpreter)},
+        'main_ms': {'best': min(main), 'median': statistics.median(main)},
+        'overhead_ms': overhead,
+        'budget_ms': STARTUP_BUDGET_MS,
+        'within_budget': overhead <= STARTUP_BUDGET_MS,
+        'imported_modules': len(imports),
+        'slowest_imports': top_level[:top],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарк запуска main.py на небольшом файле')
+    parser.add_argument('--repeat', type=int, default=10, help='Количество запусков (по умолчанию 10)')
+    parser.add_argument('--rows', type=int, default=SMALL_FILE_ROWS,
+                        help=f'Количество строк файла (по умолчанию {SMALL_FILE_ROWS})')
+    parser.add_argument('--output', help='Путь к JSON файлу для сохранения результатов')
+    args = parser.parse_args(argv)
+    
+    results = run(max(args.repeat, 1), args.rows)
+    
+    print(f"Пустой интерпретатор: {results['interpreter_ms']['median']:.1f} мс, "
+          f"main.py: {results['main_ms']['median']:.1f} мс (медиана)")
+    print(f"Время запуска сверх интерпретатора: {results['overhead_ms']:.1f} мс "
+          f"(бюджет {results['budget_ms']} мс), импортировано модулей: {results['imported_modules']}")
+    
+    for item in results['slowest_imports']:
+        print(f"  {item['module']:<40}{item['cumulative_us'] / 1000:>8.1f} мс")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+    
+    if not results['within_budget']:
+        print("Бюджет времени запуска превышен")
+        return 1
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
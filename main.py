@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
 import argparse
 import sys
-from typing import List, Dict, Any
+from functools import partial
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Optional, Sequence, TYPE_CHECKING
 import os
 
-from src.utils.csv_reader import CSVReader
+from src.utils.compression import codec_error, is_compressed, open_output, strip_compression_suffix
+from src.utils.csv_reader import CSVDialect, CSVReader, DEFAULT_DIALECT, DIALECTS, SIMPLE_DIALECT
+from src.utils.diagnostics import Diagnostics, DEFAULT_MAX_EXAMPLES
+from src.utils.defaults import CACHE_DIR_VARIABLE, DEFAULT_MAX_KEYS, DEFAULT_RUN_SIZE
+from src.utils.employee_table import EmployeeTable, TABLE_COLUMNS
+from src.utils.profiling import Profiler
+from src.utils.schema import DEFAULT_SCHEMA
 from src.reports.report_generator import ReportFactory
-from src.reports.formatters import FormatterFactory
+from src.reports.formatters import FormatterFactory, ReportFormatter
+
+if TYPE_CHECKING:
+    from src.utils.parse_cache import ParseCache
+
+# Модули режимов --jobs, --incremental, --mmap, --pipeline, --merge-key,
+# --sort-by и кэша импортируются только при выборе режима: они загружают
+# multiprocessing, tempfile, hashlib, pickle и другие зависимости, которые
+# не нужны при обычном запуске на небольших файлах
 
 
 def validate_files(file_paths: List[str]) -> List[str]:
     """
-    Проверяет существование файлов и их расширение.
+    Проверяет существование файлов и их расширение (.csv или сжатый CSV:
+    .csv.gz, .csv.bz2, .csv.xz, .csv.zst).
     
     Args:
         file_paths: Список путей к файлам
@@ -25,11 +42,17 @@ def validate_files(file_paths: List[str]) -> List[str]:
         if not os.path.exists(file_path):
             print(f"Предупреждение: Файл {file_path} не существует и будет пропущен")
             continue
-            
-        if not file_path.lower().endswith('.csv'):
+        
+        if not strip_compression_suffix(file_path).lower().endswith('.csv'):
             print(f"Предупреждение: Файл {file_path} не имеет расширения CSV и будет пропущен")
             continue
-            
+        
+        error = codec_error(file_path)
+        
+        if error:
+            print(f"Предупреждение: Файл {file_path} будет пропущен: {error}")
+            continue
+        
         valid_paths.append(file_path)
     
     return valid_paths
@@ -45,7 +68,7 @@ def validate_report_type(report_type: str) -> bool:
     Returns:
         True если тип отчета поддерживается, иначе False
     """
-    return report_type in ['payout']
+    return ReportFactory.get_generator_class(report_type) is not None
 
 
 def validate_format_type(format_type: str) -> bool:
@@ -58,12 +81,12 @@ def validate_format_type(format_type: str) -> bool:
     Returns:
         True если тип формата поддерживается, иначе False
     """
-    return format_type in ['json', 'text']
+    return FormatterFactory.get_formatter_class(format_type) is not None
 
 
 def save_to_file(content: str, output_file: str) -> bool:
     """
-    Сохраняет содержимое в файл.
+    Сохраняет содержимое в файл; файл с расширением сжатия сжимается.
     
     Args:
         content: Содержимое для сохранения
@@ -73,7 +96,7 @@ def save_to_file(content: str, output_file: str) -> bool:
         True если сохранение успешно, иначе False
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as file:
+        with open_output(output_file) as file:
             file.write(content)
         return True
     except Exception as e:
@@ -81,13 +104,207 @@ def save_to_file(content: str, output_file: str) -> bool:
         return False
 
 
-def main():
+def write_report(formatter: ReportFormatter, report_data: Dict[str, Any], output_file: str,
+                 pipeline: bool = False) -> bool:
+    """
+    Записывает отчет в файл по мере форматирования, не собирая его в одну строку.
+    
+    Файл с расширением сжатия (например, report.json.gz) сжимается
+    в фоновом потоке по мере записи.
+    
+    Args:
+        formatter: Форматер отчета
+        report_data: Данные отчета, возможно с ленивыми значениями
+        output_file: Путь к файлу для сохранения
+        pipeline: Выполнять ли запись в фоновом потоке этапа конвейера
+        
+    Returns:
+        True если сохранение успешно, иначе False
+    """
+    if pipeline:
+        from src.utils.pipeline import open_pipeline_output as open_file
+    else:
+        open_file = open_output
+    
+    try:
+        with open_file(output_file, binary=formatter.binary) as file:
+            formatter.write(report_data, file)
+        return True
+    except OSError as e:
+        print(f"Ошибка при сохранении в файл {output_file}: {str(e)}")
+        return False
+
+
+def report_diagnostics(diagnostics: Diagnostics, json_file: Optional[str] = None) -> None:
+    """
+    Выводит сводку предупреждений о входных данных и при необходимости сохраняет ее в JSON.
+    
+    Args:
+        diagnostics: Сборщик предупреждений
+        json_file: Путь к JSON файлу для сводки
+    """
+    diagnostics.report()
+    
+    if json_file:
+        try:
+            diagnostics.write_json(json_file)
+        except OSError as e:
+            print(f"Ошибка при сохранении сводки предупреждений в файл {json_file}: {str(e)}")
+
+
+def report_stats(profiler: Profiler, show: bool = False, json_file: Optional[str] = None) -> None:
+    """
+    Завершает измерения и выводит статистику по этапам и при необходимости сохраняет ее в JSON.
+    
+    Args:
+        profiler: Профилировщик запуска
+        show: Выводить ли статистику в stderr
+        json_file: Путь к JSON файлу для статистики
+    """
+    profiler.stop()
+    
+    if show:
+        profiler.report()
+    
+    if json_file:
+        try:
+            profiler.write_json(json_file)
+        except OSError as e:
+            print(f"Ошибка при сохранении статистики в файл {json_file}: {str(e)}")
+
+
+def iter_employees_data(file_paths: List[str], use_mmap: bool = False,
+                        columns: Optional[Sequence[str]] = None,
+                        diagnostics: Optional[Diagnostics] = None,
+                        dialect: CSVDialect = DEFAULT_DIALECT) -> Iterator[Dict[str, Any]]:
+    """
+    Лениво читает данные сотрудников из всех указанных файлов по очереди.
+    
+    Значения преобразуются по схеме типов колонок один раз при чтении.
+    
+    Args:
+        file_paths: Список путей к CSV файлам
+        use_mmap: Читать ли файлы через отображение в память (сжатые
+            файлы читаются потоковой распаковкой)
+        columns: Колонки, нужные генератору отчета. Читатель извлекает
+            только их; если не указаны, извлекаются все колонки
+        diagnostics: Сборщик предупреждений о проблемах во входных данных
+        dialect: Диалект CSV (с use_mmap используется только диалект по умолчанию)
+        
+    Yields:
+        Словари с данными сотрудников
+    """
+    if use_mmap:
+        from src.utils.mmap_reader import MmapCSVReader
+    
+    for file_path in file_paths:
+        try:
+            if use_mmap and not is_compressed(file_path):
+                yield from MmapCSVReader(file_path, columns, schema=DEFAULT_SCHEMA, diagnostics=diagnostics).iter_rows()
+            else:
+                yield from CSVReader.iter_rows(file_path, columns, schema=DEFAULT_SCHEMA, diagnostics=diagnostics,
+                                               dialect=dialect)
+        except Exception as e:
+            print(f"Ошибка при чтении файла {file_path}: {str(e)}")
+
+
+def read_file_table(file_path: str, use_mmap: bool = False, diagnostics: Optional[Diagnostics] = None,
+                    dialect: CSVDialect = DEFAULT_DIALECT) -> EmployeeTable:
+    """
+    Читает один CSV файл в колоночную таблицу.
+    
+    Args:
+        file_path: Путь к CSV файлу
+        use_mmap: Читать ли файл через отображение в память (сжатый файл
+            читается потоковой распаковкой)
+        diagnostics: Сборщик предупреждений о проблемах во входных данных
+        dialect: Диалект CSV (с use_mmap используется только диалект по умолчанию)
+        
+    Returns:
+        Таблица с данными сотрудников
+    """
+    if use_mmap and not is_compressed(file_path):
+        from src.utils.mmap_reader import MmapCSVReader
+        
+        return MmapCSVReader(file_path, diagnostics=diagnostics).read_table()
+    
+    return CSVReader.read_table(file_path, diagnostics=diagnostics, dialect=dialect)
+
+
+def read_employees_table(file_paths: List[str], use_mmap: bool = False, cache: Optional['ParseCache'] = None,
+                         diagnostics: Optional[Diagnostics] = None,
+                         dialect: CSVDialect = DEFAULT_DIALECT) -> EmployeeTable:
+    """
+    Читает данные сотрудников из всех указанных файлов в одну колоночную таблицу.
+    
+    Args:
+        file_paths: Список путей к CSV файлам
+        use_mmap: Читать ли файлы через отображение в память
+        cache: Кэш разобранных файлов. Неизмененные файлы загружаются
+            из него без повторного разбора
+        diagnostics: Сборщик предупреждений о проблемах во входных данных
+        dialect: Диалект CSV
+        
+    Returns:
+        Таблица с данными сотрудников
+    """
+    table = EmployeeTable()
+    parse = partial(read_file_table, use_mmap=use_mmap, dialect=dialect)
+    # Записи кэша для диалекта по умолчанию сохраняют прежние ключи
+    variant = '' if dialect == DEFAULT_DIALECT else f"{dialect.name}|{dialect.delimiter}"
+    
+    for file_path in file_paths:
+        try:
+            if cache is not None:
+                table.extend(cache.get_or_parse(file_path, parse, diagnostics, variant))
+            else:
+                table.extend(parse(file_path, diagnostics=diagnostics))
+        except Exception as e:
+            print(f"Ошибка при чтении файла {file_path}: {str(e)}")
+    
+    return table
+
 
+def main():
+    
     parser = argparse.ArgumentParser(description='Генератор отчетов по данным сотрудников')
     parser.add_argument('files', nargs='+', help='CSV файлы с данными сотрудников')
-    parser.add_argument('--report', required=True, help='Тип отчета (например, payout)')
-    parser.add_argument('--format', default='json', help='Формат вывода (json или text)')
+    parser.add_argument('--report', required=True, help='Тип отчета (например, payout или department)')
+    parser.add_argument('--format', default='json', help='Формат вывода (json, text, columnar или arrow)')
     parser.add_argument('--output', help='Путь к файлу для сохранения результата. Если не указан, результат выводится в консоль')
+    parser.add_argument('--no-items', action='store_true', help='Не строить элементы по отдельным сотрудникам, вычислять только итоги')
+    parser.add_argument('--top', type=int, help='Оставить в отчете только N сотрудников с наибольшими выплатами')
+    parser.add_argument('--by', choices=['department'], help='Отбирать --top сотрудников отдельно в каждом отделе')
+    parser.add_argument('--sort-by', help='Поле элементов отчета, по которому они сортируются (например, name или amount)')
+    parser.add_argument('--sort-desc', action='store_true', help='Сортировать элементы по убыванию')
+    parser.add_argument('--sort-buffer', type=int, default=DEFAULT_RUN_SIZE,
+                        help=f'Количество элементов, сортируемых в памяти, прежде чем они сбрасываются во временный файл (по умолчанию {DEFAULT_RUN_SIZE})')
+    parser.add_argument('--merge-key', help='Колонка, по которой строки одного сотрудника из разных файлов объединяются в одну (например, name или email)')
+    parser.add_argument('--merge-memory', type=int, default=DEFAULT_MAX_KEYS,
+                        help=f'Количество сотрудников, объединяемых в памяти до сброса на диск (по умолчанию {DEFAULT_MAX_KEYS})')
+    parser.add_argument('--max-warnings', type=int, default=DEFAULT_MAX_EXAMPLES,
+                        help=f'Количество примеров в сводке предупреждений для каждого файла и вида проблемы (по умолчанию {DEFAULT_MAX_EXAMPLES})')
+    parser.add_argument('--diagnostics-json', help='Путь к JSON файлу для сводки предупреждений о входных данных')
+    parser.add_argument('--columnar', action='store_true', help='Читать данные в компактную колоночную таблицу вместо словарей строк')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Выполнять чтение, вычисление выплат, форматирование и запись одновременно в потоках, связанных ограниченными очередями')
+    parser.add_argument('--mmap', action='store_true', help='Читать файлы через отображение в память, декодируя только нужные отчету колонки')
+    parser.add_argument('--csv-dialect', choices=DIALECTS, default=SIMPLE_DIALECT,
+                        help=f'Диалект CSV: {SIMPLE_DIALECT} - деление строк по разделителю, '
+                             f'rfc4180 - поля в кавычках с разделителями и переводами строк внутри (по умолчанию {SIMPLE_DIALECT})')
+    parser.add_argument('--delimiter', default=',', help='Разделитель значений, \\t - табуляция (по умолчанию запятая)')
+    parser.add_argument('--cache-dir', help=f'Включить кэш разобранных файлов в указанном каталоге; без этого параметра кэш '
+                                            f'включен, только если задана переменная окружения {CACHE_DIR_VARIABLE}')
+    parser.add_argument('--cache-size', type=int, default=1024, help='Предельный размер кэша в МБ (по умолчанию 1024)')
+    parser.add_argument('--no-cache', action='store_true', help='Не использовать кэш разобранных файлов')
+    parser.add_argument('--incremental', action='store_true', help='Разбирать только строки, дописанные в файлы с прошлого запуска')
+    parser.add_argument('--state-dir', help='Каталог контрольных точек инкрементального режима (по умолчанию checkpoints в каталоге кэша)')
+    parser.add_argument('--jobs', type=int, default=1, help='Количество процессов для параллельной обработки файлов (по умолчанию 1)')
+    parser.add_argument('--chunk-size', type=int, default=64, help='Размер фрагмента файла в МБ при параллельной обработке (по умолчанию 64)')
+    parser.add_argument('--stats', action='store_true', help='Вывести в stderr время, процессорное время, строк в секунду и пиковую память по этапам')
+    parser.add_argument('--stats-json', help='Путь к JSON файлу для статистики выполнения по этапам')
+    parser.add_argument('--profile', help='Путь к файлу для дампа cProfile всего запуска (формат pstats)')
+    parser.add_argument('--trace-memory', help='Путь к файлу для снимка tracemalloc на момент окончания запуска')
     
     try:
         args = parser.parse_args()
@@ -104,11 +321,11 @@ def main():
         sys.exit(1)
     
     if not validate_report_type(args.report):
-        print(f"Ошибка: Неподдерживаемый тип отчета '{args.report}'. Поддерживаемые типы: payout")
+        print(f"Ошибка: Неподдерживаемый тип отчета '{args.report}'. Поддерживаемые типы: {', '.join(ReportFactory.get_report_types())}")
         sys.exit(1)
     
     if not validate_format_type(args.format):
-        print(f"Ошибка: Неподдерживаемый формат вывода '{args.format}'. Поддерживаемые форматы: json, text")
+        print(f"Ошибка: Неподдерживаемый формат вывода '{args.format}'. Поддерживаемые форматы: {', '.join(FormatterFactory.get_format_types())}")
         sys.exit(1)
     
     # Проверка выходного файла
@@ -119,53 +336,307 @@ def main():
             print("Отмена операции")
             sys.exit(0)
     
-    all_employees_data = []
+    if args.jobs < 1:
+        print("Ошибка: Количество процессов --jobs должно быть положительным")
+        sys.exit(1)
     
-    # Чтение данных из всех указанных файлов
-    for file_path in valid_files:
-        try:
-            employees_data = CSVReader.read_file(file_path)
-            all_employees_data.extend(employees_data)
-        except Exception as e:
-            print(f"Ошибка при чтении файла {file_path}: {str(e)}")
+    if args.chunk_size < 1:
+        print("Ошибка: Размер фрагмента --chunk-size должен быть положительным")
+        sys.exit(1)
+    
+    if args.top is not None and args.top < 1:
+        print("Ошибка: Количество записей --top должно быть положительным")
+        sys.exit(1)
+    
+    if args.by and args.top is None:
+        print("Ошибка: Параметр --by используется только вместе с --top")
+        sys.exit(1)
+    
+    if args.max_warnings < 0:
+        print("Ошибка: Количество примеров --max-warnings не может быть отрицательным")
+        sys.exit(1)
+    
+    if args.sort_buffer < 1:
+        print("Ошибка: Размер буфера сортировки --sort-buffer должен быть положительным")
+        sys.exit(1)
+    
+    if args.merge_key and (args.columnar or args.cache_dir is not None or args.incremental or args.jobs > 1):
+        # Объединение строк работает с потоком словарей, а не с колоночными
+        # таблицами, поэтому кэш таблиц к нему не применяется
+        print("Ошибка: Параметр --merge-key несовместим с --columnar, --cache-dir, --incremental и --jobs")
+        sys.exit(1)
+    
+    if args.pipeline and (args.columnar or args.incremental or args.jobs > 1):
+        print("Ошибка: Параметр --pipeline несовместим с --columnar, --incremental и --jobs")
+        sys.exit(1)
+    
+    dialect = CSVDialect(args.csv_dialect, '\t' if args.delimiter == '\\t' else args.delimiter)
+    
+    if len(dialect.delimiter) != 1 or dialect.delimiter in '"\r\n':
+        print("Ошибка: Разделитель --delimiter должен быть одним символом, кроме кавычки и перевода строки")
+        sys.exit(1)
+    
+    if dialect != DEFAULT_DIALECT and (args.mmap or args.incremental or args.jobs > 1):
+        # Эти режимы делят файлы по байтовым диапазонам строк и разбирают
+        # сырые байты, что возможно только для диалекта по умолчанию
+        print("Ошибка: Параметры --csv-dialect и --delimiter несовместимы с --mmap, --incremental и --jobs")
+        sys.exit(1)
+    
+    if args.merge_memory < 1:
+        print("Ошибка: Размер индекса --merge-memory должен быть положительным")
+        sys.exit(1)
+    
+    # Получение генератора отчетов: передаются только заданные параметры,
+    # чтобы генераторы без них создавались так же, как без аргументов
+    generator_options: Dict[str, Any] = {}
+    
+    if args.no_items:
+        generator_options['include_items'] = False
+    
+    if args.top is not None:
+        generator_options['top'] = args.top
+    
+    if args.by:
+        generator_options['top_by'] = args.by
     
-    if not all_employees_data:
-        print("Ошибка: Не удалось прочитать данные из указанных файлов")
+    unsupported = ReportFactory.get_unsupported_options(args.report, generator_options)
+    
+    if unsupported:
+        flags = {'include_items': '--no-items', 'top': '--top', 'top_by': '--by'}
+        print(f"Ошибка: Отчет типа '{args.report}' не поддерживает параметры "
+              f"{', '.join(flags[name] for name in unsupported)}")
         sys.exit(1)
     
-    # Получение генератора отчетов
-    report_generator = ReportFactory.get_generator(args.report)
+    report_generator = ReportFactory.get_generator(args.report, **generator_options)
     
     if not report_generator:
         print(f"Ошибка: Не удалось создать генератор отчета типа '{args.report}'")
         sys.exit(1)
     
+    # Проблемы во входных данных не выводятся построчно, а собираются
+    # в одну сводку, которая выводится после отчета
+    diagnostics = Diagnostics(args.max_warnings)
+    report_generator.diagnostics = diagnostics
+    
     # Получение форматера отчетов
-    formatter = FormatterFactory.get_formatter(args.format)
+    try:
+        formatter = FormatterFactory.get_formatter(args.format)
+    except ImportError as e:
+        print(f"Ошибка: {str(e)}")
+        sys.exit(1)
     
     if not formatter:
         print(f"Ошибка: Не удалось создать форматер типа '{args.format}'")
         sys.exit(1)
     
+    if formatter.binary and not output_file and sys.stdout.isatty():
+        print(f"Ошибка: Формат '{args.format}' двоичный, укажите --output или перенаправьте вывод в файл")
+        sys.exit(1)
+    
+    # Измерения по этапам; выключенный профилировщик возвращает источники
+    # данных без оберток
+    profiler = Profiler(args.stats or bool(args.stats_json), args.profile, args.trace_memory)
+    profiler.start()
+    
+    # Дамп cProfile и снимок памяти сохраняются и при завершении через
+    # sys.exit на ошибке; после report_stats повторный stop ничего не делает
     try:
-        # Генерация отчета
-        report_data = report_generator.generate(all_employees_data)
-        
-        # Форматирование отчета
-        formatted_report = formatter.format(report_data)
-        
-        # Сохранение или вывод результата
-        if output_file:
-            if save_to_file(formatted_report, output_file):
-                print(f"Отчет успешно сохранен в файл: {output_file}")
-            else:
-                print(f"Не удалось сохранить отчет в файл: {output_file}")
+        if args.incremental:
+            # По каждому файлу разбирается только хвост, дописанный после
+            # сохраненной контрольной точки
+            from src.reports.incremental import CheckpointStore, DEFAULT_STATE_DIR, generate_incremental
+            
+            store = CheckpointStore(args.state_dir or DEFAULT_STATE_DIR)
+            partial_reports = []
+            rows_read = 0
+            
+            try:
+                with profiler.stage('generate'):
+                    for file_path in valid_files:
+                        file_report, file_rows = generate_incremental(args.report, file_path, store, generator_options,
+                                                                      diagnostics)
+                        partial_reports.append(file_report)
+                        rows_read += file_rows
+                    
+                    report_data = report_generator.merge(partial_reports)
+            except Exception as e:
+                print(f"Ошибка при генерации или форматировании отчета: {str(e)}")
+                sys.exit(1)
+            
+            profiler.rows = rows_read
+            
+            if not rows_read:
+                report_diagnostics(diagnostics, args.diagnostics_json)
+                print("Ошибка: Не удалось прочитать данные из указанных файлов")
+                sys.exit(1)
+        elif args.jobs > 1:
+            # Файлы делятся на фрагменты, которые разбираются в рабочих процессах;
+            # в основной процесс передаются только частичные отчеты
+            from src.reports.parallel import generate_parallel
+            
+            try:
+                with profiler.stage('generate'):
+                    report_data, rows_read = generate_parallel(args.report, valid_files, args.jobs, columnar=args.columnar,
+                                                               chunk_size=args.chunk_size * 1024 * 1024, use_mmap=args.mmap,
+                                                               options=generator_options, diagnostics=diagnostics)
+            except Exception as e:
+                print(f"Ошибка при генерации или форматировании отчета: {str(e)}")
+                sys.exit(1)
+            
+            profiler.rows = rows_read
+            
+            if not rows_read:
+                report_diagnostics(diagnostics, args.diagnostics_json)
+                print("Ошибка: Не удалось прочитать данные из указанных файлов")
                 sys.exit(1)
         else:
-            print(formatted_report)
-    except Exception as e:
-        print(f"Ошибка при генерации или форматировании отчета: {str(e)}")
-        sys.exit(1)
+            # Кэш хранит колоночные таблицы, поэтому применяется к отчетам,
+            # которым достаточно колонок таблицы. Таблица держит в памяти все
+            # строки и пишется в каталог на диске, поэтому кэш включается только
+            # явно: параметром --cache-dir или переменной окружения. Конвейер
+            # читает строки пакетами одновременно с вычислением, поэтому кэш
+            # в нем не используется
+            required_columns = ReportFactory.get_required_columns(args.report)
+            cache_dir = args.cache_dir or os.environ.get(CACHE_DIR_VARIABLE)
+            use_cache = (not args.no_cache and not args.pipeline and cache_dir is not None
+                         and required_columns is not None and set(required_columns) <= set(TABLE_COLUMNS))
+            
+            if args.pipeline:
+                from src.utils.pipeline import PipelineStage
+            
+            if args.merge_key:
+                # Строки одного сотрудника сводятся через хэш-индекс, который
+                # при нехватке памяти распределяется по дисковым разделам
+                from src.utils.employee_merge import EmployeeMerger
+                
+                columns = None if required_columns is None else tuple(required_columns) + (args.merge_key,)
+                employees_iter = iter_employees_data(valid_files, use_mmap=args.mmap, columns=columns,
+                                                     diagnostics=diagnostics, dialect=dialect)
+                merger = EmployeeMerger(args.merge_key, max_keys=args.merge_memory, diagnostics=diagnostics)
+                
+                if args.pipeline:
+                    read_stage = PipelineStage('read', employees_iter)
+                    employees_iter = merger.merge(read_stage)
+                else:
+                    employees_iter = profiler.iterate('read', employees_iter, count_rows=True)
+                    employees_iter = profiler.iterate('merge', merger.merge(employees_iter))
+                
+                first_employee = next(employees_iter, None)
+                has_data = first_employee is not None
+                all_employees_data = chain([first_employee], employees_iter)
+            elif args.columnar or use_cache:
+                cache = None
+                
+                if use_cache:
+                    from src.utils.parse_cache import ParseCache
+                    
+                    cache = ParseCache(cache_dir, args.cache_size * 1024 * 1024)
+                
+                with profiler.stage('read'):
+                    all_employees_data = read_employees_table(valid_files, use_mmap=args.mmap, cache=cache,
+                                                              diagnostics=diagnostics, dialect=dialect)
+                
+                profiler.rows = len(all_employees_data)
+                has_data = len(all_employees_data) > 0
+            else:
+                # Данные читаются лениво: строки поступают в генератор отчета по мере чтения
+                employees_iter = iter_employees_data(valid_files, use_mmap=args.mmap,
+                                                     columns=ReportFactory.get_required_columns(args.report),
+                                                     diagnostics=diagnostics, dialect=dialect)
+                
+                if args.pipeline:
+                    # Строки разбираются в отдельном потоке и передаются
+                    # генератору пакетами
+                    read_stage = PipelineStage('read', employees_iter)
+                    employees_iter = iter(read_stage)
+                else:
+                    employees_iter = profiler.iterate('read', employees_iter, count_rows=True)
+                
+                first_employee = next(employees_iter, None)
+                has_data = first_employee is not None
+                all_employees_data = chain([first_employee], employees_iter)
+            
+            if not has_data:
+                report_diagnostics(diagnostics, args.diagnostics_json)
+                print("Ошибка: Не удалось прочитать данные из указанных файлов")
+                sys.exit(1)
+            
+            report_data = None
+        
+        try:
+            # Генерация отчета: элементы вычисляются по мере записи
+            if report_data is None:
+                # В конвейере элементы вычисляются в другом потоке, а
+                # профилировщик учитывает этапы только основного потока, поэтому
+                # создание ленивого отчета учитывается в общем этапе конвейера
+                with profiler.stage('pipeline' if args.pipeline else 'generate'):
+                    report_data = report_generator.generate_stream(all_employees_data)
+                
+                if not args.pipeline:
+                    report_data = profiler.wrap_report('generate', report_data)
+            
+            # Внешняя сортировка: отсортированные отрезки сбрасываются во временные
+            # файлы и сливаются по мере записи отчета
+            if args.sort_by:
+                from src.utils.external_sort import sort_items
+                
+                report_data = dict(report_data)
+                report_data['items'] = sort_items(report_data['items'], args.sort_by, reverse=args.sort_desc,
+                                                  run_size=args.sort_buffer)
+                
+                if not args.pipeline:
+                    report_data['items'] = profiler.iterate('sort', report_data['items'])
+            
+            if args.pipeline:
+                # Элементы отчета вычисляются в отдельном потоке, а запись
+                # выполняется фоновым потоком вывода. Этапы работают
+                # одновременно, поэтому их время учитывается в одном этапе
+                from src.utils.pipeline import background_output, pipeline_report
+                
+                report_data = pipeline_report(report_data)
+            
+            # Форматирование и сохранение или вывод результата
+            with profiler.stage('pipeline' if args.pipeline else 'write'):
+                if output_file:
+                    saved = write_report(formatter, report_data, output_file, pipeline=args.pipeline)
+                elif args.pipeline:
+                    sys.stdout.flush()
+                    
+                    with background_output(sys.stdout.buffer, formatter.binary, sys.stdout.encoding,
+                                           close_raw=False) as stream:
+                        formatter.write(report_data, stream)
+                        
+                        if not formatter.binary:
+                            stream.write("\n")
+                    
+                    saved = True
+                elif formatter.binary:
+                    sys.stdout.flush()
+                    formatter.write(report_data, sys.stdout.buffer)
+                    saved = True
+                else:
+                    formatter.write(report_data, sys.stdout)
+                    sys.stdout.write("\n")
+                    saved = True
+            
+            if output_file:
+                if saved:
+                    print(f"Отчет успешно сохранен в файл: {output_file}")
+                else:
+                    print(f"Не удалось сохранить отчет в файл: {output_file}")
+                    sys.exit(1)
+        except Exception as e:
+            print(f"Ошибка при генерации или форматировании отчета: {str(e)}")
+            sys.exit(1)
+        
+        if args.pipeline:
+            profiler.rows = read_stage.count
+        
+        sys.stdout.flush()
+        report_diagnostics(diagnostics, args.diagnostics_json)
+        report_stats(profiler, args.stats, args.stats_json)
+    finally:
+        profiler.stop()
 
 
 if __name__ == '__main__':
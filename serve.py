@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from src.server import ReportServer, DEFAULT_HOST, DEFAULT_PORT
+from src.utils.diagnostics import DEFAULT_MAX_EXAMPLES
+
+
+async def run(server: ReportServer, host: str, port: int, unix_socket: Optional[str] = None) -> None:
+    """
+    Запускает сервер отчетов и обслуживает запросы до остановки.
+    
+    Args:
+        server: Сервер отчетов
+        host: Адрес для подключений
+        port: Порт
+        unix_socket: Путь к Unix сокету. Если указан, сервер слушает его
+            вместо TCP порта
+    """
+    if unix_socket:
+        listener = await server.start_unix(unix_socket)
+        print(f"Сервер отчетов слушает {unix_socket}", file=sys.stderr)
+    else:
+        listener = await server.start(host, port)
+        print(f"Сервер отчетов слушает http://{host}:{port}", file=sys.stderr)
+    
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Сервер отчетов по данным сотрудников')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Адрес для подключений (по умолчанию {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Порт (по умолчанию {DEFAULT_PORT})')
+    parser.add_argument('--unix-socket', help='Путь к Unix сокету вместо TCP порта')
+    parser.add_argument('--root', default='.', help='Каталог, файлы из которого доступны для отчетов (по умолчанию текущий)')
+    parser.add_argument('--cache-size', type=int, default=512, help='Предельный размер кэша разобранных файлов в памяти в МБ (по умолчанию 512)')
+    parser.add_argument('--max-warnings', type=int, default=DEFAULT_MAX_EXAMPLES,
+                        help=f'Количество примеров в сводке предупреждений для каждого файла и вида проблемы (по умолчанию {DEFAULT_MAX_EXAMPLES})')
+    args = parser.parse_args()
+    
+    if args.cache_size < 0:
+        print("Ошибка: Размер кэша --cache-size не может быть отрицательным")
+        sys.exit(1)
+    
+    server = ReportServer(args.root, args.cache_size * 1024 * 1024, args.max_warnings)
+    
+    try:
+        asyncio.run(run(server, args.host, args.port, args.unix_socket))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
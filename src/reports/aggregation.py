@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+from typing import Dict, Any, Hashable, Iterator, List, Sequence, Tuple
+
+
+class HashAggregator:
+    """
+    Хэш-агрегация выплат по ключу группы за один потоковый проход.
+    
+    Для каждой группы хранится только фиксированный набор счетчиков
+    (количество, суммы часов, ставок и выплат, минимум и максимум часов),
+    поэтому память пропорциональна числу групп, а не числу строк.
+    """
+    
+    # Порядок счетчиков в состоянии группы
+    COUNT, HOURS, RATE_SUM, AMOUNT, MIN_HOURS, MAX_HOURS = range(6)
+    
+    def __init__(self) -> None:
+        self._groups: Dict[Hashable, List[Any]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._groups)
+    
+    def add_columns(self, keys: Sequence[Hashable], hours: Sequence[float],
+                    rates: Sequence[float], amounts: Sequence[float]) -> None:
+        """
+        Добавляет в агрегаты пакет строк в колоночном виде.
+        
+        Args:
+            keys: Ключи групп
+            hours: Отработанные часы
+            rates: Ставки
+            amounts: Суммы выплат
+        """
+        groups = self._groups
+        
+        for key, hours_worked, rate, amount in zip(keys, hours, rates, amounts):
+            state = groups.get(key)
+            
+            if state is None:
+                groups[key] = [1, hours_worked, rate, amount, hours_worked, hours_worked]
+                continue
+            
+            state[0] += 1
+            state[1] += hours_worked
+            state[2] += rate
+            state[3] += amount
+            if hours_worked < state[4]:
+                state[4] = hours_worked
+            if hours_worked > state[5]:
+                state[5] = hours_worked
+    
+    def add_state(self, key: Hashable, count: int, hours: float, rate_sum: float,
+                  amount: float, min_hours: float, max_hours: float) -> None:
+        """
+        Объединяет с агрегатом группы уже вычисленные счетчики.
+        
+        Используется при объединении частичных результатов.
+        
+        Args:
+            key: Ключ группы
+            count: Количество строк
+            hours: Сумма часов
+            rate_sum: Сумма ставок
+            amount: Сумма выплат
+            min_hours: Минимум часов
+            max_hours: Максимум часов
+        """
+        state = self._groups.get(key)
+        
+        if state is None:
+            self._groups[key] = [count, hours, rate_sum, amount, min_hours, max_hours]
+            return
+        
+        state[0] += count
+        state[1] += hours
+        state[2] += rate_sum
+        state[3] += amount
+        state[4] = min(state[4], min_hours)
+        state[5] = max(state[5], max_hours)
+    
+    def items(self) -> Iterator[Tuple[Hashable, List[Any]]]:
+        """
+        Обходит группы в порядке первого появления.
+        
+        Yields:
+            Кортежи (ключ группы, счетчики)
+        """
+        yield from self._groups.items()
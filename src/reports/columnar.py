@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+import io
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.reports.formatters import ReportFormatter
+
+
+# Сигнатура в начале и в конце файла формата columnar
+MAGIC = b'RPTCOL1\n'
+
+# Заголовок блока: тип блока и длина содержимого в байтах
+BLOCK_HEADER = struct.Struct('<4s4xQ')
+
+# Хвост файла: смещение блока FOOT и сигнатура
+TRAILER = struct.Struct('<Q8s')
+
+# Количество строк в начале содержимого блока BTCH
+ROW_COUNT = struct.Struct('<Q')
+
+SCHEMA_BLOCK = b'SCHM'
+BATCH_BLOCK = b'BTCH'
+FOOTER_BLOCK = b'FOOT'
+
+# Буферы колонок выравниваются по 8 байт, чтобы их можно было читать
+# массивами прямо из отображенного в память файла
+ALIGNMENT = 8
+
+# Коды array для хранения колонок и memoryview.cast для их чтения
+COLUMN_TYPES = {
+    'float64': ('d', 'd'),
+    'int64': ('q', 'q'),
+    'bool': ('B', '?'),
+}
+
+UTF8 = 'utf8'
+
+# Количество элементов отчета в одном пакете
+DEFAULT_BATCH_SIZE = 65536
+
+FORMAT_VERSION = 1
+
+
+class Column(NamedTuple):
+    """
+    Описание колонки: название и тип значений.
+    """
+    name: str
+    type: str
+
+
+def infer_columns(batch: List[Dict[str, Any]]) -> List[Column]:
+    """
+    Определяет колонки по первому пакету элементов отчета.
+    
+    Колонка, в которой встречаются целые и дробные числа, считается
+    дробной. Набор колонок берется из первого элемента.
+    
+    Args:
+        batch: Элементы отчета
+        
+    Returns:
+        Список колонок
+        
+    Raises:
+        TypeError: Если значения колонки не приводятся к одному типу
+    """
+    columns = []
+    
+    for name in batch[0]:
+        kinds = {type(item.get(name)) for item in batch}
+        
+        if kinds == {str}:
+            column_type = UTF8
+        elif kinds == {bool}:
+            column_type = 'bool'
+        elif kinds == {int}:
+            column_type = 'int64'
+        elif kinds <= {int, float}:
+            column_type = 'float64'
+        else:
+            raise TypeError(f"Колонка {name}: значения типов "
+                            f"{', '.join(sorted(kind.__name__ for kind in kinds))} не поддерживаются")
+        
+        columns.append(Column(name, column_type))
+    
+    return columns
+
+
+def iter_batches(items: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Делит элементы отчета на пакеты по мере их вычисления.
+    
+    Args:
+        items: Элементы отчета, возможно ленивые
+        batch_size: Количество элементов в пакете
+        
+    Yields:
+        Списки элементов
+    """
+    iterator = iter(items)
+    
+    while True:
+        batch = list(islice(iterator, batch_size))
+        
+        if not batch:
+            return
+        
+        yield batch
+
+
+def column_values(batch: List[Dict[str, Any]], column: Column) -> List[Any]:
+    """
+    Извлекает значения колонки из пакета элементов.
+    
+    Args:
+        batch: Элементы отчета
+        column: Колонка
+        
+    Returns:
+        Значения колонки
+        
+    Raises:
+        ValueError: Если в элементе нет значения колонки
+    """
+    try:
+        return [item[column.name] for item in batch]
+    except KeyError:
+        raise ValueError(f"Элемент отчета не содержит колонку {column.name}") from None
+
+
+def report_scalars(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Возвращает значения отчета, кроме элементов, вычисляя ленивые значения.
+    
+    Вызывается после записи элементов, когда ленивые итоги уже известны.
+    
+    Args:
+        data: Данные отчета
+        
+    Returns:
+        Словарь значений отчета без ключа 'items'
+    """
+    return {key: value() if callable(value) else value for key, value in data.items() if key != 'items'}
+
+
+class ColumnarFormatter(ReportFormatter):
+    """
+    Форматер двоичного колоночного представления отчета.
+    
+    Элементы отчета записываются пакетами типизированных колонок по мере
+    вычисления. Файл самоописываемый и не требует дополнительных библиотек:
+        
+        MAGIC
+        блок SCHM: JSON {"version", "byte_order", "columns": [{"name", "type"}]}
+        блоки BTCH: число строк (uint64), затем буферы колонок по порядку схемы
+        блок FOOT: JSON {"rows", "batches": [[смещение блока, строк]], "report"}
+        смещение блока FOOT (uint64), MAGIC
+    
+    Каждый блок начинается с заголовка BLOCK_HEADER (тип и длина содержимого)
+    и выровнен по ALIGNMENT байт. Числовые колонки (float64, int64, bool)
+    хранятся массивами little-endian, строковые (utf8) - смещениями int64
+    (строк + 1) и байтами UTF-8. Итоги отчета и прочие его значения хранятся
+    в JSON блока FOOT, поэтому ленивый итог вычисляется после элементов.
+    """
+    
+    binary = True
+    
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        Args:
+            batch_size: Количество элементов отчета в одном пакете
+        """
+        self.batch_size = batch_size
+    
+    def format(self, data: Dict[str, Any]) -> bytes:
+        """
+        Форматирует данные отчета в двоичное колоночное представление.
+        
+        Args:
+            data: Данные отчета
+            
+        Returns:
+            Содержимое файла формата columnar
+        """
+        buffer = io.BytesIO()
+        self.write(data, buffer)
+        return buffer.getvalue()
+    
+    def write(self, data: Dict[str, Any], stream: BinaryIO) -> None:
+        """
+        Записывает отчет в двоичный поток пакетами по мере вычисления элементов.
+        
+        Args:
+            data: Данные отчета, возможно с ленивыми значениями
+            stream: Двоичный поток для записи
+        """
+        stream.write(MAGIC)
+        offset = len(MAGIC)
+        columns: Optional[List[Column]] = None
+        batches = []
+        rows = 0
+        
+        for batch in iter_batches(data.get('items', ()), self.batch_size):
+            if columns is None:
+                columns = infer_columns(batch)
+                offset += self._write_schema(stream, columns)
+            
+            batches.append([offset, len(batch)])
+            offset += _write_block(stream, BATCH_BLOCK, self._encode_batch(batch, columns))
+            rows += len(batch)
+        
+        if columns is None:
+            offset += self._write_schema(stream, [])
+        
+        footer = {'rows': rows, 'batches': batches, 'report': report_scalars(data)}
+        _write_block(stream, FOOTER_BLOCK, [json.dumps(footer, ensure_ascii=False).encode('utf-8')])
+        stream.write(TRAILER.pack(offset, MAGIC))
+    
+    @staticmethod
+    def _write_schema(stream: BinaryIO, columns: List[Column]) -> int:
+        schema = {
+            'version': FORMAT_VERSION,
+            'byte_order': 'little',
+            'columns': [column._asdict() for column in columns],
+        }
+        
+        return _write_block(stream, SCHEMA_BLOCK, [json.dumps(schema, ensure_ascii=False).encode('utf-8')])
+    
+    @staticmethod
+    def _encode_batch(batch: List[Dict[str, Any]], columns: List[Column]) -> List[Any]:
+        """
+        Преобразует пакет элементов в буферы колонок.
+        
+        Args:
+            batch: Элементы отчета
+            columns: Колонки схемы
+            
+        Returns:
+            Список буферов содержимого блока BTCH
+            
+        Raises:
+            ValueError: Если значения не соответствуют типу колонки
+        """
+        buffers: List[Any] = [ROW_COUNT.pack(len(batch))]
+        
+        for column in columns:
+            values = column_values(batch, column)
+            
+            try:
+                if column.type == UTF8:
+                    encoded = [value.encode('utf-8') for value in values]
+                    buffers.append(_little_endian(array('q', accumulate(map(len, encoded), initial=0))))
+                    buffers.append(b''.join(encoded))
+                else:
+                    buffers.append(_little_endian(array(COLUMN_TYPES[column.type][0], values)))
+            except (AttributeError, TypeError, OverflowError):
+                raise ValueError(f"Значения колонки {column.name} не соответствуют типу {column.type}") from None
+            
+            buffers.append(_padding(len(buffers[-1])))
+        
+        return buffers
+
+
+class ColumnarReader:
+    """
+    Чтение файла формата columnar через отображение в память.
+    
+    Числовые колонки пакетов возвращаются как memoryview над отображением
+    без копирования данных; такие представления должны быть освобождены
+    до закрытия файла.
+    """
+    
+    def __init__(self, file_path: str) -> None:
+        """
+        Args:
+            file_path: Путь к файлу
+            
+        Raises:
+            ValueError: Если файл не является отчетом формата columnar
+        """
+        with open(file_path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            footer_offset, magic = TRAILER.unpack_from(self._mmap, len(self._mmap) - TRAILER.size)
+            
+            if self._mmap[:len(MAGIC)] != MAGIC or magic != MAGIC:
+                raise ValueError
+            
+            schema = json.loads(bytes(self._read_block(len(MAGIC), SCHEMA_BLOCK)))
+            footer = json.loads(bytes(self._read_block(footer_offset, FOOTER_BLOCK)))
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise ValueError(f"Файл {file_path} не является отчетом формата columnar") from None
+        
+        if schema['version'] > FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Версия формата файла {file_path} ({schema['version']}) не поддерживается")
+        
+        self.columns = [Column(column['name'], column['type']) for column in schema['columns']]
+        self.report: Dict[str, Any] = footer['report']
+        self.num_rows: int = footer['rows']
+        self._batches: List[Tuple[int, int]] = [tuple(batch) for batch in footer['batches']]
+    
+    def __enter__(self) -> 'ColumnarReader':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Закрывает отображение файла.
+        """
+        self._mmap.close()
+    
+    @property
+    def num_batches(self) -> int:
+        return len(self._batches)
+    
+    def _read_block(self, offset: int, kind: bytes) -> memoryview:
+        block_kind, length = BLOCK_HEADER.unpack_from(self._mmap, offset)
+        
+        if block_kind != kind:
+            raise ValueError(f"Ожидался блок {kind!r}, найден {block_kind!r}")
+        
+        start = offset + BLOCK_HEADER.size
+        return memoryview(self._mmap)[start:start + length]
+    
+    def read_batch(self, index: int) -> Dict[str, Any]:
+        """
+        Читает пакет строк.
+        
+        Args:
+            index: Номер пакета
+            
+        Returns:
+            Словарь: название колонки -> memoryview для числовых колонок
+            или список строк для строковых
+        """
+        offset, rows = self._batches[index]
+        payload = self._read_block(offset, BATCH_BLOCK)
+        position = ROW_COUNT.size
+        batch: Dict[str, Any] = {}
+        
+        for column in self.columns:
+            if column.type == UTF8:
+                offsets = _native(payload[position:position + (rows + 1) * 8], 'q').tolist()
+                position = _align(position + (rows + 1) * 8)
+                data = bytes(payload[position:position + offsets[-1]])
+                batch[column.name] = [data[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+                position = _align(position + offsets[-1])
+            else:
+                itemsize = 1 if column.type == 'bool' else 8
+                batch[column.name] = _native(payload[position:position + rows * itemsize], COLUMN_TYPES[column.type][1])
+                position = _align(position + rows * itemsize)
+        
+        return batch
+    
+    def iter_batches(self) -> Iterator[Dict[str, Any]]:
+        """
+        Обходит пакеты строк файла.
+        
+        Yields:
+            Пакеты в виде, возвращаемом read_batch
+        """
+        for index in range(len(self._batches)):
+            yield self.read_batch(index)
+    
+    def read_columns(self) -> Dict[str, List[Any]]:
+        """
+        Читает все колонки файла в списки значений.
+        
+        Returns:
+            Словарь: название колонки -> список значений
+        """
+        result: Dict[str, List[Any]] = {column.name: [] for column in self.columns}
+        
+        for batch in self.iter_batches():
+            for name, values in batch.items():
+                if isinstance(values, memoryview):
+                    result[name].extend(values.tolist())
+                    values.release()
+                else:
+                    result[name].extend(values)
+        
+        return result
+
+
+class ArrowFormatter(ReportFormatter):
+    """
+    Форматер файла Arrow IPC (требует пакет pyarrow).
+    
+    Элементы отчета записываются пакетами (record batches) по мере
+    вычисления с теми же типами колонок, что и в ColumnarFormatter. Итоги
+    отчета и прочие его значения известны только после элементов, поэтому
+    они записываются в метаданные последнего пакета под ключом 'report'
+    (RecordBatchFileReader.get_batch_with_custom_metadata).
+    """
+    
+    binary = True
+    
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        Args:
+            batch_size: Количество элементов отчета в одном пакете
+            
+        Raises:
+            ImportError: Если пакет pyarrow не установлен
+        """
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            raise ImportError("Для формата arrow требуется пакет pyarrow") from None
+        
+        self.batch_size = batch_size
+        self._pa = pyarrow
+        self._types = {
+            'float64': pyarrow.float64(),
+            'int64': pyarrow.int64(),
+            'bool': pyarrow.bool_(),
+            UTF8: pyarrow.string(),
+        }
+    
+    def format(self, data: Dict[str, Any]) -> bytes:
+        """
+        Форматирует данные отчета в файл Arrow IPC.
+        
+        Args:
+            data: Данные отчета
+            
+        Returns:
+            Содержимое файла Arrow IPC
+        """
+        buffer = io.BytesIO()
+        self.write(data, buffer)
+        return buffer.getvalue()
+    
+    def write(self, data: Dict[str, Any], stream: BinaryIO) -> None:
+        """
+        Записывает отчет в двоичный поток пакетами по мере вычисления элементов.
+        
+        Последний пакет удерживается до конца элементов, чтобы записать его
+        вместе с итогами отчета.
+        
+        Args:
+            data: Данные отчета, возможно с ленивыми значениями
+            stream: Двоичный поток для записи
+        """
+        pa = self._pa
+        sink = _PositionWriter(stream)
+        columns: Optional[List[Column]] = None
+        writer = None
+        pending = None
+        
+        for batch in iter_batches(data.get('items', ()), self.batch_size):
+            if columns is None:
+                columns = infer_columns(batch)
+            
+            record_batch = self._record_batch(batch, columns)
+            
+            if writer is None:
+                writer = pa.ipc.new_file(sink, record_batch.schema)
+            else:
+                writer.write_batch(pending)
+            
+            pending = record_batch
+        
+        if writer is None:
+            pending = pa.record_batch([], schema=pa.schema([]))
+            writer = pa.ipc.new_file(sink, pending.schema)
+        
+        report = json.dumps(report_scalars(data), ensure_ascii=False)
+        writer.write_batch(pending, custom_metadata={'report': report})
+        writer.close()
+    
+    def _record_batch(self, batch: List[Dict[str, Any]], columns: List[Column]) -> Any:
+        pa = self._pa
+        arrays = []
+        
+        for column in columns:
+            try:
+                arrays.append(pa.array(column_values(batch, column), type=self._types[column.type]))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                raise ValueError(f"Значения колонки {column.name} не соответствуют типу {column.type}") from None
+        
+        return pa.record_batch(arrays, names=[column.name for column in columns])
+
+
+class _PositionWriter:
+    """
+    Обертка потока, отслеживающая позицию записи.
+    
+    Писатель Arrow запрашивает позицию потока, а стандартный вывод и
+    сокеты ее не поддерживают.
+    """
+    
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self.position = 0
+        self.closed = False
+    
+    def write(self, data: Any) -> int:
+        self.stream.write(data)
+        self.position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self.position
+    
+    def flush(self) -> None:
+        self.stream.flush()
+    
+    def writable(self) -> bool:
+        return True
+
+
+def _write_block(stream: BinaryIO, kind: bytes, buffers: List[Any]) -> int:
+    """
+    Записывает блок: заголовок, буферы содержимого и выравнивание.
+    
+    Args:
+        stream: Двоичный поток
+        kind: Тип блока
+        buffers: Буферы содержимого
+        
+    Returns:
+        Количество записанных байт
+    """
+    length = sum(len(buffer) for buffer in buffers)
+    stream.write(BLOCK_HEADER.pack(kind, length))
+    
+    for buffer in buffers:
+        stream.write(buffer)
+    
+    stream.write(_padding(length))
+    return BLOCK_HEADER.size + _align(length)
+
+
+def _align(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (_align(size) - size)
+
+
+def _little_endian(values: array) -> memoryview:
+    """
+    Представляет массив байтами little-endian без копирования.
+    """
+    if sys.byteorder == 'big':
+        values.byteswap()
+    
+    return memoryview(values).cast('B')
+
+
+def _native(view: memoryview, typecode: str) -> Any:
+    """
+    Представляет буфер колонки массивом значений без копирования.
+    
+    На платформах с порядком байт big-endian значения копируются в array
+    с перестановкой байт.
+    """
+    if sys.byteorder == 'big' and typecode != '?':
+        values = array(typecode)
+        values.frombytes(view)
+        values.byteswap()
+        return memoryview(values)
+    
+    return view.cast(typecode)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+from typing import Dict, Any, Iterable, Iterator, List, Union
+
+from src.reports.aggregation import HashAggregator
+from src.reports.report_generator import PayoutReportGenerator, ReportGenerator
+from src.utils.employee_table import EmployeeTable, TABLE_COLUMNS
+
+
+class DepartmentItem(dict):
+    """
+    Элемент отчета по отделу.
+    
+    Помимо выводимых полей хранит точную сумму ставок rate_sum, по которой
+    частичные отчеты объединяются без потери точности средней ставки.
+    Сумма хранится в атрибуте, а не в словаре, поэтому форматеры ее не выводят.
+    """
+    
+    def __init__(self, fields: Dict[str, Any], rate_sum: float) -> None:
+        """
+        Args:
+            fields: Выводимые поля элемента
+            rate_sum: Сумма ставок сотрудников отдела
+        """
+        super().__init__(fields)
+        self.rate_sum = rate_sum
+
+
+class DepartmentReportGenerator(ReportGenerator):
+    """
+    Генератор отчета по отделам.
+    
+    За один проход по данным вычисляет для каждого отдела количество
+    сотрудников, сумму часов и выплат, среднюю ставку, минимум и максимум
+    часов. Элементы по отдельным сотрудникам не создаются, поэтому память
+    пропорциональна числу отделов. Выплаты вычисляются пакетами генератора
+    выплат.
+    """
+    
+    required_columns = TABLE_COLUMNS
+    
+    def __init__(self, include_items: bool = True) -> None:
+        """
+        Args:
+            include_items: Не используется: агрегаты по отделам строятся всегда
+        """
+        super().__init__(include_items)
+        self._payouts = PayoutReportGenerator(include_items=False)
+    
+    def generate(self, employees_data: Union[EmployeeTable, Iterable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Генерирует отчет по отделам.
+        
+        Args:
+            employees_data: Колоночная таблица или итерируемый набор словарей
+                с данными сотрудников
+            
+        Returns:
+            Словарь с данными отчета, где 'items' - агрегаты по отделам
+        """
+        aggregator = HashAggregator()
+        total = 0
+        self._payouts.diagnostics = self.diagnostics
+        
+        for columns, total in self._payouts.iter_column_batches(employees_data):
+            aggregator.add_columns(columns.departments, columns.hours, columns.rates, columns.amounts)
+        
+        return {
+            'report_type': 'department',
+            'items': list(self._build_department_items(aggregator)),
+            'total': total
+        }
+    
+    def merge(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Объединяет частичные отчеты по отделам, складывая агрегаты одинаковых отделов.
+        
+        Args:
+            reports: Частичные отчеты в порядке следования данных
+            
+        Returns:
+            Словарь с данными объединенного отчета
+        """
+        aggregator = HashAggregator()
+        total = 0
+        
+        for report_data in reports:
+            for item in report_data['items']:
+                aggregator.add_state(item['department'], item['employees'], item['hours'],
+                                     item.rate_sum, item['amount'],
+                                     item['min_hours'], item['max_hours'])
+            total += report_data['total']
+        
+        return {
+            'report_type': 'department',
+            'items': list(self._build_department_items(aggregator)),
+            'total': total
+        }
+    
+    @staticmethod
+    def _build_department_items(aggregator: HashAggregator) -> Iterator[DepartmentItem]:
+        """
+        Формирует элементы отчета из агрегатов по отделам.
+        
+        Args:
+            aggregator: Агрегаты по отделам
+            
+        Yields:
+            Элементы отчета по отделам
+        """
+        for department, (count, hours, rate_sum, amount, min_hours, max_hours) in aggregator.items():
+            yield DepartmentItem({
+                'department': department,
+                'employees': count,
+                'hours': hours,
+                'mean_rate': rate_sum / count,
+                'min_hours': min_hours,
+                'max_hours': max_hours,
+                'amount': amount
+            }, rate_sum)
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-import json
+import io
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Type, Optional
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, TextIO, Tuple, Type, Optional, Union
+
+from src.reports.report_generator import materialize_report
+from src.utils.plugins import entry_point_names, load_entry_point, load_object
 
 
 class ReportFormatter(ABC):
@@ -9,6 +12,10 @@ class ReportFormatter(ABC):
     Абстрактный базовый класс для форматеров отчетов.
     """
     
+    # Двоичные форматеры возвращают из format байты и записывают отчет
+    # в двоичный поток
+    binary = False
+    
     @abstractmethod
     def format(self, data: Dict[str, Any]) -> str:
         """
@@ -21,6 +28,129 @@ class ReportFormatter(ABC):
             Строка с отформатированным отчетом
         """
         pass
+    
+    def write(self, data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Записывает отформатированный отчет в поток.
+        
+        Данные могут содержать ленивые значения (см.
+        ReportGenerator.generate_stream). По умолчанию отчет вычисляется
+        целиком и записывается одной строкой; форматеры, умеющие писать
+        по мере вычисления, переопределяют этот метод.
+        
+        Args:
+            data: Данные отчета
+            stream: Поток для записи
+        """
+        stream.write(self.format(materialize_report(data)))
+
+
+class TableLayout(NamedTuple):
+    """
+    Описание колонок текстовой таблицы.
+    
+    Каждая колонка задается кортежем (заголовок, ключ элемента, ширина,
+    спецификация формата значения). Пустая спецификация означает строку.
+    """
+    columns: Tuple[Tuple[str, str, int, str], ...]
+    width: int
+    total_label_width: int
+
+
+# Таблица отчета по заработной плате
+PAYOUT_LAYOUT = TableLayout(
+    columns=(
+        ('Имя', 'name', 30, ''),
+        ('Отдел', 'department', 20, ''),
+        ('Часы', 'hours', 10, '.1f'),
+        ('Ставка', 'rate', 10, '.2f'),
+        ('Сумма', 'amount', 10, '.2f'),
+    ),
+    width=80,
+    total_label_width=74,
+)
+
+# Таблица отчета по отделам
+DEPARTMENT_LAYOUT = TableLayout(
+    columns=(
+        ('Отдел', 'department', 20, ''),
+        ('Сотрудники', 'employees', 10, 'd'),
+        ('Часы', 'hours', 10, '.1f'),
+        ('Ср. ставка', 'mean_rate', 10, '.2f'),
+        ('Мин. часы', 'min_hours', 10, '.1f'),
+        ('Макс. часы', 'max_hours', 10, '.1f'),
+        ('Сумма', 'amount', 10, '.2f'),
+    ),
+    width=98,
+    total_label_width=85,
+)
+
+
+class TextTableWriter:
+    """
+    Потоковый писатель текстовой таблицы фиксированной ширины.
+    
+    Заголовок, строки и итог записываются отдельными вызовами, строки
+    буферизуются и сбрасываются в поток пачками.
+    """
+    
+    def __init__(self, stream: TextIO, buffer_size: int = 1024, layout: TableLayout = PAYOUT_LAYOUT) -> None:
+        """
+        Args:
+            stream: Поток для записи
+            buffer_size: Количество строк, накапливаемых перед записью в поток
+            layout: Описание колонок таблицы
+        """
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.layout = layout
+        self._buffer: List[str] = []
+        self._row_formats = [(key, f"{width}{spec}", 0 if spec else '') for _, key, width, spec in layout.columns]
+    
+    def _append(self, line: str) -> None:
+        self._buffer.append(line)
+        
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Записывает накопленные строки в поток.
+        """
+        if self._buffer:
+            self.stream.write(''.join(self._buffer))
+            self._buffer.clear()
+    
+    def write_header(self) -> None:
+        """
+        Записывает заголовок таблицы.
+        """
+        separator = "-" * self.layout.width + "\n"
+        
+        self._append(separator)
+        self._append(" | ".join(f"{title:{width}}" for title, _, width, _ in self.layout.columns) + "\n")
+        self._append(separator)
+    
+    def write_row(self, item: Dict[str, Any]) -> None:
+        """
+        Записывает строку таблицы для одного элемента отчета.
+        
+        Args:
+            item: Элемент отчета
+        """
+        self._append(" | ".join(format(item.get(key, default), spec) for key, spec, default in self._row_formats) + "\n")
+    
+    def write_footer(self, total: float) -> None:
+        """
+        Записывает итоговую строку и сбрасывает буфер.
+        
+        Args:
+            total: Итоговая сумма
+        """
+        self._append("-" * self.layout.width + "\n")
+        self._append(f"{'Итого':{self.layout.total_label_width}} | {total:10.2f}\n")
+        self._append("-" * self.layout.width)
+        self.flush()
 
 
 class TextFormatter(ReportFormatter):
@@ -28,6 +158,13 @@ class TextFormatter(ReportFormatter):
     Форматер для текстового представления отчета.
     """
     
+    # Описания таблиц по типам отчетов; для остальных типов используется
+    # таблица отчета по заработной плате
+    layouts: Dict[str, TableLayout] = {
+        'payout': PAYOUT_LAYOUT,
+        'department': DEPARTMENT_LAYOUT,
+    }
+    
     def format(self, data: Dict[str, Any]) -> str:
         """
         Форматирует данные отчета в текстовый формат.
@@ -38,35 +175,68 @@ class TextFormatter(ReportFormatter):
         Returns:
             Строка с текстовым представлением отчета
         """
+        buffer = io.StringIO()
+        self.write(data, buffer)
+        return buffer.getvalue()
+    
+    def write(self, data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Записывает текстовую таблицу в поток по мере вычисления элементов.
+        
+        Строка таблицы записывается сразу после получения элемента, итог -
+        после последнего элемента.
+        
+        Args:
+            data: Данные отчета с ключами 'items' и 'total', возможно
+                с ленивыми значениями
+            stream: Поток для записи
+        """
         if not data or 'items' not in data or 'total' not in data:
-            return "Нет данных для форматирования"
+            stream.write("Нет данных для форматирования")
+            return
         
-        report = []
-        report.append("-" * 80)
-        report.append(f"{'Имя':30} | {'Отдел':20} | {'Часы':10} | {'Ставка':10} | {'Сумма':10}")
-        report.append("-" * 80)
+        writer = TextTableWriter(stream, layout=self.layouts.get(data.get('report_type'), PAYOUT_LAYOUT))
+        writer.write_header()
         
         for item in data['items']:
-            name = item.get('name', '')
-            department = item.get('department', '')
-            hours = item.get('hours', 0)
-            rate = item.get('rate', 0)
-            amount = item.get('amount', 0)
-            
-            report.append(f"{name:30} | {department:20} | {hours:10.1f} | {rate:10.2f} | {amount:10.2f}")
+            writer.write_row(item)
         
-        report.append("-" * 80)
-        report.append(f"{'Итого':74} | {data['total']:10.2f}")
-        report.append("-" * 80)
-        
-        return "\n".join(report)
+        total = data['total']
+        writer.write_footer(total() if callable(total) else total)
 
 
 class JsonFormatter(ReportFormatter):
     """
     Форматер для JSON представления отчета.
+    
+    Списки и итераторы верхнего уровня записываются поэлементно, поэтому
+    отчет не собирается в одну большую строку, а первые байты выводятся
+    сразу. Результат совпадает с json.dumps(data, ensure_ascii=False, indent=2)
+    байт в байт.
     """
     
+    # Отступ вложенных уровней, как в json.dumps(indent=2)
+    indent = 2
+    
+    # Количество фрагментов, накапливаемых перед записью в поток
+    buffer_size = 1024
+    
+    # Типы значений, из которых состоит плоский элемент отчета
+    _scalar_types = frozenset((str, int, float, bool, type(None)))
+    
+    def __init__(self) -> None:
+        # json загружается только при создании JSON форматера
+        from json import JSONEncoder
+        
+        # Кодировщик с отступами создается один раз и переиспользуется
+        # для всех значений; с отступами json кодирует значения на Python
+        self._encoder_class = JSONEncoder
+        self._encoder = JSONEncoder(ensure_ascii=False, indent=self.indent)
+        # Кодировщики плоских словарей по уровням вложенности: без отступов
+        # json кодирует на C, а переводы строк с отступом элемента передаются
+        # как разделитель значений
+        self._flat_encoders: Dict[int, Tuple[Any, str, str]] = {}
+    
     def format(self, data: Dict[str, Any]) -> str:
         """
         Форматирует данные отчета в JSON.
@@ -77,30 +247,167 @@ class JsonFormatter(ReportFormatter):
         Returns:
             Строка с JSON представлением отчета
         """
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        buffer = io.StringIO()
+        self.write(data, buffer)
+        return buffer.getvalue()
+    
+    def write(self, data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Записывает JSON представление отчета в поток по мере вычисления.
+        
+        Args:
+            data: Данные отчета, возможно с ленивыми значениями
+            stream: Поток для записи
+        """
+        if not isinstance(data, dict) or not data or not all(isinstance(key, str) for key in data):
+            if isinstance(data, dict):
+                data = materialize_report(data)
+            stream.write(self._dumps(data, 0))
+            return
+        
+        pieces: List[str] = ['{']
+        
+        for position, (key, value) in enumerate(data.items()):
+            if position:
+                pieces.append(',')
+            pieces.append(f"\n{self._padding(1)}{self._dumps(key, 1)}: ")
+            
+            if isinstance(value, Iterator) or isinstance(value, (list, tuple)):
+                self._write_array(value, stream, pieces)
+            else:
+                if callable(value):
+                    value = value()
+                pieces.append(self._dumps(value, 1))
+        
+        pieces.append('\n}')
+        stream.write(''.join(pieces))
+    
+    def _write_array(self, values: Iterable[Any], stream: TextIO, pieces: List[str]) -> None:
+        """
+        Записывает массив второго уровня поэлементно.
+        
+        Args:
+            values: Элементы массива
+            stream: Поток для записи
+            pieces: Накопленные, но еще не записанные фрагменты
+        """
+        empty = True
+        element_prefix = f"\n{self._padding(2)}"
+        
+        for value in values:
+            pieces.append('[' if empty else ',')
+            pieces.append(element_prefix)
+            pieces.append(self._dumps(value, 2))
+            empty = False
+            
+            if len(pieces) >= self.buffer_size:
+                stream.write(''.join(pieces))
+                pieces.clear()
+        
+        pieces.append('[]' if empty else f"\n{self._padding(1)}]")
+    
+    def _padding(self, level: int) -> str:
+        return ' ' * (self.indent * level)
+    
+    def _dumps(self, value: Any, level: int) -> str:
+        """
+        Сериализует значение с отступами, соответствующими уровню вложенности.
+        
+        Args:
+            value: Значение
+            level: Уровень вложенности значения
+            
+        Returns:
+            JSON представление значения
+        """
+        if type(value) is dict and value and self._scalar_types.issuperset(map(type, value.values())):
+            # Плоский словарь (обычно элемент отчета) кодируется быстрым
+            # кодировщиком без отступов; результат совпадает с кодированием
+            # с отступами
+            encoder, opening, closing = self._flat_encoder(level)
+            return opening + encoder.encode(value)[1:-1] + closing
+        
+        text = self._encoder.encode(value)
+        
+        if level and '\n' in text:
+            text = text.replace('\n', '\n' + self._padding(level))
+        
+        return text
+    
+    def _flat_encoder(self, level: int) -> Tuple[Any, str, str]:
+        """
+        Возвращает кодировщик плоских словарей для уровня вложенности.
+        
+        Args:
+            level: Уровень вложенности словаря
+            
+        Returns:
+            Кортеж (кодировщик, начало словаря, конец словаря)
+        """
+        flat_encoder = self._flat_encoders.get(level)
+        
+        if flat_encoder is None:
+            item_padding = '\n' + self._padding(level + 1)
+            encoder = self._encoder_class(ensure_ascii=False, separators=(',' + item_padding, ': '))
+            flat_encoder = self._flat_encoders[level] = (encoder, '{' + item_padding, f"\n{self._padding(level)}}}")
+        
+        return flat_encoder
 
 
 class FormatterFactory:
     """
     Фабрика для создания форматеров отчетов.
+    
+    Форматер регистрируется классом или путем к нему вида
+    'пакет.модуль:Класс'; модуль по пути импортируется только при первом
+    обращении к формату. Форматы, не зарегистрированные явно, ищутся
+    среди точек входа FORMATTERS_ENTRY_POINT установленных пакетов.
     """
     
-    _formatters: Dict[str, Type[ReportFormatter]] = {
+    FORMATTERS_ENTRY_POINT = 'reports.formatters'
+    
+    _formatters: Dict[str, Union[Type[ReportFormatter], str]] = {
         'text': TextFormatter,
         'json': JsonFormatter,
+        'columnar': 'src.reports.columnar:ColumnarFormatter',
+        'arrow': 'src.reports.columnar:ArrowFormatter',
     }
     
     @classmethod
-    def register_formatter(cls, format_type: str, formatter_class: Type[ReportFormatter]) -> None:
+    def register_formatter(cls, format_type: str, formatter_class: Union[Type[ReportFormatter], str]) -> None:
         """
         Регистрирует новый тип форматера отчетов.
         
         Args:
             format_type: Название типа форматера
-            formatter_class: Класс форматера отчетов
+            formatter_class: Класс форматера отчетов или путь к нему
+                вида 'пакет.модуль:Класс'
         """
         cls._formatters[format_type] = formatter_class
     
+    @classmethod
+    def get_formatter_class(cls, format_type: str) -> Optional[Type[ReportFormatter]]:
+        """
+        Возвращает класс форматера для заданного типа, импортируя его при первом обращении.
+        
+        Args:
+            format_type: Тип форматера
+            
+        Returns:
+            Класс форматера отчетов или None, если тип не поддерживается
+        """
+        formatter_class = cls._formatters.get(format_type)
+        
+        if formatter_class is None:
+            formatter_class = load_entry_point(cls.FORMATTERS_ENTRY_POINT, format_type)
+        elif isinstance(formatter_class, str):
+            formatter_class = load_object(formatter_class)
+        
+        if formatter_class is not None:
+            cls._formatters[format_type] = formatter_class
+        
+        return formatter_class
+    
     @classmethod
     def get_formatter(cls, format_type: str) -> Optional[ReportFormatter]:
         """
@@ -112,9 +419,22 @@ class FormatterFactory:
         Returns:
             Экземпляр форматера отчетов или None, если тип не поддерживается
         """
-        formatter_class = cls._formatters.get(format_type)
+        formatter_class = cls.get_formatter_class(format_type)
         
         if formatter_class:
             return formatter_class()
         
-        return None 
\ No newline at end of file
+        return None
+    
+    @classmethod
+    def get_format_types(cls) -> List[str]:
+        """
+        Возвращает зарегистрированные типы форматов, включая точки входа установленных пакетов.
+        
+        Returns:
+            Список типов форматов
+        """
+        format_types = list(cls._formatters)
+        format_types.extend(name for name in entry_point_names(cls.FORMATTERS_ENTRY_POINT) if name not in format_types)
+        
+        return format_types
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Dict, Any, Optional, Tuple
+
+from src.reports.parallel import count_rows
+from src.reports.report_generator import ReportFactory, ReportGenerator
+from src.utils.compression import is_compressed
+from src.utils.csv_reader import CSVReader, CSVRangeReader
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE
+from src.utils.schema import DEFAULT_SCHEMA
+from src.utils.defaults import DEFAULT_CACHE_DIR, PICKLE_PROTOCOL
+
+
+# Версия формата контрольных точек: при изменении частичных отчетов
+# старые контрольные точки не используются, и файл разбирается заново
+CHECKPOINT_VERSION = 3
+
+# Каталог контрольных точек по умолчанию
+DEFAULT_STATE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'checkpoints')
+
+# Размер блоков в начале файла и перед контрольной точкой, по которым
+# проверяется, что уже обработанная часть файла не изменилась
+FINGERPRINT_SIZE = 64 * 1024
+
+
+class CheckpointStore:
+    """
+    Хранилище контрольных точек инкрементального построения отчетов.
+    
+    Для каждой пары (файл, тип отчета) хранится смещение в байтах, до
+    которого файл уже обработан, число обработанных строк, отпечаток
+    обработанной части и частичный отчет по ней.
+    """
+    
+    def __init__(self, state_dir: str = DEFAULT_STATE_DIR) -> None:
+        """
+        Args:
+            state_dir: Каталог для хранения контрольных точек
+        """
+        self.state_dir = state_dir
+    
+    def _path(self, file_path: str, report_type: str) -> str:
+        # Тип отчета может включать параметры генератора, см. generate_incremental
+        key = hashlib.blake2b(f"{os.path.abspath(file_path)}|{report_type}".encode('utf-8'), digest_size=20)
+        return os.path.join(self.state_dir, f"{key.hexdigest()}.checkpoint")
+    
+    def load(self, file_path: str, report_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Загружает контрольную точку.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            report_type: Тип отчета
+            
+        Returns:
+            Словарь контрольной точки или None, если ее нет
+        """
+        try:
+            with open(self._path(file_path, report_type), 'rb') as state:
+                checkpoint = pickle.load(state)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        
+        if checkpoint.get('version') != CHECKPOINT_VERSION:
+            return None
+        
+        return checkpoint
+    
+    def save(self, file_path: str, report_type: str, checkpoint: Dict[str, Any]) -> None:
+        """
+        Сохраняет контрольную точку.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            report_type: Тип отчета
+            checkpoint: Словарь контрольной точки
+        """
+        os.makedirs(self.state_dir, exist_ok=True)
+        
+        fd, temp_path = tempfile.mkstemp(dir=self.state_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as state:
+                pickle.dump(dict(checkpoint, version=CHECKPOINT_VERSION), state, protocol=PICKLE_PROTOCOL)
+            os.replace(temp_path, self._path(file_path, report_type))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def _fingerprint(file_path: str, offset: int) -> str:
+    """
+    Вычисляет отпечаток обработанной части файла.
+    
+    Учитываются начало файла (заголовок и первые строки) и блок перед
+    смещением, поэтому перезапись или усечение файла обнаруживаются
+    без чтения всей обработанной части.
+    
+    Args:
+        file_path: Путь к CSV файлу
+        offset: Смещение конца обработанной части
+        
+    Returns:
+        Шестнадцатеричный отпечаток
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    
+    with open(file_path, 'rb') as file:
+        digest.update(file.read(min(FINGERPRINT_SIZE, offset)))
+        file.seek(max(0, offset - FINGERPRINT_SIZE))
+        digest.update(file.read(offset - file.tell()))
+    
+    return digest.hexdigest()
+
+
+def _data_bounds(file_path: str, file_size: int) -> Tuple[int, int]:
+    """
+    Определяет начало данных и конец последней завершенной строки.
+    
+    Args:
+        file_path: Путь к CSV файлу
+        file_size: Размер файла в байтах
+        
+    Returns:
+        Кортеж (смещение после заголовка, смещение после последнего
+        перевода строки)
+    """
+    with open(file_path, 'rb') as file:
+        file.readline()
+        data_start = file.tell()
+        
+        position = file_size
+        while position > data_start:
+            block_start = max(data_start, position - FINGERPRINT_SIZE)
+            file.seek(block_start)
+            newline = file.read(position - block_start).rfind(b'\n')
+            
+            if newline != -1:
+                return data_start, block_start + newline + 1
+            
+            position = block_start
+    
+    return data_start, data_start
+
+
+def _generate_range(report_generator: ReportGenerator, file_path: str, start: int, end: int,
+                    line_offset: int, diagnostics: Optional[Diagnostics] = None) -> Tuple[Dict[str, Any], int, int]:
+    """
+    Строит частичный отчет по диапазону файла.
+    
+    Args:
+        report_generator: Генератор отчета
+        file_path: Путь к CSV файлу
+        start: Начало диапазона в байтах
+        end: Конец диапазона в байтах
+        line_offset: Номер строки файла, предшествующей диапазону
+        diagnostics: Сборщик предупреждений
+        
+    Returns:
+        Кортеж (частичный отчет, количество записей, количество строк)
+    """
+    reader = CSVRangeReader(file_path, start, end, report_generator.required_columns, schema=DEFAULT_SCHEMA,
+                            diagnostics=diagnostics)
+    counter = [0]
+    report_data = report_generator.generate(count_rows(reader.iter_rows(), counter))
+    
+    for line_num, line in reader.malformed:
+        if diagnostics is not None:
+            diagnostics.add(file_path, MALFORMED_LINE, f"строка {line_offset + line_num}: {line}")
+        else:
+            print(f"Предупреждение: Некорректная строка {line_offset + line_num} в файле {file_path}: {line}")
+    
+    return report_data, counter[0], reader.lines_read
+
+
+def _generate_compressed(report_generator: ReportGenerator, file_path: str, store: CheckpointStore,
+                         checkpoint_type: str, stat: os.stat_result,
+                         diagnostics: Optional[Diagnostics] = None) -> Tuple[Dict[str, Any], int]:
+    """
+    Строит отчет по сжатому файлу.
+    
+    Смещения в сжатом файле не соответствуют границам строк, поэтому
+    дописанный хвост нельзя разобрать отдельно: файл разбирается целиком,
+    а сохраненный отчет используется, пока файл не изменился.
+    
+    Args:
+        report_generator: Генератор отчета
+        file_path: Путь к сжатому CSV файлу
+        store: Хранилище контрольных точек
+        checkpoint_type: Ключ контрольной точки
+        stat: Сведения о файле
+        diagnostics: Сборщик предупреждений
+        
+    Returns:
+        Кортеж (отчет по файлу, количество записей в нем)
+    """
+    file_version = [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+    checkpoint = store.load(file_path, checkpoint_type)
+    
+    if checkpoint is not None and checkpoint.get('file_version') == file_version:
+        return checkpoint['report'], checkpoint['rows']
+    
+    ranges = CSVReader.split_ranges(file_path, stat.st_size)
+    
+    if not ranges:
+        return report_generator.merge([]), 0
+    
+    start, end = ranges[0]
+    report_data, rows, _ = _generate_range(report_generator, file_path, start, end, 1, diagnostics)
+    store.save(file_path, checkpoint_type, {'file_version': file_version, 'rows': rows, 'report': report_data})
+    
+    return report_data, rows
+
+
+def generate_incremental(report_type: str, file_path: str, store: CheckpointStore,
+                         options: Optional[Dict[str, Any]] = None,
+                         diagnostics: Optional[Diagnostics] = None) -> Tuple[Dict[str, Any], int]:
+    """
+    Строит отчет по файлу, который только дописывается, разбирая лишь новые строки.
+    
+    Если для файла есть контрольная точка и обработанная часть не
+    изменилась, разбирается только дописанный хвост, а его частичный отчет
+    объединяется с сохраненным. Если файл был усечен или перезаписан,
+    отчет строится заново. Контрольная точка сохраняется на конце последней
+    завершенной строки; незавершенная последняя строка учитывается в отчете,
+    но будет разобрана повторно при следующем запуске. Сжатый файл
+    разбирается целиком, если он изменился с прошлого запуска.
+    
+    Args:
+        report_type: Тип отчета
+        file_path: Путь к CSV файлу
+        store: Хранилище контрольных точек
+        options: Параметры конструктора генератора
+        diagnostics: Сборщик предупреждений о проблемах в разобранных строках
+        
+    Returns:
+        Кортеж (отчет по файлу, количество записей в нем)
+    """
+    report_generator = ReportFactory.get_generator(report_type, **(options or {}))
+    report_generator.diagnostics = diagnostics
+    
+    # Контрольные точки отчетов с разными параметрами хранятся раздельно
+    checkpoint_type = f"{report_type}|{sorted((options or {}).items())}" if options else report_type
+    
+    if not os.path.exists(file_path):
+        print(f"Ошибка: Файл {file_path} не найден")
+        return report_generator.merge([]), 0
+    
+    stat = os.stat(file_path)
+    
+    if stat.st_size == 0:
+        print(f"Предупреждение: Файл {file_path} пуст")
+        return report_generator.merge([]), 0
+    
+    if is_compressed(file_path):
+        return _generate_compressed(report_generator, file_path, store, checkpoint_type, stat, diagnostics)
+    
+    data_start, complete_end = _data_bounds(file_path, stat.st_size)
+    checkpoint = store.load(file_path, checkpoint_type)
+    
+    if (checkpoint is None
+            or checkpoint['inode'] != stat.st_ino
+            or checkpoint['offset'] > complete_end
+            or checkpoint['fingerprint'] != _fingerprint(file_path, checkpoint['offset'])):
+        # Контрольной точки нет или обработанная часть изменилась:
+        # отчет строится с начала данных
+        checkpoint = {
+            'inode': stat.st_ino,
+            'offset': data_start,
+            'lines': 1,
+            'rows': 0,
+            'report': None,
+        }
+    
+    partial_reports = [checkpoint['report']] if checkpoint['report'] is not None else []
+    
+    tail_report, tail_rows, tail_lines = _generate_range(
+        report_generator, file_path, checkpoint['offset'], complete_end, checkpoint['lines'], diagnostics)
+    partial_reports.append(tail_report)
+    
+    checkpoint_report = report_generator.merge(partial_reports)
+    rows = checkpoint['rows'] + tail_rows
+    
+    store.save(file_path, checkpoint_type, {
+        'inode': stat.st_ino,
+        'offset': complete_end,
+        'lines': checkpoint['lines'] + tail_lines,
+        'rows': rows,
+        'fingerprint': _fingerprint(file_path, complete_end),
+        'report': checkpoint_report,
+    })
+    
+    if complete_end == stat.st_size:
+        return checkpoint_report, rows
+    
+    # Незавершенная последняя строка входит в отчет, но не в контрольную точку
+    incomplete_report, incomplete_rows, _ = _generate_range(
+        report_generator, file_path, complete_end, stat.st_size, checkpoint['lines'] + tail_lines, diagnostics)
+    
+    return report_generator.merge([checkpoint_report, incomplete_report]), rows + incomplete_rows
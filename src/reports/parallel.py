@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from src.reports.report_generator import ReportFactory
+from src.utils.compression import is_compressed
+from src.utils.csv_reader import CSVReader, CSVRangeReader
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE
+from src.utils.mmap_reader import MmapCSVReader
+from src.utils.schema import DEFAULT_SCHEMA
+
+
+# Размер фрагмента файла по умолчанию для параллельного разбора
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def count_rows(rows: Iterable[Dict[str, Any]], counter: List[int]) -> Iterator[Dict[str, Any]]:
+    """
+    Пропускает строки без изменений, подсчитывая их количество.
+    
+    Args:
+        rows: Итерируемый набор строк
+        counter: Список из одного элемента, в котором накапливается счетчик
+        
+    Yields:
+        Исходные строки
+    """
+    for row in rows:
+        counter[0] += 1
+        yield row
+
+
+def generate_range_report(report_type: str, file_path: str, start: int, end: int,
+                          columnar: bool = False, use_mmap: bool = False,
+                          options: Optional[Dict[str, Any]] = None, max_warnings: Optional[int] = None
+                          ) -> Tuple[Dict[str, Any], int, int, List[Tuple[int, str]], Optional[Diagnostics]]:
+    """
+    Строит частичный отчет по диапазону байтов файла.
+    
+    Функция выполняется в рабочем процессе: через границу процессов
+    передается только готовый частичный отчет, а не строки файла.
+    
+    Args:
+        report_type: Тип отчета
+        file_path: Путь к CSV файлу
+        start: Начало диапазона в байтах
+        end: Конец диапазона в байтах
+        columnar: Читать ли диапазон в колоночную таблицу
+        use_mmap: Читать ли диапазон через отображение файла в память
+        options: Параметры конструктора генератора
+        max_warnings: Если указано, предупреждения о некорректных значениях
+            не выводятся, а собираются с таким числом примеров и
+            возвращаются основному процессу
+        
+    Returns:
+        Кортеж (частичный отчет, количество прочитанных записей,
+        количество строк в диапазоне, некорректные строки с номерами
+        относительно начала диапазона, собранные предупреждения или None)
+    """
+    report_generator = ReportFactory.get_generator(report_type, **(options or {}))
+    columns = report_generator.required_columns
+    diagnostics = Diagnostics(max_warnings) if max_warnings is not None else None
+    report_generator.diagnostics = diagnostics
+    
+    if use_mmap and not is_compressed(file_path):
+        reader = MmapCSVReader(file_path, columns, start, end, schema=DEFAULT_SCHEMA, diagnostics=diagnostics)
+    else:
+        reader = CSVRangeReader(file_path, start, end, columns, schema=DEFAULT_SCHEMA, diagnostics=diagnostics)
+    
+    if columnar:
+        table = reader.read_table()
+        report_data, rows_read = report_generator.generate(table), len(table)
+    else:
+        counter = [0]
+        report_data = report_generator.generate(count_rows(reader.iter_rows(), counter))
+        rows_read = counter[0]
+    
+    return report_data, rows_read, reader.lines_read, reader.malformed, diagnostics
+
+
+def generate_parallel(report_type: str, file_paths: List[str], jobs: int, columnar: bool = False,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False,
+                      options: Optional[Dict[str, Any]] = None,
+                      diagnostics: Optional[Diagnostics] = None) -> Tuple[Dict[str, Any], int]:
+    """
+    Строит отчет по нескольким файлам в параллельных процессах.
+    
+    Каждый файл делится на фрагменты по границам строк (сжатый файл
+    обрабатывается одним фрагментом), фрагменты обрабатываются рабочими
+    процессами, а частичные отчеты объединяются
+    генератором в исходном порядке файлов и фрагментов. Предупреждения о
+    некорректных строках выводятся основным процессом с абсолютными
+    номерами строк (или учитываются в сборщике предупреждений, куда также
+    передаются предупреждения рабочих процессов).
+    
+    Args:
+        report_type: Тип отчета
+        file_paths: Список путей к CSV файлам
+        jobs: Количество рабочих процессов
+        columnar: Читать ли данные в колоночные таблицы
+        chunk_size: Размер фрагмента файла в байтах
+        use_mmap: Читать ли фрагменты через отображение файла в память
+        options: Параметры конструктора генератора
+        diagnostics: Сборщик предупреждений
+        
+    Returns:
+        Кортеж (итоговый отчет, общее количество прочитанных записей)
+    """
+    tasks = [
+        (file_path, start, end)
+        for file_path in file_paths
+        for start, end in CSVReader.split_ranges(file_path, chunk_size)
+    ]
+    
+    max_warnings = diagnostics.max_examples if diagnostics is not None else None
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(generate_range_report, report_type, file_path, start, end, columnar, use_mmap, options,
+                            max_warnings)
+            for file_path, start, end in tasks
+        ]
+        results = [future.result() for future in futures]
+    
+    partial_reports = []
+    rows_read = 0
+    current_file = None
+    line_offset = 0
+    
+    for (file_path, _, _), (report_data, range_rows, range_lines, malformed, range_diagnostics) in zip(tasks, results):
+        if file_path != current_file:
+            # Данные начинаются со второй строки файла, после заголовка
+            current_file = file_path
+            line_offset = 1
+        
+        for line_num, line in malformed:
+            if diagnostics is not None:
+                diagnostics.add(file_path, MALFORMED_LINE, f"строка {line_offset + line_num}: {line}")
+            else:
+                print(f"Предупреждение: Некорректная строка {line_offset + line_num} в файле {file_path}: {line}")
+        
+        if range_diagnostics is not None:
+            diagnostics.merge(range_diagnostics)
+        
+        line_offset += range_lines
+        partial_reports.append(report_data)
+        rows_read += range_rows
+    
+    return ReportFactory.get_generator(report_type, **(options or {})).merge(partial_reports), rows_read
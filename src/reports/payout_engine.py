@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+from importlib.util import find_spec
+from operator import mul
+from typing import List, Sequence, Tuple, Any
+
+# Используется ли NumPy для вычислений над колонками. Сам NumPy
+# импортируется при первом расчете по достаточно большой колонке: его
+# импорт занимает больше времени, чем весь отчет по небольшому файлу
+HAS_NUMPY = find_spec('numpy') is not None
+
+np: Any = None
+
+# Минимальная длина колонки, начиная с которой расчет выполняется через
+# NumPy; на более коротких колонках накладные расходы NumPy больше выигрыша
+NUMPY_MIN_ROWS = 256
+
+
+def parse_float_columns(hours_values: Sequence[Any],
+                        rate_values: Sequence[Any]) -> Tuple[List[float], List[float], List[Tuple[int, Exception]]]:
+    """
+    Преобразует колонки часов и ставок в числа целиком.
+    
+    Сначала выполняется пакетное преобразование всей колонки. Если в ней
+    встречается некорректное значение, колонки разбираются поэлементно,
+    чтобы найти все ошибочные строки и сохранить порядок проверки
+    (сначала часы, затем ставка), как при построчной обработке.
+    
+    Args:
+        hours_values: Значения колонки с отработанными часами
+        rate_values: Значения колонки со ставкой
+        
+    Returns:
+        Кортеж (часы, ставки, ошибки), где ошибки - список пар
+        (номер строки, исключение). Ошибочные строки в часы и ставки
+        не попадают
+    """
+    try:
+        return list(map(float, hours_values)), list(map(float, rate_values)), []
+    except (ValueError, TypeError):
+        pass
+    
+    hours: List[float] = []
+    rates: List[float] = []
+    errors: List[Tuple[int, Exception]] = []
+    
+    for index, (hours_value, rate_value) in enumerate(zip(hours_values, rate_values)):
+        try:
+            hours_worked = float(hours_value)
+            rate = float(rate_value)
+        except (ValueError, TypeError) as e:
+            errors.append((index, e))
+            continue
+        
+        hours.append(hours_worked)
+        rates.append(rate)
+    
+    return hours, rates, errors
+
+
+def compute_amounts(hours: Sequence[float], rates: Sequence[float],
+                    total: float = 0) -> Tuple[List[float], float]:
+    """
+    Вычисляет суммы выплат и нарастающий итог по целым колонкам.
+    
+    Итог накапливается последовательно в порядке строк, поэтому результат
+    совпадает с построчным сложением до последнего бита. Колонки могут
+    быть списками или массивами array('d'); при наличии NumPy массивы
+    используются без копирования.
+    
+    Args:
+        hours: Отработанные часы
+        rates: Ставки
+        total: Итог, накопленный по предыдущим строкам
+        
+    Returns:
+        Кортеж (суммы выплат, новый итог)
+    """
+    if not len(hours):
+        return [], total
+    
+    if HAS_NUMPY and len(hours) >= NUMPY_MIN_ROWS:
+        _load_numpy()
+        amounts = _as_float64(hours) * _as_float64(rates)
+        running = np.cumsum(np.concatenate(([total], amounts)))
+        return amounts.tolist(), float(running[-1])
+    
+    amounts = list(map(mul, hours, rates))
+    
+    for amount in amounts:
+        total += amount
+    
+    return amounts, total
+
+
+def _load_numpy() -> None:
+    global np
+    
+    if np is None:
+        import numpy
+        np = numpy
+
+
+def _as_float64(values: Sequence[float]) -> Any:
+    """
+    Представляет колонку в виде массива NumPy float64.
+    
+    Args:
+        values: Список чисел или массив array('d')
+        
+    Returns:
+        Массив NumPy
+    """
+    if getattr(values, 'typecode', None) == 'd':
+        return np.frombuffer(values, dtype=np.float64)
+    
+    return np.asarray(values, dtype=np.float64)
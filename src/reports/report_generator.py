@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Type
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+from src.reports.payout_engine import parse_float_columns, compute_amounts
+from src.reports.top_n import TopNSelector
+from src.utils.diagnostics import Diagnostics, INVALID_VALUE
+from src.utils.employee_table import EmployeeTable, RATE_COLUMNS, TABLE_COLUMNS, resolve_rate_column
+from src.utils.plugins import entry_point_names, load_entry_point, load_object
 
 
 class ReportGenerator(ABC):
@@ -8,108 +15,493 @@ class ReportGenerator(ABC):
     Абстрактный базовый класс для генераторов отчетов.
     """
     
+    # Колонки входных данных, которые использует генератор. Читатель CSV
+    # извлекает только их; None означает, что нужны все колонки
+    required_columns: Optional[Tuple[str, ...]] = None
+    
+    # Сборщик предупреждений о некорректных данных. Назначается после
+    # создания генератора; если не назначен, предупреждения выводятся сразу
+    diagnostics: Optional[Diagnostics] = None
+    
+    def __init__(self, include_items: bool = True) -> None:
+        """
+        Args:
+            include_items: Строить ли элементы отчета по каждому сотруднику.
+                Если False, генераторы, поддерживающие этот режим, вычисляют
+                только итоговые значения
+        """
+        self.include_items = include_items
+    
     @abstractmethod
-    def generate(self, employees_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate(self, employees_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Генерирует отчет на основе данных сотрудников.
         
         Args:
-            employees_data: Список словарей с данными сотрудников
+            employees_data: Итерируемый набор словарей с данными сотрудников.
+                Может быть ленивым генератором и обходится ровно один раз.
             
         Returns:
             Словарь с данными отчета
         """
         pass
+    
+    def generate_stream(self, employees_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Генерирует отчет, элементы которого могут вычисляться лениво.
+        
+        Значение 'items' может быть итератором, а значения следующих за ним
+        ключей - функциями без аргументов, которые вызываются после обхода
+        элементов. Такой отчет записывается форматером по мере вычисления
+        (см. ReportFormatter.write). По умолчанию отчет строится целиком.
+        
+        Args:
+            employees_data: Итерируемый набор словарей с данными сотрудников
+            
+        Returns:
+            Словарь с данными отчета
+        """
+        return self.generate(employees_data)
+    
+    def merge(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Объединяет частичные отчеты, построенные по разным частям данных.
+        
+        По умолчанию элементы отчетов объединяются в исходном порядке,
+        а итоги суммируются.
+        
+        Args:
+            reports: Частичные отчеты в порядке следования данных
+            
+        Returns:
+            Словарь с данными объединенного отчета
+        """
+        if not reports:
+            return self.generate([])
+        
+        merged = dict(reports[0])
+        merged['items'] = []
+        merged['total'] = 0
+        
+        for report_data in reports:
+            merged['items'].extend(report_data['items'])
+            merged['total'] += report_data['total']
+        
+        return merged
+
+
+class PayoutColumns(NamedTuple):
+    """
+    Пакет вычисленных выплат в колоночном виде.
+    """
+    names: Sequence[str]
+    departments: Sequence[str]
+    hours: Sequence[float]
+    rates: Sequence[float]
+    amounts: Sequence[float]
 
 
 class PayoutReportGenerator(ReportGenerator):
     """
     Генератор отчетов по заработной плате.
+    
+    Вычисления выполняются над колонками: строки обрабатываются пакетами,
+    значения часов и ставок преобразуются в числа целиком, а суммы и итог
+    считаются векторно (через NumPy, если он установлен).
     """
     
-    def generate(self, employees_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    required_columns = TABLE_COLUMNS
+    
+    # Количество строк, обрабатываемых за один проход по колонкам
+    batch_size = 8192
+    
+    def __init__(self, include_items: bool = True, top: Optional[int] = None, top_by: Optional[str] = None) -> None:
+        """
+        Args:
+            include_items: Строить ли элементы отчета по каждому сотруднику
+            top: Если указано, в отчет попадают только top записей с
+                наибольшими выплатами; итог по-прежнему считается по всем строкам
+            top_by: Поле, в пределах значений которого отбираются top записей
+                (например, 'department'). Без top не используется
+        """
+        super().__init__(include_items)
+        self.top = top
+        self.top_by = top_by
+    
+    def generate(self, employees_data: Union[EmployeeTable, Iterable[Dict[str, Any]]]) -> Dict[str, Any]:
         """
         Генерирует отчет по заработной плате.
         
         Args:
-            employees_data: Список словарей с данными сотрудников
+            employees_data: Колоночная таблица или итерируемый набор словарей
+                с данными сотрудников
             
         Returns:
             Словарь с данными отчета
         """
-        items = []
-        total_payout = 0
+        return materialize_report(self.generate_stream(employees_data))
+    
+    def generate_stream(self, employees_data: Union[EmployeeTable, Iterable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Генерирует отчет по заработной плате с ленивым списком элементов.
         
-        for employee in employees_data:
-            name = employee.get('name', '')
-            department = employee.get('department', '')
+        Элементы вычисляются пакетами по мере обхода 'items', итог
+        доступен после того, как все элементы получены. Если генератор
+        создан с include_items=False, элементы не строятся вовсе, а 'items'
+        остается пустым. Если задан top, во время обхода хранятся только
+        ограниченные кучи лучших записей, и элементы выдаются после
+        просмотра всех данных.
+        
+        Args:
+            employees_data: Колоночная таблица или итерируемый набор словарей
+                с данными сотрудников
             
-            try:
-                hours_worked = float(employee.get('hours_worked', 0))
-                
-                # Проверяем разные возможные названия колонки со ставкой
-                rate = 0
-                for rate_key in ['hourly_rate', 'rate', 'salary']:
-                    if rate_key in employee:
-                        rate = float(employee[rate_key])
-                        break
+        Returns:
+            Словарь с данными отчета, где 'items' - итератор, а 'total' -
+            функция без аргументов
+        """
+        state = {'total': 0}
+        
+        def iter_items() -> Iterator[Dict[str, Any]]:
+            if self.top is not None and self.include_items:
+                selector = TopNSelector(self.top, self.top_by)
                 
-                amount = hours_worked * rate
-                total_payout += amount
+                for columns, total in self.iter_column_batches(employees_data):
+                    state['total'] = total
+                    selector.add_columns(*columns)
                 
-                employee_item = {
-                    'name': name,
-                    'department': department,
-                    'hours': hours_worked,
-                    'rate': rate,
-                    'amount': amount
-                }
+                yield from selector.items()
+                return
+            
+            for columns, total in self.iter_column_batches(employees_data):
+                state['total'] = total
                 
-                items.append(employee_item)
-            except (ValueError, TypeError) as e:
-                print(f"Ошибка обработки данных для {name}: {str(e)}")
+                if self.include_items:
+                    yield from self._build_items(columns)
         
         return {
             'report_type': 'payout',
-            'items': items,
-            'total': total_payout
+            'items': iter_items(),
+            'total': lambda: state['total']
         }
+    
+    def merge(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Объединяет частичные отчеты по заработной плате.
+        
+        Если задан top, лучшие записи отбираются заново среди лучших
+        записей частичных отчетов.
+        
+        Args:
+            reports: Частичные отчеты в порядке следования данных
+            
+        Returns:
+            Словарь с данными объединенного отчета
+        """
+        merged = super().merge(reports)
+        
+        if self.top is not None and reports:
+            selector = TopNSelector(self.top, self.top_by)
+            selector.add_items(merged['items'])
+            merged['items'] = selector.items()
+        
+        return merged
+    
+    def iter_column_batches(self, employees_data: Union[EmployeeTable, Iterable[Dict[str, Any]]]
+                            ) -> Iterator[Tuple[PayoutColumns, float]]:
+        """
+        Вычисляет выплаты пакетами в колоночном виде, не создавая элементов отчета.
+        
+        Используется также генераторами, которые агрегируют выплаты
+        и не нуждаются в элементах по каждому сотруднику.
+        
+        Args:
+            employees_data: Колоночная таблица или итерируемый набор словарей
+                с данными сотрудников
+            
+        Yields:
+            Кортежи (колонки пакета, итог с учетом пакета)
+        """
+        total = 0
+        
+        if isinstance(employees_data, EmployeeTable):
+            departments = employees_data.departments
+            
+            for start in range(0, len(employees_data), self.batch_size):
+                window = slice(start, start + self.batch_size)
+                hours, rates = employees_data.hours[window], employees_data.rates[window]
+                amounts, total = compute_amounts(hours, rates, total)
+                
+                columns = PayoutColumns(employees_data.names[window],
+                                        [departments[code] for code in employees_data.department_codes[window]],
+                                        hours, rates, amounts)
+                yield columns, total
+        else:
+            for batch in _iter_batches(employees_data, self.batch_size):
+                columns, total = self._process_batch(batch, total)
+                yield columns, total
+    
+    def _process_batch(self, batch: List[Dict[str, Any]], total: float) -> Tuple[PayoutColumns, float]:
+        """
+        Преобразует пакет строк в колонки и вычисляет выплаты.
+        
+        Args:
+            batch: Пакет словарей с данными сотрудников
+            total: Итог, накопленный по предыдущим пакетам
+            
+        Returns:
+            Кортеж (колонки пакета, новый итог)
+        """
+        names = [employee.get('name', '') for employee in batch]
+        departments = [employee.get('department', '') for employee in batch]
+        hours_values = [employee.get('hours_worked', 0) for employee in batch]
+        rate_values = _extract_rates(batch)
+        
+        hours, rates, errors = parse_float_columns(hours_values, rate_values)
+        
+        if errors:
+            for index, error in errors:
+                if self.diagnostics is not None:
+                    self.diagnostics.add(None, INVALID_VALUE, f"{names[index]}: {str(error)}")
+                else:
+                    print(f"Ошибка обработки данных для {names[index]}: {str(error)}")
+            
+            invalid = {index for index, _ in errors}
+            names = [name for index, name in enumerate(names) if index not in invalid]
+            departments = [department for index, department in enumerate(departments) if index not in invalid]
+        
+        amounts, total = compute_amounts(hours, rates, total)
+        
+        return PayoutColumns(names, departments, hours, rates, amounts), total
+    
+    @staticmethod
+    def _build_items(columns: PayoutColumns) -> Iterator[Dict[str, Any]]:
+        """
+        Формирует элементы отчета из колонок.
+        
+        Args:
+            columns: Колонки пакета
+            
+        Yields:
+            Элементы отчета по сотрудникам
+        """
+        for name, department, hours_worked, rate, amount in zip(*columns):
+            yield {
+                'name': name,
+                'department': department,
+                'hours': hours_worked,
+                'rate': rate,
+                'amount': amount
+            }
+
+
+def materialize_report(report_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Вычисляет ленивые значения отчета.
+    
+    Значения обходятся в порядке ключей: итераторы превращаются в списки,
+    функции без аргументов вызываются. Поэтому значение-функция, например
+    итог, может опираться на уже полученные элементы.
+    
+    Args:
+        report_data: Словарь с данными отчета, возможно с ленивыми значениями
+        
+    Returns:
+        Словарь с данными отчета без ленивых значений
+    """
+    materialized = {}
+    
+    for key, value in report_data.items():
+        if isinstance(value, Iterator):
+            value = list(value)
+        elif callable(value):
+            value = value()
+        
+        materialized[key] = value
+    
+    return materialized
+
+
+def _iter_batches(employees_data: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Разбивает поток строк на пакеты фиксированного размера.
+    
+    Args:
+        employees_data: Итерируемый набор словарей с данными сотрудников
+        batch_size: Размер пакета
+        
+    Yields:
+        Списки словарей длиной не более batch_size
+    """
+    iterator = iter(employees_data)
+    
+    while True:
+        batch = list(islice(iterator, batch_size))
+        
+        if not batch:
+            return
+        
+        yield batch
+
+
+def _extract_rates(batch: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Извлекает значения ставки из пакета строк.
+    
+    Колонка со ставкой определяется заново, только когда набор ключей строки
+    перестает ей соответствовать, то есть фактически один раз на файл.
+    
+    Args:
+        batch: Пакет словарей с данными сотрудников
+        
+    Returns:
+        Значения ставки (0, если колонка со ставкой отсутствует)
+    """
+    rate_values = []
+    rate_key = None
+    preceding_keys: tuple = ()
+    
+    for employee in batch:
+        if rate_key is None or rate_key not in employee or any(key in employee for key in preceding_keys):
+            rate_key = resolve_rate_column(employee)
+            preceding_keys = RATE_COLUMNS[:RATE_COLUMNS.index(rate_key)] if rate_key else ()
+        
+        rate_values.append(employee[rate_key] if rate_key else 0)
+    
+    return rate_values
 
 
 class ReportFactory:
     """
     Фабрика для создания генераторов отчетов.
+    
+    Генератор регистрируется классом или путем к нему вида
+    'пакет.модуль:Класс'; модуль по пути импортируется только при первом
+    обращении к отчету этого типа. Отчеты, не зарегистрированные явно,
+    ищутся среди точек входа GENERATORS_ENTRY_POINT установленных пакетов.
     """
     
-    _generators: Dict[str, Type[ReportGenerator]] = {
+    GENERATORS_ENTRY_POINT = 'reports.generators'
+    
+    _generators: Dict[str, Union[Type[ReportGenerator], str]] = {
         'payout': PayoutReportGenerator,
+        'department': 'src.reports.department_report:DepartmentReportGenerator',
     }
     
     @classmethod
-    def register_generator(cls, report_type: str, generator_class: Type[ReportGenerator]) -> None:
+    def register_generator(cls, report_type: str, generator_class: Union[Type[ReportGenerator], str]) -> None:
         """
         Регистрирует новый тип генератора отчетов.
         
         Args:
             report_type: Название типа отчета
-            generator_class: Класс генератора отчетов
+            generator_class: Класс генератора отчетов или путь к нему
+                вида 'пакет.модуль:Класс'
         """
         cls._generators[report_type] = generator_class
     
     @classmethod
-    def get_generator(cls, report_type: str) -> Optional[ReportGenerator]:
+    def get_generator_class(cls, report_type: str) -> Optional[Type[ReportGenerator]]:
+        """
+        Возвращает класс генератора для заданного типа, импортируя его при первом обращении.
+        
+        Args:
+            report_type: Тип отчета
+            
+        Returns:
+            Класс генератора отчетов или None, если тип не поддерживается
+        """
+        generator_class = cls._generators.get(report_type)
+        
+        if generator_class is None:
+            generator_class = load_entry_point(cls.GENERATORS_ENTRY_POINT, report_type)
+        elif isinstance(generator_class, str):
+            generator_class = load_object(generator_class)
+        
+        if generator_class is not None:
+            cls._generators[report_type] = generator_class
+        
+        return generator_class
+    
+    @classmethod
+    def get_generator(cls, report_type: str, **options: Any) -> Optional[ReportGenerator]:
         """
         Возвращает генератор отчетов для заданного типа.
         
         Args:
             report_type: Тип отчета
+            **options: Параметры конструктора генератора (например, include_items)
             
         Returns:
             Экземпляр генератора отчетов или None, если тип не поддерживается
         """
-        generator_class = cls._generators.get(report_type)
+        generator_class = cls.get_generator_class(report_type)
         
         if generator_class:
-            return generator_class()
+            return generator_class(**options)
+        
+        return None 
+    
+    @classmethod
+    def get_unsupported_options(cls, report_type: str, options: Dict[str, Any]) -> List[str]:
+        """
+        Возвращает параметры, которые не принимает конструктор генератора заданного типа.
+        
+        Поддержка проверяется по сигнатуре конструктора заранее, а не по
+        TypeError при создании генератора, чтобы не скрывать ошибки внутри
+        конструктора.
+        
+        Args:
+            report_type: Тип отчета
+            options: Параметры конструктора генератора
+            
+        Returns:
+            Список названий неподдерживаемых параметров (пустой, если тип
+            не поддерживается)
+        """
+        generator_class = cls.get_generator_class(report_type)
+        
+        if generator_class is None:
+            return []
+        
+        from inspect import Parameter, signature
+        
+        parameters = signature(generator_class).parameters
+        
+        if any(parameter.kind is Parameter.VAR_KEYWORD for parameter in parameters.values()):
+            return []
+        
+        return [name for name in options if name not in parameters]
+    
+    @classmethod
+    def get_required_columns(cls, report_type: str) -> Optional[Tuple[str, ...]]:
+        """
+        Возвращает колонки входных данных, нужные генератору заданного типа.
+        
+        Args:
+            report_type: Тип отчета
+            
+        Returns:
+            Кортеж названий колонок или None, если нужны все колонки
+            или тип не поддерживается
+        """
+        generator_class = cls.get_generator_class(report_type)
+        
+        if generator_class:
+            return generator_class.required_columns
+        
+        return None
+    
+    
+    @classmethod
+    def get_report_types(cls) -> List[str]:
+        """
+        Возвращает зарегистрированные типы отчетов, включая точки входа установленных пакетов.
+        
+        Returns:
+            Список типов отчетов
+        """
+        report_types = list(cls._generators)
+        report_types.extend(name for name in entry_point_names(cls.GENERATORS_ENTRY_POINT) if name not in report_types)
         
-        return None 
\ No newline at end of file
+        return report_types
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+import heapq
+from typing import Dict, Any, Hashable, Iterable, List, Optional, Tuple
+
+
+class TopNSelector:
+    """
+    Отбор N самых больших выплат с помощью ограниченных куч.
+    
+    Для каждой группы (или для всех данных, если группировка не задана)
+    хранится мин-куча не более чем из N записей, поэтому память равна
+    O(N × число групп), а не числу строк. Элемент отчета создается только
+    для строки, которая попадает в кучу. При равных суммах выше остается
+    строка, встретившаяся раньше.
+    """
+    
+    def __init__(self, limit: int, group_by: Optional[str] = None) -> None:
+        """
+        Args:
+            limit: Количество отбираемых записей в каждой группе
+            group_by: Поле, по которому записи группируются. Поддерживается
+                'department'; если не указано, отбор общий
+        """
+        self.limit = limit
+        self.group_by = group_by
+        self._heaps: Dict[Hashable, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self._seq = 0
+    
+    def _slot(self, group: Hashable, amount: float) -> Optional[List[Tuple[float, int, Dict[str, Any]]]]:
+        """
+        Проверяет, попадает ли очередная запись в кучу группы.
+        
+        Args:
+            group: Ключ группы
+            amount: Сумма выплаты
+            
+        Returns:
+            Куча группы, если запись в нее попадает, иначе None
+        """
+        self._seq += 1
+        heap = self._heaps.get(group)
+        
+        if heap is None:
+            heap = self._heaps[group] = []
+        
+        if len(heap) < self.limit or (amount, -self._seq) > heap[0][:2]:
+            return heap
+        
+        return None
+    
+    def _push(self, heap: List[Tuple[float, int, Dict[str, Any]]], amount: float, item: Dict[str, Any]) -> None:
+        """
+        Помещает запись в кучу, вытесняя наименьшую при заполненной куче.
+        
+        Args:
+            heap: Куча группы, полученная через _slot
+            amount: Сумма выплаты
+            item: Элемент отчета
+        """
+        entry = (amount, -self._seq, item)
+        
+        if len(heap) < self.limit:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heapreplace(heap, entry)
+    
+    def add_columns(self, names: Iterable[str], departments: Iterable[str], hours: Iterable[float],
+                    rates: Iterable[float], amounts: Iterable[float]) -> None:
+        """
+        Добавляет пакет выплат в колоночном виде.
+        
+        Args:
+            names: Имена сотрудников
+            departments: Отделы
+            hours: Отработанные часы
+            rates: Ставки
+            amounts: Суммы выплат
+        """
+        if self.limit <= 0:
+            return
+        
+        by_department = self.group_by == 'department'
+        
+        for name, department, hours_worked, rate, amount in zip(names, departments, hours, rates, amounts):
+            heap = self._slot(department if by_department else None, amount)
+            
+            if heap is not None:
+                self._push(heap, amount, {
+                    'name': name,
+                    'department': department,
+                    'hours': hours_worked,
+                    'rate': rate,
+                    'amount': amount
+                })
+    
+    def add_items(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет готовые элементы отчета, например из частичных отчетов.
+        
+        Args:
+            items: Элементы отчета
+        """
+        if self.limit <= 0:
+            return
+        
+        for item in items:
+            amount = item.get('amount', 0)
+            heap = self._slot(item.get(self.group_by) if self.group_by else None, amount)
+            
+            if heap is not None:
+                self._push(heap, amount, item)
+    
+    def items(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает отобранные элементы.
+        
+        Группы упорядочены по ключу, чтобы результат не зависел от того,
+        читались ли данные одним проходом или частями; внутри группы
+        элементы упорядочены по убыванию суммы.
+        
+        Returns:
+            Список элементов отчета
+        """
+        result = []
+        
+        for group in sorted(self._heaps, key=str):
+            result.extend(item for _, _, item in sorted(self._heaps[group], reverse=True))
+        
+        return result
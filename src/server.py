@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from src.reports.formatters import FormatterFactory, ReportFormatter
+from src.reports.report_generator import ReportFactory, ReportGenerator
+from src.utils.compression import codec_error, strip_compression_suffix
+from src.utils.csv_reader import CSVReader
+from src.utils.diagnostics import Diagnostics, DEFAULT_MAX_EXAMPLES
+from src.utils.employee_table import EmployeeTable, TABLE_COLUMNS
+from src.utils.external_sort import sort_items
+from src.utils.schema import DEFAULT_SCHEMA
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+
+# Предельный размер кэша разобранных файлов в памяти по умолчанию в байтах
+DEFAULT_MEMORY_CACHE_SIZE = 512 * 1024 * 1024
+
+# Размер фрагмента ответа, который передается клиенту за один раз
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Количество фрагментов ответа, ожидающих отправки; когда клиент читает
+# медленно, запись отчета приостанавливается
+STREAM_QUEUE_SIZE = 16
+
+# Время ожидания заголовков запроса в секундах и их предельное количество
+REQUEST_TIMEOUT = 30
+MAX_HEADERS = 100
+
+CONTENT_TYPES = {
+    'json': 'application/json; charset=utf-8',
+    'text': 'text/plain; charset=utf-8',
+    'columnar': 'application/octet-stream',
+    'arrow': 'application/vnd.apache.arrow.file',
+}
+
+
+class RequestError(Exception):
+    """
+    Некорректный запрос; сообщение передается клиенту с кодом status.
+    """
+    
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class TableCache:
+    """
+    LRU кэш разобранных файлов в памяти.
+    
+    Хранит колоночные таблицы сотрудников вместе с предупреждениями,
+    собранными при разборе. Запись действительна, пока не изменились время
+    изменения и размер файла. При превышении предельного размера
+    вытесняются записи, которые дольше всего не использовались.
+    """
+    
+    def __init__(self, max_size: int = DEFAULT_MEMORY_CACHE_SIZE) -> None:
+        """
+        Args:
+            max_size: Предельный размер кэша в байтах
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Tuple[Tuple[int, int], EmployeeTable, Diagnostics, int]]' = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def file_version(file_path: str) -> Tuple[int, int]:
+        """
+        Возвращает версию файла: время изменения и размер.
+        
+        Args:
+            file_path: Путь к файлу
+            
+        Returns:
+            Кортеж (время изменения в наносекундах, размер)
+        """
+        stat = os.stat(file_path)
+        
+        return stat.st_mtime_ns, stat.st_size
+    
+    def get(self, file_path: str) -> Optional[Tuple[EmployeeTable, Diagnostics]]:
+        """
+        Возвращает таблицу файла, если она есть в кэше и файл не изменился.
+        
+        Args:
+            file_path: Абсолютный путь к файлу
+            
+        Returns:
+            Кортеж (таблица, предупреждения разбора) или None
+        """
+        entry = self._entries.get(file_path)
+        
+        if entry is None or entry[0] != self.file_version(file_path):
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(file_path)
+        self.hits += 1
+        
+        return entry[1], entry[2]
+    
+    def put(self, file_path: str, version: Tuple[int, int], table: EmployeeTable,
+            diagnostics: Diagnostics) -> None:
+        """
+        Сохраняет таблицу файла и вытесняет давно не использовавшиеся записи.
+        
+        Таблица больше предельного размера кэша не сохраняется.
+        
+        Args:
+            file_path: Абсолютный путь к файлу
+            version: Версия файла, по которой он был разобран
+            table: Таблица с данными сотрудников
+            diagnostics: Предупреждения, собранные при разборе
+        """
+        self.discard(file_path)
+        size = table.memory_size()
+        
+        if size > self.max_size:
+            return
+        
+        self._entries[file_path] = (version, table, diagnostics, size)
+        self.size += size
+        
+        while self.size > self.max_size:
+            self.discard(next(iter(self._entries)))
+    
+    def discard(self, file_path: str) -> None:
+        """
+        Удаляет запись файла, если она есть.
+        
+        Args:
+            file_path: Абсолютный путь к файлу
+        """
+        entry = self._entries.pop(file_path, None)
+        
+        if entry is not None:
+            self.size -= entry[3]
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику кэша.
+        
+        Returns:
+            Словарь с количеством записей, размером, попаданиями и промахами
+        """
+        return {'entries': len(self), 'size': self.size, 'max_size': self.max_size,
+                'hits': self.hits, 'misses': self.misses}
+
+
+class _StreamWriter:
+    """
+    Поток, передающий записанный отчет в очередь событийного цикла.
+    
+    Используется из рабочего потока и принимает как строки текстовых
+    форматеров, так и байты двоичных: данные накапливаются и передаются
+    фрагментами по STREAM_CHUNK_SIZE байт. Когда очередь заполнена,
+    запись блокируется до отправки фрагментов клиенту.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: 'asyncio.Queue[Optional[bytes]]') -> None:
+        self.loop = loop
+        self.queue = queue
+        self.closed = False
+        self._buffer: List[bytes] = []
+        self._size = 0
+    
+    def write(self, data: Union[str, bytes]) -> int:
+        chunk = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+        self._buffer.append(chunk)
+        self._size += len(chunk)
+        
+        if self._size >= STREAM_CHUNK_SIZE:
+            self.flush()
+        
+        return len(data)
+    
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        
+        if self.closed:
+            raise ConnectionError("Клиент закрыл соединение")
+        
+        data = b''.join(self._buffer)
+        self._buffer = []
+        self._size = 0
+        self._put(data)
+    
+    def finish(self) -> None:
+        """
+        Сообщает об окончании отчета.
+        """
+        self._put(None)
+    
+    def _put(self, item: Optional[bytes]) -> None:
+        asyncio.run_coroutine_threadsafe(self.queue.put(item), self.loop).result()
+
+
+class ReportServer:
+    """
+    Сервер отчетов, сохраняющий разобранные файлы между запросами.
+    
+    Отвечает на HTTP запросы
+        
+        GET /report?report=payout&format=json&file=data1.csv&file=data2.csv
+    
+    Файлы указываются относительно корневого каталога и разбираются в
+    колоночные таблицы, которые хранятся в LRU кэше в памяти, поэтому
+    повторные запросы по неизмененным файлам не читают их заново.
+    Разбор и построение отчетов выполняются в пуле потоков, одновременные
+    запросы одного файла ожидают один разбор. Отчет передается клиенту по
+    мере форматирования. GET /health возвращает статистику кэша.
+    """
+    
+    def __init__(self, root: str = '.', cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
+                 max_warnings: int = DEFAULT_MAX_EXAMPLES, executor: Optional[Executor] = None) -> None:
+        """
+        Args:
+            root: Каталог, файлы из которого доступны для отчетов
+            cache_size: Предельный размер кэша разобранных файлов в байтах
+            max_warnings: Количество примеров в сводке предупреждений
+            executor: Пул для разбора файлов и построения отчетов (по
+                умолчанию пул потоков)
+        """
+        self.root = os.path.realpath(root)
+        self.cache = TableCache(cache_size)
+        self.max_warnings = max_warnings
+        self.executor = executor or ThreadPoolExecutor(thread_name_prefix='reports-server')
+        self._loading: Dict[str, 'asyncio.Future[Tuple[EmployeeTable, Diagnostics]]'] = {}
+    
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """
+        Запускает сервер на TCP порту.
+        
+        Args:
+            host: Адрес для подключений
+            port: Порт (0 - выбрать свободный)
+            
+        Returns:
+            Запущенный сервер asyncio
+        """
+        return await asyncio.start_server(self.handle, host, port)
+    
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Запускает сервер на Unix сокете.
+        
+        Args:
+            path: Путь к сокету
+            
+        Returns:
+            Запущенный сервер asyncio
+        """
+        return await asyncio.start_unix_server(self.handle, path)
+    
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обрабатывает одно соединение: читает запрос и отправляет ответ.
+        
+        Args:
+            reader: Поток чтения соединения
+            writer: Поток записи соединения
+        """
+        started = time.perf_counter()
+        target = ''
+        status = HTTPStatus.OK
+        
+        try:
+            method, target = await asyncio.wait_for(self._read_request(reader), REQUEST_TIMEOUT)
+            
+            if method != 'GET':
+                raise RequestError(f"Метод {method} не поддерживается", HTTPStatus.METHOD_NOT_ALLOWED)
+            
+            url = urlsplit(target)
+            query = parse_qs(url.query, keep_blank_values=True)
+            
+            if url.path == '/report':
+                await self._send_report(writer, query)
+            elif url.path == '/health':
+                await self._send(writer, HTTPStatus.OK, 'application/json; charset=utf-8',
+                                 json.dumps({'status': 'ok', 'cache': self.cache.stats()}, ensure_ascii=False))
+            else:
+                raise RequestError(f"Неизвестный путь {url.path}", HTTPStatus.NOT_FOUND)
+        except RequestError as e:
+            status = e.status
+            await self._send_error(writer, status, str(e))
+        except asyncio.TimeoutError:
+            status = HTTPStatus.REQUEST_TIMEOUT
+            await self._send_error(writer, status, "Превышено время ожидания запроса")
+        except ConnectionError:
+            status = HTTPStatus.BAD_REQUEST
+        except Exception as e:
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            print(f"Ошибка при обработке запроса {target}: {str(e)}", file=sys.stderr)
+            await self._send_error(writer, status, f"Ошибка при генерации отчета: {str(e)}")
+        finally:
+            writer.close()
+        
+        print(f"{target} {status.value} {(time.perf_counter() - started) * 1000:.1f} мс", file=sys.stderr)
+    
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str]:
+        """
+        Читает строку запроса и пропускает заголовки.
+        
+        Args:
+            reader: Поток чтения соединения
+            
+        Returns:
+            Кортеж (метод, путь с параметрами)
+            
+        Raises:
+            RequestError: Если запрос некорректен
+        """
+        request_line = (await reader.readline()).decode('latin-1').split()
+        
+        if len(request_line) != 3:
+            raise RequestError("Некорректная строка запроса")
+        
+        for _ in range(MAX_HEADERS):
+            if (await reader.readline()).strip() == b'':
+                return request_line[0], request_line[1]
+        
+        raise RequestError("Слишком много заголовков", HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+    
+    def resolve_file(self, name: str) -> str:
+        """
+        Проверяет файл из запроса и возвращает его абсолютный путь.
+        
+        Args:
+            name: Путь к файлу относительно корневого каталога
+            
+        Returns:
+            Абсолютный путь к файлу
+            
+        Raises:
+            RequestError: Если файл вне корневого каталога, не существует
+                или не имеет расширения CSV
+        """
+        file_path = os.path.realpath(os.path.join(self.root, name))
+        
+        if os.path.commonpath([self.root, file_path]) != self.root:
+            raise RequestError(f"Файл {name} находится вне корневого каталога сервера", HTTPStatus.FORBIDDEN)
+        
+        if not strip_compression_suffix(file_path).lower().endswith('.csv'):
+            raise RequestError(f"Файл {name} не имеет расширения CSV")
+        
+        error = codec_error(file_path)
+        
+        if error:
+            raise RequestError(f"Файл {name} не может быть прочитан: {error}", HTTPStatus.NOT_IMPLEMENTED)
+        
+        if not os.path.isfile(file_path):
+            raise RequestError(f"Файл {name} не существует", HTTPStatus.NOT_FOUND)
+        
+        return file_path
+    
+    async def load_table(self, file_path: str, diagnostics: Diagnostics) -> EmployeeTable:
+        """
+        Возвращает таблицу файла из кэша или разбирает файл в пуле потоков.
+        
+        Args:
+            file_path: Абсолютный путь к CSV файлу
+            diagnostics: Сборщик предупреждений запроса
+            
+        Returns:
+            Таблица с данными сотрудников
+        """
+        cached = self.cache.get(file_path)
+        
+        if cached is None:
+            loading = self._loading.get(file_path)
+            
+            if loading is None:
+                loading = asyncio.ensure_future(self._parse(file_path))
+                self._loading[file_path] = loading
+                loading.add_done_callback(lambda _: self._loading.pop(file_path, None))
+            
+            cached = await asyncio.shield(loading)
+        
+        table, file_diagnostics = cached
+        diagnostics.merge(file_diagnostics)
+        
+        return table
+    
+    async def _parse(self, file_path: str) -> Tuple[EmployeeTable, Diagnostics]:
+        """
+        Разбирает файл в пуле потоков и сохраняет таблицу в кэше.
+        
+        Args:
+            file_path: Абсолютный путь к CSV файлу
+            
+        Returns:
+            Кортеж (таблица, предупреждения разбора)
+        """
+        version = self.cache.file_version(file_path)
+        file_diagnostics = Diagnostics(self.max_warnings)
+        table = await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(CSVReader.read_table, file_path, diagnostics=file_diagnostics))
+        
+        self.cache.put(file_path, version, table, file_diagnostics)
+        
+        return table, file_diagnostics
+    
+    @staticmethod
+    def parse_options(query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Проверяет параметры отчета из запроса.
+        
+        Args:
+            query: Параметры запроса
+            
+        Returns:
+            Словарь с типом отчета, форматом, файлами, параметрами
+            генератора и сортировки
+            
+        Raises:
+            RequestError: Если параметры некорректны
+        """
+        def value(name: str, default: Optional[str] = None) -> Optional[str]:
+            return query.get(name, [default])[-1]
+        
+        report_type = value('report')
+        format_type = value('format', 'json')
+        
+        if ReportFactory.get_generator_class(report_type) is None:
+            raise RequestError(f"Неподдерживаемый тип отчета '{report_type}'. "
+                               f"Поддерживаемые типы: {', '.join(ReportFactory.get_report_types())}")
+        
+        if format_type not in CONTENT_TYPES:
+            raise RequestError(f"Неподдерживаемый формат вывода '{format_type}'. "
+                               f"Поддерживаемые форматы: {', '.join(CONTENT_TYPES)}")
+        
+        if not query.get('file'):
+            raise RequestError("Не указаны файлы с данными сотрудников (параметр file)")
+        
+        generator_options: Dict[str, Any] = {}
+        top = value('top')
+        top_by = value('by')
+        
+        if value('no_items') is not None:
+            generator_options['include_items'] = False
+        
+        if top is not None:
+            if not top.isdigit() or int(top) < 1:
+                raise RequestError("Количество записей top должно быть положительным")
+            
+            generator_options['top'] = int(top)
+        
+        if top_by is not None:
+            if top is None or top_by != 'department':
+                raise RequestError("Параметр by принимает значение department и используется только вместе с top")
+            
+            generator_options['top_by'] = top_by
+        
+        unsupported = ReportFactory.get_unsupported_options(report_type, generator_options)
+        
+        if unsupported:
+            parameters = {'include_items': 'no_items', 'top': 'top', 'top_by': 'by'}
+            raise RequestError(f"Отчет типа '{report_type}' не поддерживает параметры "
+                               f"{', '.join(parameters[name] for name in unsupported)}")
+        
+        return {
+            'report': report_type,
+            'format': format_type,
+            'files': query['file'],
+            'generator_options': generator_options,
+            'sort_by': value('sort_by'),
+            'sort_desc': value('sort_desc') is not None,
+        }
+    
+    async def _send_report(self, writer: asyncio.StreamWriter, query: Dict[str, List[str]]) -> None:
+        """
+        Строит отчет и отправляет его клиенту по мере форматирования.
+        
+        Args:
+            writer: Поток записи соединения
+            query: Параметры запроса
+        """
+        options = self.parse_options(query)
+        file_paths = [self.resolve_file(name) for name in options['files']]
+        
+        report_generator = ReportFactory.get_generator(options['report'], **options['generator_options'])
+        
+        try:
+            formatter = FormatterFactory.get_formatter(options['format'])
+        except ImportError as e:
+            raise RequestError(str(e), HTTPStatus.NOT_IMPLEMENTED) from None
+        
+        diagnostics = Diagnostics(self.max_warnings)
+        report_generator.diagnostics = diagnostics
+        
+        # Отчетам, которым достаточно колонок таблицы, данные передаются
+        # из кэша; остальные читают файлы построчно при записи отчета
+        required_columns = ReportFactory.get_required_columns(options['report'])
+        
+        if required_columns is not None and set(required_columns) <= set(TABLE_COLUMNS):
+            tables = [await self.load_table(file_path, diagnostics) for file_path in file_paths]
+            employees_data: Any = tables[0] if len(tables) == 1 else _concat_tables(tables)
+            
+            if not len(employees_data):
+                raise RequestError("Не удалось прочитать данные из указанных файлов", HTTPStatus.UNPROCESSABLE_ENTITY)
+        else:
+            employees_data = chain.from_iterable(
+                CSVReader.iter_rows(file_path, required_columns, schema=DEFAULT_SCHEMA, diagnostics=diagnostics)
+                for file_path in file_paths)
+        
+        loop = asyncio.get_running_loop()
+        queue: 'asyncio.Queue[Optional[bytes]]' = asyncio.Queue(STREAM_QUEUE_SIZE)
+        stream = _StreamWriter(loop, queue)
+        job = loop.run_in_executor(self.executor, _write_report, report_generator, formatter, employees_data,
+                                   options, stream)
+        
+        # Заголовки отправляются вместе с первым фрагментом, поэтому ошибка,
+        # возникшая до него, передается клиенту как ответ с ошибкой
+        chunk = await queue.get()
+        
+        if chunk is None:
+            await job
+        
+        writer.write(_headers(HTTPStatus.OK, CONTENT_TYPES[options['format']],
+                              {'X-Report-Warnings': str(diagnostics.total)}))
+        
+        try:
+            while chunk is not None:
+                writer.write(chunk)
+                await writer.drain()
+                chunk = await queue.get()
+        except ConnectionError:
+            # Клиент отключился: запись отчета прерывается на следующем
+            # фрагменте, оставшиеся фрагменты отбрасываются
+            stream.closed = True
+            
+            while await queue.get() is not None:
+                pass
+        
+        try:
+            await job
+        except ConnectionError:
+            pass
+        except Exception as e:
+            # Заголовки уже отправлены, поэтому ответ просто обрывается
+            print(f"Ошибка при генерации или форматировании отчета: {str(e)}", file=sys.stderr)
+    
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: HTTPStatus, content_type: str, body: str) -> None:
+        data = body.encode('utf-8')
+        writer.write(_headers(status, content_type, {'Content-Length': str(len(data))}) + data)
+        await writer.drain()
+    
+    async def _send_error(self, writer: asyncio.StreamWriter, status: HTTPStatus, message: str) -> None:
+        try:
+            await self._send(writer, status, CONTENT_TYPES['text'], message + '\n')
+        except ConnectionError:
+            pass
+
+
+def _write_report(report_generator: ReportGenerator, formatter: ReportFormatter, employees_data: Any,
+                  options: Dict[str, Any], stream: _StreamWriter) -> None:
+    """
+    Строит и форматирует отчет в рабочем потоке.
+    
+    Args:
+        report_generator: Генератор отчета
+        formatter: Форматер отчета
+        employees_data: Данные сотрудников
+        options: Параметры отчета из запроса
+        stream: Поток, передающий отчет клиенту
+    """
+    try:
+        report_data = report_generator.generate_stream(employees_data)
+        
+        if options['sort_by']:
+            report_data = dict(report_data)
+            report_data['items'] = sort_items(report_data['items'], options['sort_by'], reverse=options['sort_desc'])
+        
+        formatter.write(report_data, stream)
+        stream.flush()
+    finally:
+        stream.finish()
+
+
+def _concat_tables(tables: List[EmployeeTable]) -> EmployeeTable:
+    table = EmployeeTable()
+    
+    for other in tables:
+        table.extend(other)
+    
+    return table
+
+
+def _headers(status: HTTPStatus, content_type: str, extra: Dict[str, str]) -> bytes:
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Type: {content_type}", "Connection: close"]
+    lines.extend(f"{name}: {value}" for name, value in extra.items())
+    
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
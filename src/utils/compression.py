@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+import io
+import queue
+import threading
+from importlib.util import find_spec
+from typing import Any, BinaryIO, IO, Optional, Union
+
+
+# Расширения сжатых файлов и модули, которые их читают
+CODECS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'lzma',
+    '.zst': 'zstandard',
+}
+
+# Размер распакованного фрагмента, который фоновый поток передает читателю
+CHUNK_SIZE = 1024 * 1024
+
+# Количество фрагментов в очереди между фоновым потоком и читателем или
+# писателем; ограничивает память, занятую опережающей распаковкой
+QUEUE_SIZE = 8
+
+# Уровни сжатия выходных файлов: компромисс между временем и размером
+GZIP_LEVEL = 6
+BZ2_LEVEL = 9
+XZ_PRESET = 6
+ZSTD_LEVEL = 3
+
+# Интервал, с которым фоновый поток проверяет, не закрыт ли поток
+_POLL_INTERVAL = 0.1
+
+
+def compression_suffix(file_path: str) -> Optional[str]:
+    """
+    Возвращает расширение сжатия файла.
+    
+    Args:
+        file_path: Путь к файлу
+        
+    Returns:
+        Расширение из CODECS (например, '.gz') или None для несжатого файла
+    """
+    lower_path = file_path.lower()
+    
+    for suffix in CODECS:
+        if lower_path.endswith(suffix):
+            return suffix
+    
+    return None
+
+
+def is_compressed(file_path: str) -> bool:
+    return compression_suffix(file_path) is not None
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    """
+    Возвращает путь без расширения сжатия (data.csv.gz -> data.csv).
+    
+    Args:
+        file_path: Путь к файлу
+        
+    Returns:
+        Путь без расширения сжатия
+    """
+    suffix = compression_suffix(file_path)
+    
+    return file_path[:-len(suffix)] if suffix else file_path
+
+
+def codec_error(file_path: str) -> Optional[str]:
+    """
+    Проверяет, установлен ли модуль для сжатия файла.
+    
+    Args:
+        file_path: Путь к файлу
+        
+    Returns:
+        Сообщение об ошибке или None, если файл можно прочитать
+    """
+    suffix = compression_suffix(file_path)
+    
+    if suffix and find_spec(CODECS[suffix]) is None:
+        return f"для файлов {suffix} требуется пакет {CODECS[suffix]}"
+    
+    return None
+
+
+def _open_codec(file_path: str, mode: str) -> BinaryIO:
+    """
+    Открывает сжатый файл как двоичный поток распакованных данных.
+    
+    Модули сжатия импортируются при первом использовании.
+    
+    Args:
+        file_path: Путь к файлу
+        mode: 'rb' или 'wb'
+        
+    Returns:
+        Двоичный поток
+        
+    Raises:
+        ImportError: Если модуль сжатия не установлен
+    """
+    suffix = compression_suffix(file_path)
+    writing = 'w' in mode
+    
+    if suffix == '.gz':
+        import gzip
+        return gzip.open(file_path, mode, compresslevel=GZIP_LEVEL) if writing else gzip.open(file_path, mode)
+    
+    if suffix == '.bz2':
+        import bz2
+        return bz2.open(file_path, mode, compresslevel=BZ2_LEVEL) if writing else bz2.open(file_path, mode)
+    
+    if suffix == '.xz':
+        import lzma
+        return lzma.open(file_path, mode, preset=XZ_PRESET) if writing else lzma.open(file_path, mode)
+    
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"Для файлов {suffix} требуется пакет zstandard") from None
+    
+    if writing:
+        return zstandard.open(file_path, mode, cctx=zstandard.ZstdCompressor(level=ZSTD_LEVEL))
+    
+    return zstandard.open(file_path, mode)
+
+
+class BackgroundReader(io.RawIOBase):
+    """
+    Поток, читающий данные из другого потока в фоновом потоке.
+    
+    Распаковка выполняется фоновым потоком с опережением до QUEUE_SIZE
+    фрагментов; модули сжатия освобождают GIL во время распаковки, поэтому
+    она идет одновременно с разбором уже распакованных строк.
+    """
+    
+    def __init__(self, raw: BinaryIO, chunk_size: int = CHUNK_SIZE, queue_size: int = QUEUE_SIZE) -> None:
+        """
+        Args:
+            raw: Поток, из которого читаются данные; закрывается вместе с читателем
+            chunk_size: Размер фрагмента в байтах
+            queue_size: Количество фрагментов, прочитанных с опережением
+        """
+        super().__init__()
+        self._raw = raw
+        self._chunk_size = chunk_size
+        self._queue: 'queue.Queue[Union[bytes, BaseException, None]]' = queue.Queue(queue_size)
+        self._stop = threading.Event()
+        self._chunk = memoryview(b'')
+        self._position = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._run, name='reports-decompress', daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        try:
+            while True:
+                chunk = self._raw.read(self._chunk_size)
+                
+                if not chunk:
+                    break
+                
+                if not self._put(chunk):
+                    return
+            
+            self._put(None)
+        except BaseException as e:
+            self._put(e)
+    
+    def _put(self, item: Union[bytes, BaseException, None]) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        
+        return False
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer: Any) -> int:
+        while self._position >= len(self._chunk):
+            if self._eof:
+                return 0
+            
+            item = self._queue.get()
+            
+            if item is None:
+                self._eof = True
+                return 0
+            
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            
+            self._chunk = memoryview(item)
+            self._position = 0
+        
+        size = min(len(buffer), len(self._chunk) - self._position)
+        buffer[:size] = self._chunk[self._position:self._position + size]
+        self._position += size
+        
+        return size
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._raw.close()
+        
+        super().close()
+
+
+class BackgroundWriter(io.RawIOBase):
+    """
+    Поток, записывающий данные в другой поток в фоновом потоке.
+    
+    Используется для сжатия вывода: форматирование отчета продолжается,
+    пока фоновый поток сжимает и записывает предыдущие фрагменты.
+    Ошибка записи передается при следующей записи или при закрытии.
+    """
+    
+    def __init__(self, raw: BinaryIO, queue_size: int = QUEUE_SIZE, close_raw: bool = True) -> None:
+        """
+        Args:
+            raw: Поток, в который записываются данные
+            queue_size: Количество фрагментов, ожидающих записи
+            close_raw: Закрывать ли поток raw вместе с писателем; если нет,
+                при закрытии он только сбрасывается (например, sys.stdout.buffer)
+        """
+        super().__init__()
+        self._raw = raw
+        self._close_raw = close_raw
+        self._queue: 'queue.Queue[Optional[bytes]]' = queue.Queue(queue_size)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='reports-compress', daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            
+            if chunk is None:
+                return
+            
+            if self._error is None:
+                try:
+                    self._raw.write(chunk)
+                except BaseException as e:
+                    self._error = e
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: Any) -> int:
+        if self._error is not None:
+            raise self._error
+        
+        chunk = bytes(data)
+        self._queue.put(chunk)
+        
+        return len(chunk)
+    
+    def close(self) -> None:
+        if self.closed:
+            return
+        
+        self._queue.put(None)
+        self._thread.join()
+        
+        try:
+            if self._close_raw:
+                self._raw.close()
+            else:
+                self._raw.flush()
+        finally:
+            super().close()
+        
+        if self._error is not None:
+            raise self._error
+
+
+def open_input(file_path: str, binary: bool = False, background: bool = True, encoding: str = 'utf-8',
+               newline: Optional[str] = None) -> IO[Any]:
+    """
+    Открывает входной файл для чтения, распаковывая сжатые файлы на лету.
+    
+    Args:
+        file_path: Путь к файлу (.csv или сжатый: .gz, .bz2, .xz, .zst)
+        binary: Открыть ли файл в двоичном режиме
+        background: Распаковывать ли сжатый файл в фоновом потоке. Для
+            чтения нескольких строк (например, заголовка) удобнее без него
+        encoding: Кодировка текстового потока
+        newline: Режим переводов строк текстового потока, как в open
+        
+    Returns:
+        Текстовый или двоичный поток
+    """
+    if not is_compressed(file_path):
+        if binary:
+            return open(file_path, 'rb')
+        
+        return open(file_path, 'r', encoding=encoding, newline=newline)
+    
+    # Читатель zstandard не поддерживает readline, поэтому поток
+    # распаковки всегда оборачивается в буферизованный
+    stream = _open_codec(file_path, 'rb')
+    stream = io.BufferedReader(BackgroundReader(stream) if background else stream, CHUNK_SIZE)
+    
+    return stream if binary else io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+
+
+def open_output(file_path: str, binary: bool = False) -> IO[Any]:
+    """
+    Открывает выходной файл для записи; файл со сжатым расширением сжимается.
+    
+    Сжатие выполняется в фоновом потоке параллельно с форматированием.
+    
+    Args:
+        file_path: Путь к файлу (например, report.json или report.json.gz)
+        binary: Открыть ли файл в двоичном режиме
+        
+    Returns:
+        Текстовый поток в кодировке UTF-8 или двоичный поток
+    """
+    if not is_compressed(file_path):
+        return open(file_path, 'wb') if binary else open(file_path, 'w', encoding='utf-8')
+    
+    stream = io.BufferedWriter(BackgroundWriter(_open_codec(file_path, 'wb')), CHUNK_SIZE)
+    
+    return stream if binary else io.TextIOWrapper(stream, encoding='utf-8')
@@ -1,49 +1,770 @@
 #!/usr/bin/env python3
 import os
-from typing import List, Dict, Any
+import sys
+from itertools import chain, islice
+from typing import List, Dict, Any, Callable, Generator, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+from src.utils.compression import is_compressed, open_input
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE
+from src.utils.employee_table import EmployeeTable, TABLE_COLUMNS, resolve_rate_column
+from src.utils.schema import Schema, ConversionErrors, CONVERT_BATCH_SIZE, DEFAULT_SCHEMA
+
+
+# Обработчик некорректной строки: принимает номер строки и ее содержимое
+MalformedHandler = Callable[[int, str], None]
+
+# Диалекты CSV: simple - строка делится по разделителю без учета кавычек
+# (этот разбор допускает деление файла по байтовым диапазонам строк),
+# rfc4180 - поля в кавычках по RFC 4180, в том числе с разделителями
+# и переводами строк внутри, и файлы с BOM
+SIMPLE_DIALECT = 'simple'
+RFC4180_DIALECT = 'rfc4180'
+DIALECTS = (SIMPLE_DIALECT, RFC4180_DIALECT)
+
+# Если среди первых QUOTED_SAMPLE_LINES строк больше половины содержат
+# кавычки (например, выгрузка с кавычками вокруг каждого поля), остаток
+# файла целиком разбирается модулем csv без проверки каждой строки
+QUOTED_SAMPLE_LINES = 1024
+
+
+class CSVDialect(NamedTuple):
+    """
+    Параметры разбора CSV файла.
+    """
+    name: str = SIMPLE_DIALECT
+    delimiter: str = ','
+
+
+DEFAULT_DIALECT = CSVDialect()
 
 
 class CSVReader:
     """
     Класс для чтения данных из CSV файлов.
+    
+    Сжатые файлы (.gz, .bz2, .xz, .zst) читаются так же, как обычные:
+    они распаковываются в фоновом потоке по мере чтения. В диалекте
+    rfc4180 модулем csv разбираются только записи с кавычками, остальные
+    строки делятся так же, как в диалекте simple.
     """
     
     @staticmethod
-    def read_file(file_path: str) -> List[Dict[str, Any]]:
+    def project(header: List[str], columns: Optional[Sequence[str]]) -> Tuple[List[Tuple[str, int]], int]:
+        """
+        Определяет по заголовку, какие колонки нужно извлекать из строк.
+        
+        Args:
+            header: Заголовок файла
+            columns: Названия нужных колонок или None для всех колонок
+            
+        Returns:
+            Кортеж (пары (название, индекс) нужных колонок, максимальное
+            число разбиений строки; -1 означает разбиение целиком)
+        """
+        if columns is None:
+            return list(zip(header, range(len(header)))), -1
+        
+        keys = [(column, index) for index, column in enumerate(header) if column in columns]
+        max_split = keys[-1][1] + 1 if keys else 0
+        
+        return keys, max_split
+    
+    @staticmethod
+    def _split_lines(lines: Iterable[str], header_len: int, first_line_num: int,
+                     on_malformed: MalformedHandler, max_split: int = -1,
+                     delimiter: str = ',') -> Iterator[List[str]]:
+        """
+        Разбивает строки на значения, пропуская пустые и некорректные строки.
+        
+        Число значений проверяется подсчетом разделителей, поэтому строку
+        можно разбивать только до последней нужной колонки.
+        
+        Args:
+            lines: Строки файла
+            header_len: Количество колонок в заголовке
+            first_line_num: Номер первой строки
+            on_malformed: Обработчик строк, число значений в которых
+                не совпадает с заголовком
+            max_split: Максимальное число разбиений строки (-1 - без ограничений)
+            delimiter: Разделитель значений
+            
+        Yields:
+            Списки значений строк
+        """
+        separators = header_len - 1
+        
+        for line_num, line in enumerate(lines, start=first_line_num):
+            line = line.strip()
+            if line:
+                if line.count(delimiter) == separators:
+                    yield line.split(delimiter, max_split)
+                else:
+                    on_malformed(line_num, line)
+    
+    @staticmethod
+    def _split_quoted_lines(lines: Iterable[str], header_len: int, first_line_num: int,
+                            on_malformed: MalformedHandler, max_split: int = -1,
+                            delimiter: str = ',') -> Iterator[List[str]]:
+        """
+        Разбивает строки на значения по RFC 4180.
+        
+        Строки без кавычек (в выгрузках их обычно подавляющее большинство)
+        делятся по разделителю без модуля csv. Как и в модуле csv, от них
+        отрезается только перевод строки, а пробелы по краям значений
+        сохраняются независимо от того, есть ли в строке кавычки. Запись с кавычками
+        разбирается модулем csv, который сам забирает следующие строки
+        файла, если поле в кавычках содержит перевод строки. Если кавычки
+        есть в большинстве строк, остаток файла передается модулю csv
+        целиком. Номер записи в предупреждении - номер ее первой строки.
+        
+        Если кавычка не закрыта (поле продолжается до конца файла или
+        превышает csv.field_size_limit), первая строка записи учитывается
+        как некорректная, а поглощенные ею строки разбираются заново.
+        
+        Args:
+            lines: Строки файла, прочитанные с newline=''
+            header_len: Количество колонок в заголовке
+            first_line_num: Номер первой строки
+            on_malformed: Обработчик записей, число значений в которых
+                не совпадает с заголовком
+            max_split: Максимальное число разбиений строки без кавычек
+            delimiter: Разделитель значений
+            
+        Yields:
+            Списки значений записей
+        """
+        lines = iter(lines)
+        
+        while True:
+            unterminated = yield from CSVReader._split_quoted_part(lines, header_len, first_line_num, on_malformed,
+                                                                   max_split, delimiter)
+            
+            if unterminated is None:
+                return
+            
+            # Разбор продолжается со строки, следующей за незакрытой
+            # кавычкой. Поглощенных строк не больше, чем помещается
+            # в поле csv.field_size_limit
+            first_line_num, swallowed = unterminated
+            lines = chain(swallowed, lines)
+    
+    @staticmethod
+    def _split_quoted_part(lines: Iterator[str], header_len: int, first_line_num: int,
+                           on_malformed: MalformedHandler, max_split: int,
+                           delimiter: str) -> Generator[List[str], None, Optional[Tuple[int, List[str]]]]:
+        """
+        Разбирает строки по RFC 4180 до конца файла или до незакрытой кавычки.
+        
+        Args:
+            lines: Итератор строк файла
+            header_len: Количество колонок в заголовке
+            first_line_num: Номер первой строки
+            on_malformed: Обработчик некорректных записей
+            max_split: Максимальное число разбиений строки без кавычек
+            delimiter: Разделитель значений
+            
+        Yields:
+            Списки значений записей
+            
+        Returns:
+            None, если разобран весь файл, или кортеж (номер строки,
+            следующей за незакрытой кавычкой, строки, поглощенные записью)
+        """
+        # Модуль csv нужен только диалекту rfc4180 и импортируется при разборе
+        import csv
+        
+        pending: List[str] = []
+        # Строки файла, прочитанные csv.reader для текущей записи
+        record_lines: List[str] = []
+        end_of_file = False
+        
+        def quoted_lines() -> Iterator[str]:
+            nonlocal end_of_file
+            
+            # Первая строка записи передается через pending, продолжения
+            # поля с переводом строки читаются из общего итератора строк
+            while True:
+                if pending:
+                    line = pending.pop()
+                else:
+                    line = next(lines, None)
+                    
+                    if line is None:
+                        end_of_file = True
+                        return
+                
+                record_lines.append(line)
+                yield line
+        
+        records = csv.reader(quoted_lines(), delimiter=delimiter)
+        
+        def next_record() -> Optional[List[str]]:
+            # Возвращает запись, пустой список в конце файла или None,
+            # если кавычка записи не закрыта
+            record_lines.clear()
+            
+            try:
+                record = next(records)
+            except StopIteration:
+                return []
+            except csv.Error:
+                return None
+            
+            # Запись, на которой закончился файл, осталась внутри кавычек
+            return None if end_of_file else record
+        
+        def unterminated(line_num: int) -> Tuple[int, List[str]]:
+            on_malformed(line_num, f"незакрытая кавычка: {record_lines[0].strip()}")
+            return line_num + 1, record_lines[1:]
+        
+        separators = header_len - 1
+        # Строки продолжения полей в кавычках читает csv.reader, поэтому
+        # номер строки - номер в enumerate плюс число таких строк
+        continued = 0
+        quoted_count = 0
+        
+        for line_num, line in enumerate(lines, start=first_line_num):
+            if '"' not in line:
+                # Отрезается только перевод строки, как в модуле csv;
+                # строки из одних пробелов csv.reader тоже пропускает
+                line = line.rstrip('\r\n')
+                
+                if line.count(delimiter) == separators:
+                    if line:
+                        yield line.split(delimiter, max_split)
+                elif line.strip():
+                    on_malformed(line_num + continued, line)
+                
+                continue
+            
+            record_line_num = line_num + continued
+            pending.append(line)
+            record = next_record()
+            
+            if record is None:
+                return unterminated(record_line_num)
+            
+            continued += len(record_lines) - 1
+            
+            if len(record) == header_len:
+                yield record
+            elif _is_record(record):
+                on_malformed(record_line_num, delimiter.join(record))
+            
+            quoted_count += 1
+            lines_seen = line_num + continued - first_line_num + 1
+            
+            if lines_seen >= QUOTED_SAMPLE_LINES and quoted_count * 2 > lines_seen:
+                break
+        else:
+            return None
+        
+        # Остаток файла целиком разбирает csv.reader: запись разобрана
+        # полностью, поэтому он продолжает чтение прямо из файла
+        record_line_num = line_num + continued + 1
+        
+        while True:
+            record = next_record()
+            
+            if record is None:
+                return unterminated(record_line_num)
+            
+            if not record_lines:
+                return None
+            
+            if len(record) == header_len:
+                yield record
+            elif _is_record(record):
+                on_malformed(record_line_num, delimiter.join(record))
+            
+            record_line_num += len(record_lines)
+    
+    @staticmethod
+    def _iter_split_lines(file_path: str, columns: Optional[Sequence[str]] = None,
+                          diagnostics: Optional[Diagnostics] = None,
+                          dialect: CSVDialect = DEFAULT_DIALECT) -> Iterator[List[str]]:
+        """
+        Построчно читает CSV файл и разбивает строки на значения.
+        
+        Первым возвращается заголовок, затем только строки, число значений
+        в которых совпадает с заголовком. О некорректных строках выводится
+        предупреждение или они учитываются в сборщике предупреждений.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            columns: Названия нужных колонок. Строки разбиваются только до
+                последней из них; если не указаны, разбиваются целиком
+            diagnostics: Сборщик предупреждений о некорректных строках
+            dialect: Диалект CSV
+            
+        Yields:
+            Заголовок, затем списки значений строк
+        """
+        if not os.path.exists(file_path):
+            print(f"Ошибка: Файл {file_path} не найден")
+            return
+        
+        def warn_malformed(line_num: int, line: str) -> None:
+            if diagnostics is not None:
+                diagnostics.add(file_path, MALFORMED_LINE, f"строка {line_num}: {line}")
+            else:
+                print(f"Предупреждение: Некорректная строка {line_num} в файле {file_path}: {line}")
+        
+        try:
+            if dialect.name == RFC4180_DIALECT:
+                import csv
+                
+                # Переводы строк внутри кавычек сохраняются при newline=''.
+                # BOM отрезается от заголовка вручную: кодировка utf-8-sig
+                # декодируется заметно медленнее utf-8
+                with open_input(file_path, newline='') as file:
+                    header_line = file.readline().lstrip('\ufeff')
+                    
+                    if not header_line:
+                        print(f"Предупреждение: Файл {file_path} пуст")
+                        return
+                    
+                    header = next(csv.reader([header_line], delimiter=dialect.delimiter))
+                    yield header
+                    
+                    _, max_split = CSVReader.project(header, columns)
+                    yield from CSVReader._split_quoted_lines(file, len(header), 2, warn_malformed, max_split,
+                                                             dialect.delimiter)
+                return
+            
+            with open_input(file_path) as file:
+                header_line = file.readline()
+                
+                if not header_line:
+                    print(f"Предупреждение: Файл {file_path} пуст")
+                    return
+                
+                header = header_line.strip().split(dialect.delimiter)
+                yield header
+                
+                _, max_split = CSVReader.project(header, columns)
+                yield from CSVReader._split_lines(file, len(header), 2, warn_malformed, max_split, dialect.delimiter)
+        except Exception as e:
+            print(f"Ошибка при чтении файла {file_path}: {str(e)}")
+    
+    @staticmethod
+    def _iter_batches(lines: Iterable[List[str]]) -> Iterator[List[List[str]]]:
+        """
+        Разбивает поток строк на пакеты для преобразования колонок.
+        
+        Args:
+            lines: Списки значений строк
+            
+        Yields:
+            Пакеты списков значений
+        """
+        iterator = iter(lines)
+        
+        while True:
+            batch = list(islice(iterator, CONVERT_BATCH_SIZE))
+            
+            if not batch:
+                return
+            
+            yield batch
+    
+    @staticmethod
+    def _fill_table(header: List[str], lines: Iterable[List[str]], table: EmployeeTable,
+                    errors: ConversionErrors, schema: Schema = DEFAULT_SCHEMA) -> EmployeeTable:
+        """
+        Заполняет колоночную таблицу значениями строк.
+        
+        Значения преобразуются по схеме целыми колонками пакета строк,
+        колонка со ставкой определяется один раз по заголовку файла.
+        
+        Args:
+            header: Заголовок файла
+            lines: Списки значений строк
+            table: Таблица, в которую добавляются записи
+            errors: Сводка ошибок преобразования
+            schema: Схема типов колонок
+            
+        Returns:
+            Таблица с данными сотрудников
+        """
+        rate_column = resolve_rate_column(header)
+        columns = ('name', 'department', 'hours_worked', rate_column)
+        
+        for batch in CSVReader._iter_batches(lines):
+            converted = schema.convert(header, batch, [column for column in columns if column], errors)
+            count = len(next(iter(converted.values()))) if converted else len(batch)
+            
+            table.extend_columns(converted.get('name', [''] * count),
+                                 converted.get('department', [''] * count),
+                                 converted.get('hours_worked', [0.0] * count),
+                                 converted.get(rate_column, [0.0] * count))
+        
+        return table
+    
+    @staticmethod
+    def iter_rows(file_path: str, columns: Optional[Sequence[str]] = None, schema: Optional[Schema] = None,
+                  diagnostics: Optional[Diagnostics] = None,
+                  dialect: CSVDialect = DEFAULT_DIALECT) -> Iterator[Dict[str, Any]]:
+        """
+        Построчно читает CSV файл и лениво возвращает словари с данными.
+        
+        В памяти одновременно находится только текущая строка файла
+        (или пакет строк, если указана схема), поэтому потребление памяти
+        не зависит от размера файла.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            columns: Названия нужных колонок. Если указаны, словари содержат
+                только эти колонки
+            schema: Схема типов колонок. Если указана, значения
+                преобразуются по ней, строки с некорректными значениями
+                пропускаются, а после чтения файла выводится сводка ошибок.
+                Если не указана, значения остаются строками
+            diagnostics: Сборщик предупреждений. Если указан, проблемы
+                во входных данных учитываются в нем, а не выводятся
+            dialect: Диалект CSV
+            
+        Yields:
+            Словари с данными отдельных строк
+        """
+        lines = CSVReader._iter_split_lines(file_path, columns, diagnostics, dialect)
+        header = next(lines, None)
+        
+        if header is None:
+            return
+        
+        if schema is None:
+            yield from CSVReader._build_rows(header, lines, columns)
+            return
+        
+        errors = ConversionErrors(diagnostics)
+        yield from CSVReader._build_typed_rows(header, lines, columns, schema, errors)
+        errors.report(file_path)
+    
+    @staticmethod
+    def _build_rows(header: List[str], lines: Iterable[List[str]],
+                    columns: Optional[Sequence[str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Собирает словари строк из списков значений.
+        
+        Args:
+            header: Заголовок файла
+            lines: Списки значений строк
+            columns: Названия нужных колонок или None для всех колонок
+            
+        Yields:
+            Словари с данными отдельных строк
+        """
+        if columns is None:
+            for values in lines:
+                yield dict(zip(header, values))
+            return
+        
+        keys, _ = CSVReader.project(header, columns)
+        
+        for values in lines:
+            yield {key: values[index] for key, index in keys}
+    
+    @staticmethod
+    def _build_typed_rows(header: List[str], lines: Iterable[List[str]], columns: Optional[Sequence[str]],
+                          schema: Schema, errors: ConversionErrors) -> Iterator[Dict[str, Any]]:
+        """
+        Собирает словари строк, преобразуя значения по схеме пакетами.
+        
+        Args:
+            header: Заголовок файла
+            lines: Списки значений строк
+            columns: Названия нужных колонок или None для всех колонок
+            schema: Схема типов колонок
+            errors: Сводка ошибок преобразования
+            
+        Yields:
+            Словари с типизированными данными отдельных строк
+        """
+        keys = [key for key, _ in CSVReader.project(header, columns)[0]]
+        
+        for batch in CSVReader._iter_batches(lines):
+            converted = schema.convert(header, batch, keys, errors)
+            
+            for values in zip(*(converted[key] for key in keys)):
+                yield dict(zip(keys, values))
+    
+    @staticmethod
+    def read_file(file_path: str, columns: Optional[Sequence[str]] = None,
+                  diagnostics: Optional[Diagnostics] = None,
+                  dialect: CSVDialect = DEFAULT_DIALECT) -> List[Dict[str, Any]]:
         """
         Читает CSV файл и возвращает список словарей с данными.
         
         Args:
             file_path: Путь к CSV файлу
+            columns: Названия нужных колонок или None для всех колонок
+            diagnostics: Сборщик предупреждений о некорректных строках
+            dialect: Диалект CSV
             
         Returns:
             Список словарей с данными
         """
+        return list(CSVReader.iter_rows(file_path, columns, diagnostics=diagnostics, dialect=dialect))
+    
+    @staticmethod
+    def read_table(file_path: str, table: Optional[EmployeeTable] = None,
+                   diagnostics: Optional[Diagnostics] = None, dialect: CSVDialect = DEFAULT_DIALECT) -> EmployeeTable:
+        """
+        Читает CSV файл сразу в колоночную таблицу, минуя словари строк.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            table: Таблица, в которую добавляются записи. Если не указана,
+                создается новая
+            diagnostics: Сборщик предупреждений. Если указан, проблемы
+                во входных данных учитываются в нем, а не выводятся
+            dialect: Диалект CSV
+            
+        Returns:
+            Таблица с данными сотрудников
+        """
+        if table is None:
+            table = EmployeeTable()
+        
+        lines = CSVReader._iter_split_lines(file_path, TABLE_COLUMNS, diagnostics, dialect)
+        header = next(lines, None)
+        
+        if header is None:
+            return table
+        
+        errors = ConversionErrors(diagnostics)
+        CSVReader._fill_table(header, lines, table, errors)
+        errors.report(file_path)
+        
+        return table
+    
+    @staticmethod
+    def read_header(file_path: str) -> Optional[List[str]]:
+        """
+        Читает заголовок CSV файла.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            
+        Returns:
+            Список названий колонок или None, если файл пуст
+        """
+        with open_input(file_path, background=False) as file:
+            header_line = file.readline()
+        
+        if not header_line:
+            return None
+        
+        return header_line.strip().split(',')
+    
+    @staticmethod
+    def split_ranges(file_path: str, chunk_size: int) -> List[Tuple[int, int]]:
+        """
+        Делит данные CSV файла на диапазоны байтов, выровненные по границам строк.
+        
+        Первый диапазон начинается сразу после заголовка. Каждая граница
+        сдвигается вперед до ближайшего перевода строки, поэтому строки
+        не разрываются между диапазонами. Сжатый файл не делится: для него
+        возвращается один диапазон от конца заголовка до конца данных
+        в распакованных байтах.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            chunk_size: Желаемый размер диапазона в байтах
+            
+        Returns:
+            Список пар (начало, конец) в байтах. Пустой список, если файл
+            не найден или не содержит данных
+        """
         if not os.path.exists(file_path):
             print(f"Ошибка: Файл {file_path} не найден")
             return []
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-                
-            if not lines:
+        if is_compressed(file_path):
+            with open_input(file_path, binary=True, background=False) as file:
+                header_line = file.readline()
+                has_data = bool(file.read(1))
+            
+            if not header_line:
+                print(f"Предупреждение: Файл {file_path} пуст")
+                return []
+            
+            return [(len(header_line), sys.maxsize)] if has_data else []
+        
+        file_size = os.path.getsize(file_path)
+        ranges = []
+        
+        with open(file_path, 'rb') as file:
+            if not file.readline():
                 print(f"Предупреждение: Файл {file_path} пуст")
                 return []
+            
+            start = file.tell()
+            
+            while start < file_size:
+                file.seek(max(start + chunk_size, start + 1) - 1)
+                file.readline()
+                end = min(file.tell(), file_size)
+                ranges.append((start, end))
+                start = end
+        
+        return ranges
+
+
+class CSVRangeReader:
+    """
+    Класс для чтения диапазона байтов CSV файла.
+    
+    Используется для параллельного разбора одного большого файла. Номера
+    строк в диапазоне неизвестны заранее, поэтому предупреждения о
+    некорректных строках не выводятся сразу, а накапливаются вместе с
+    номером строки относительно начала диапазона. После чтения доступно
+    количество прочитанных строк, по которому вызывающий код пересчитывает
+    номера в абсолютные.
+    
+    Диапазон сжатого файла задается в распакованных байтах: данные до
+    начала диапазона распаковываются и пропускаются.
+    """
+    
+    def __init__(self, file_path: str, start: int, end: int, columns: Optional[Sequence[str]] = None,
+                 schema: Optional[Schema] = None, diagnostics: Optional[Diagnostics] = None) -> None:
+        """
+        Args:
+            file_path: Путь к CSV файлу
+            start: Начало диапазона в байтах (начало строки)
+            end: Конец диапазона в байтах (начало строки или конец файла)
+            columns: Названия нужных колонок или None для всех колонок
+            schema: Схема типов колонок для iter_rows. Если не указана,
+                значения остаются строками
+            diagnostics: Сборщик предупреждений о некорректных значениях.
+                Некорректные строки в любом случае накапливаются в malformed
+        """
+        self.file_path = file_path
+        self.columns = columns
+        self.schema = schema
+        self.diagnostics = diagnostics
+        self.start = start
+        self.end = end
+        self.lines_read = 0
+        self.malformed: List[Tuple[int, str]] = []
+    
+    def _iter_lines(self) -> Iterator[str]:
+        """
+        Читает строки диапазона.
+        
+        Yields:
+            Декодированные строки диапазона
+        """
+        with open_input(self.file_path, binary=True) as file:
+            if is_compressed(self.file_path):
+                _skip(file, self.start)
+            else:
+                file.seek(self.start)
+            
+            remaining = self.end - self.start
+            
+            for raw_line in file:
+                if remaining <= 0:
+                    break
                 
-            header = lines[0].strip().split(',')
-            data = []
-            
-            for line_num, line in enumerate(lines[1:], start=2):
-                if line.strip():
-                    values = line.strip().split(',')
-                    if len(values) == len(header):
-                        employee_data = {header[i]: values[i] for i in range(len(header))}
-                        data.append(employee_data)
-                    else:
-                        print(f"Предупреждение: Некорректная строка {line_num} в файле {file_path}: {line.strip()}")
-                        
-            return data
-        except Exception as e:
-            print(f"Ошибка при чтении файла {file_path}: {str(e)}")
-            return [] 
\ No newline at end of file
+                remaining -= len(raw_line)
+                self.lines_read += 1
+                yield raw_line.decode('utf-8')
+    
+    def _on_malformed(self, line_num: int, line: str) -> None:
+        self.malformed.append((line_num, line))
+    
+    def _iter_split_lines(self, columns: Optional[Sequence[str]]) -> Tuple[Optional[List[str]], Iterator[List[str]]]:
+        """
+        Возвращает заголовок файла и значения строк диапазона.
+        
+        Args:
+            columns: Названия нужных колонок или None для всех колонок
+            
+        Returns:
+            Кортеж (заголовок, итератор списков значений)
+        """
+        header = CSVReader.read_header(self.file_path)
+        
+        if header is None:
+            return None, iter(())
+        
+        _, max_split = CSVReader.project(header, columns)
+        
+        return header, CSVReader._split_lines(self._iter_lines(), len(header), 1, self._on_malformed, max_split)
+    
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво возвращает словари с данными строк диапазона.
+        
+        Yields:
+            Словари с данными отдельных строк
+        """
+        header, lines = self._iter_split_lines(self.columns)
+        
+        if header is None:
+            return
+        
+        if self.schema is None:
+            yield from CSVReader._build_rows(header, lines, self.columns)
+            return
+        
+        errors = ConversionErrors(self.diagnostics)
+        yield from CSVReader._build_typed_rows(header, lines, self.columns, self.schema, errors)
+        errors.report(self.file_path)
+    
+    def read_table(self, table: Optional[EmployeeTable] = None) -> EmployeeTable:
+        """
+        Читает строки диапазона в колоночную таблицу.
+        
+        Args:
+            table: Таблица, в которую добавляются записи. Если не указана,
+                создается новая
+            
+        Returns:
+            Таблица с данными сотрудников
+        """
+        if table is None:
+            table = EmployeeTable()
+        
+        header, lines = self._iter_split_lines(TABLE_COLUMNS)
+        
+        if header is None:
+            return table
+        
+        errors = ConversionErrors(self.diagnostics)
+        CSVReader._fill_table(header, lines, table, errors)
+        errors.report(self.file_path)
+        
+        return table
+
+
+def _is_record(record: List[str]) -> bool:
+    """
+    Проверяет, что запись csv.reader не пустая строка и не строка из пробелов.
+    
+    Args:
+        record: Значения записи
+        
+    Returns:
+        True, если запись нужно учитывать
+    """
+    return len(record) > 1 or bool(record and record[0].strip())
+
+
+def _skip(file: Any, size: int) -> None:
+    """
+    Пропускает байты потока, который не поддерживает перемещение.
+    
+    Args:
+        file: Двоичный поток
+        size: Количество байт
+    """
+    while size > 0:
+        chunk = file.read(min(size, 1024 * 1024))
+        
+        if not chunk:
+            return
+        
+        size -= len(chunk)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+import os
+
+# Значения по умолчанию параметров командной строки. Модуль не импортирует
+# тяжелых зависимостей, поэтому main.py может показывать их в справке,
+# не загружая модули режимов при каждом запуске
+
+# Количество элементов в одном отсортированном отрезке внешней сортировки
+DEFAULT_RUN_SIZE = 100_000
+
+# Количество сотрудников, которое индекс объединения хранит в памяти до сброса на диск
+DEFAULT_MAX_KEYS = 1_000_000
+
+# Переменная окружения с каталогом кэша разобранных файлов; если она
+# задана, main.py включает кэш без параметра --cache-dir
+CACHE_DIR_VARIABLE = 'REPORTS_CACHE_DIR'
+
+# Каталог кэша разобранных файлов
+DEFAULT_CACHE_DIR = os.environ.get(CACHE_DIR_VARIABLE, os.path.join(os.path.expanduser('~'), '.cache', 'reports'))
+
+# Предельный размер кэша в байтах
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+
+# Протокол pickle временных файлов, кэша и контрольных точек. Протокол 5
+# хранит массивы без лишних копий и есть во всех поддерживаемых версиях
+# Python (начиная с 3.8), поэтому модуль pickle здесь не импортируется
+PICKLE_PROTOCOL = 5
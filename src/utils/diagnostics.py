@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+import sys
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+
+# Категории проблем во входных данных
+MALFORMED_LINE = 'malformed_line'
+INVALID_VALUE = 'invalid_value'
+
+CATEGORY_TITLES = {
+    MALFORMED_LINE: 'некорректные строки',
+    INVALID_VALUE: 'некорректные значения',
+}
+
+# Количество примеров, сохраняемых для каждого файла и категории по умолчанию
+DEFAULT_MAX_EXAMPLES = 5
+
+# Обозначение источника, для которого файл неизвестен
+UNKNOWN_SOURCE = ''
+
+
+class Diagnostics:
+    """
+    Сборщик предупреждений о проблемах во входных данных.
+    
+    Вместо вывода сообщения на каждую проблемную строку считает проблемы
+    по файлам и категориям и хранит только первые max_examples примеров
+    каждой категории. После обработки выводится одна сводка или
+    сохраняется ее JSON представление. Сборщики рабочих процессов
+    объединяются через merge.
+    """
+    
+    def __init__(self, max_examples: int = DEFAULT_MAX_EXAMPLES) -> None:
+        """
+        Args:
+            max_examples: Количество примеров, сохраняемых для каждого
+                файла и категории
+        """
+        self.max_examples = max(max_examples, 0)
+        self.counts: Dict[Tuple[str, str], int] = {}
+        self.examples: Dict[Tuple[str, str], List[str]] = {}
+    
+    def __bool__(self) -> bool:
+        return bool(self.counts)
+    
+    @property
+    def total(self) -> int:
+        """
+        Общее количество учтенных проблем.
+        """
+        return sum(self.counts.values())
+    
+    def add(self, file_path: Optional[str], category: str, example: Optional[str] = None, count: int = 1) -> None:
+        """
+        Учитывает проблему во входных данных.
+        
+        Args:
+            file_path: Путь к файлу или None, если источник неизвестен
+            category: Категория проблемы
+            example: Описание проблемы, сохраняемое как пример
+            count: Количество учитываемых проблем
+        """
+        key = (file_path or UNKNOWN_SOURCE, category)
+        self.counts[key] = self.counts.get(key, 0) + count
+        
+        if example is not None:
+            examples = self.examples.setdefault(key, [])
+            
+            if len(examples) < self.max_examples:
+                examples.append(example)
+    
+    def extend(self, file_path: Optional[str], category: str, count: int, examples: Iterable[str]) -> None:
+        """
+        Учитывает сразу несколько проблем одной категории.
+        
+        Args:
+            file_path: Путь к файлу или None, если источник неизвестен
+            category: Категория проблемы
+            count: Количество проблем
+            examples: Описания части проблем
+        """
+        self.add(file_path, category, count=count)
+        
+        for example in examples:
+            self.add(file_path, category, example, count=0)
+    
+    def merge(self, other: 'Diagnostics') -> None:
+        """
+        Добавляет проблемы, учтенные другим сборщиком.
+        
+        Args:
+            other: Сборщик, например рабочего процесса или из кэша
+        """
+        for (file_path, category), count in other.counts.items():
+            self.extend(file_path, category, count, other.examples.get((file_path, category), ()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает сводку в виде, пригодном для сохранения в JSON.
+        
+        Returns:
+            Словарь с общим количеством проблем и проблемами по файлам
+            и категориям
+        """
+        files: Dict[str, Dict[str, Any]] = {}
+        
+        for (file_path, category), count in self.counts.items():
+            files.setdefault(file_path, {})[category] = {
+                'count': count,
+                'examples': self.examples.get((file_path, category), [])
+            }
+        
+        return {'total': self.total, 'files': files}
+    
+    def summary(self) -> str:
+        """
+        Формирует текстовую сводку проблем.
+        
+        Returns:
+            Текст сводки
+        """
+        lines = [f"Предупреждения при обработке данных: {self.total}"]
+        
+        for (file_path, category), count in self.counts.items():
+            source = file_path or 'источник не указан'
+            lines.append(f"  {source}: {CATEGORY_TITLES.get(category, category)} - {count}")
+            
+            examples = self.examples.get((file_path, category), [])
+            lines.extend(f"    {example}" for example in examples)
+            
+            if count > len(examples) and examples:
+                lines.append(f"    ... и еще {count - len(examples)}")
+        
+        return '\n'.join(lines)
+    
+    def report(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Выводит сводку, если были проблемы.
+        
+        Args:
+            stream: Поток вывода (по умолчанию sys.stderr, чтобы сводка
+                не смешивалась с отчетом, выводимым в консоль)
+        """
+        if self:
+            print(self.summary(), file=stream or sys.stderr)
+    
+    def write_json(self, output_file: str) -> None:
+        """
+        Сохраняет сводку в JSON файл.
+        
+        Args:
+            output_file: Путь к файлу
+        """
+        import json
+        
+        with open(output_file, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2, ensure_ascii=False)
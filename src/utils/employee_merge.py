@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+import os
+import pickle
+import tempfile
+from typing import Any, BinaryIO, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from src.utils.defaults import DEFAULT_MAX_KEYS, PICKLE_PROTOCOL
+from src.utils.diagnostics import Diagnostics, INVALID_VALUE
+from src.utils.employee_table import resolve_rate_column
+from src.utils.external_sort import ExternalSorter
+
+# Количество дисковых разделов при сбросе индекса
+DEFAULT_PARTITIONS = 16
+
+# Позиции значений в состоянии сотрудника
+SEQ, NAME, DEPARTMENT, HOURS, AMOUNT, RATE, SAME_RATE = range(7)
+
+
+class EmployeeMerger:
+    """
+    Объединение строк одного сотрудника из разных файлов по ключу.
+    
+    Строки с одинаковым значением ключевой колонки (например, name или
+    email) сводятся в одну: часы суммируются, имя и отдел берутся из
+    первой строки. Если ставки строк совпадают, ставка сохраняется, иначе
+    используется средняя ставка, взвешенная по часам, так что выплата
+    равна сумме выплат исходных строк.
+    
+    Состояния сотрудников хранятся в хэш-индексе. Если число сотрудников
+    превышает max_keys, индекс и все последующие строки распределяются по
+    хэшу ключа между дисковыми разделами, каждый из которых затем
+    объединяется в памяти отдельно. Сотрудники выдаются в порядке первого
+    появления.
+    """
+    
+    def __init__(self, key: str, max_keys: int = DEFAULT_MAX_KEYS, partitions: int = DEFAULT_PARTITIONS,
+                 temp_dir: Optional[str] = None, diagnostics: Optional[Diagnostics] = None) -> None:
+        """
+        Args:
+            key: Колонка, по которой определяется сотрудник
+            max_keys: Количество сотрудников, хранимых в памяти до сброса на диск
+            partitions: Количество дисковых разделов
+            temp_dir: Каталог для временных файлов (по умолчанию системный)
+            diagnostics: Сборщик предупреждений о строках с некорректными числами
+        """
+        self.key = key
+        self.max_keys = max(max_keys, 1)
+        self.partitions = max(partitions, 1)
+        self.temp_dir = temp_dir
+        self.diagnostics = diagnostics
+    
+    def merge(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво объединяет строки сотрудников.
+        
+        Входные данные читаются целиком при получении первой строки.
+        Строки, в которых часы или ставка не являются числом, пропускаются
+        с сообщением об ошибке; строки без значения ключа не объединяются.
+        
+        Args:
+            rows: Итерируемый набор словарей с данными сотрудников
+            
+        Yields:
+            Словари с объединенными данными сотрудников
+        """
+        index: Dict[Hashable, List[Any]] = {}
+        states = self._iter_states(rows)
+        
+        for key, state in states:
+            _combine(index, key, state)
+            
+            if len(index) > self.max_keys:
+                yield from self._merge_spilled(index, states)
+                return
+        
+        for state in index.values():
+            yield _to_row(state)
+    
+    def _iter_states(self, rows: Iterable[Dict[str, Any]]) -> Iterator[tuple]:
+        """
+        Преобразует строки в начальные состояния сотрудников.
+        
+        Args:
+            rows: Итерируемый набор словарей с данными сотрудников
+            
+        Yields:
+            Кортежи (ключ, состояние)
+        """
+        for seq, row in enumerate(rows):
+            name = row.get('name', '')
+            rate_key = resolve_rate_column(row)
+            
+            try:
+                hours = float(row.get('hours_worked', 0))
+                rate = float(row[rate_key]) if rate_key else 0.0
+            except (ValueError, TypeError) as e:
+                if self.diagnostics is not None:
+                    self.diagnostics.add(None, INVALID_VALUE, f"{name}: {str(e)}")
+                else:
+                    print(f"Ошибка обработки данных для {name}: {str(e)}")
+                continue
+            
+            key = row.get(self.key)
+            
+            if key is None or key == '':
+                key = (None, seq)
+            
+            yield key, [seq, name, row.get('department', ''), hours, hours * rate, rate, True]
+    
+    def _merge_spilled(self, index: Dict[Hashable, List[Any]], states: Iterator[tuple]) -> Iterator[Dict[str, Any]]:
+        """
+        Объединяет сотрудников через дисковые разделы.
+        
+        Args:
+            index: Заполненный хэш-индекс
+            states: Оставшиеся состояния сотрудников
+            
+        Yields:
+            Словари с объединенными данными сотрудников в порядке первого появления
+        """
+        with tempfile.TemporaryDirectory(prefix='reports-merge-', dir=self.temp_dir) as work_dir:
+            paths = [os.path.join(work_dir, f'partition-{number}.bin') for number in range(self.partitions)]
+            files = [open(path, 'wb') for path in paths]
+            
+            try:
+                for key, state in index.items():
+                    pickle.dump((key, state), files[hash(key) % self.partitions], protocol=PICKLE_PROTOCOL)
+                
+                index.clear()
+                
+                for key, state in states:
+                    pickle.dump((key, state), files[hash(key) % self.partitions], protocol=PICKLE_PROTOCOL)
+            finally:
+                for file in files:
+                    file.close()
+            
+            sorter = ExternalSorter(lambda state: state[SEQ], run_size=self.max_keys, temp_dir=work_dir)
+            
+            for state in sorter.sort(self._iter_partitions(paths)):
+                yield _to_row(state)
+    
+    @staticmethod
+    def _iter_partitions(paths: List[str]) -> Iterator[List[Any]]:
+        """
+        Объединяет сотрудников каждого раздела в памяти.
+        
+        Args:
+            paths: Пути к файлам разделов
+            
+        Yields:
+            Объединенные состояния сотрудников
+        """
+        for path in paths:
+            index: Dict[Hashable, List[Any]] = {}
+            
+            with open(path, 'rb') as file:
+                for key, state in _read_partition(file):
+                    _combine(index, key, state)
+            
+            os.remove(path)
+            yield from index.values()
+
+
+def _combine(index: Dict[Hashable, List[Any]], key: Hashable, state: List[Any]) -> None:
+    """
+    Добавляет состояние сотрудника в хэш-индекс.
+    
+    Args:
+        index: Хэш-индекс состояний по ключу
+        key: Ключ сотрудника
+        state: Состояние, которое добавляется к уже накопленному
+    """
+    current = index.get(key)
+    
+    if current is None:
+        index[key] = state
+        return
+    
+    if state[SEQ] < current[SEQ]:
+        current, state = state, current
+        index[key] = current
+    
+    current[HOURS] += state[HOURS]
+    current[AMOUNT] += state[AMOUNT]
+    current[SAME_RATE] = current[SAME_RATE] and state[SAME_RATE] and current[RATE] == state[RATE]
+
+
+def _to_row(state: List[Any]) -> Dict[str, Any]:
+    """
+    Формирует строку с данными сотрудника из его состояния.
+    
+    Args:
+        state: Состояние сотрудника
+        
+    Returns:
+        Словарь с данными сотрудника
+    """
+    rate = state[RATE]
+    
+    if not state[SAME_RATE] and state[HOURS]:
+        rate = state[AMOUNT] / state[HOURS]
+    
+    return {
+        'name': state[NAME],
+        'department': state[DEPARTMENT],
+        'hours_worked': state[HOURS],
+        'hourly_rate': rate
+    }
+
+
+def _read_partition(file: BinaryIO) -> Iterator[tuple]:
+    """
+    Читает записи раздела.
+    
+    Args:
+        file: Открытый файл раздела
+        
+    Yields:
+        Кортежи (ключ, состояние)
+    """
+    while True:
+        try:
+            yield pickle.load(file)
+        except EOFError:
+            return
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+import sys
+from array import array
+from typing import List, Dict, Any, Container, Iterable, Iterator, Optional, Tuple
+
+from src.utils.diagnostics import Diagnostics, INVALID_VALUE
+
+
+# Возможные названия колонки со ставкой в порядке приоритета
+RATE_COLUMNS = ('hourly_rate', 'rate', 'salary')
+
+# Колонки CSV файла, из которых заполняется таблица
+TABLE_COLUMNS = ('name', 'department', 'hours_worked') + RATE_COLUMNS
+
+
+class EmployeeTable:
+    """
+    Компактное колоночное хранилище данных сотрудников.
+    
+    Вместо словаря на каждую строку данные хранятся по колонкам:
+    имена интернируются, отделы кодируются словарем (код строки -> индекс
+    в списке уникальных значений), часы и ставки лежат в массивах array('d').
+    """
+    
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.department_codes = array('I')
+        self.departments: List[str] = []
+        self.hours = array('d')
+        self.rates = array('d')
+        self._department_index: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def _encode_department(self, department: str) -> int:
+        """
+        Возвращает код отдела, добавляя его в словарь при первом появлении.
+        
+        Args:
+            department: Название отдела
+            
+        Returns:
+            Код отдела
+        """
+        code = self._department_index.get(department)
+        
+        if code is None:
+            code = len(self.departments)
+            self.departments.append(department)
+            self._department_index[department] = code
+        
+        return code
+    
+    def append(self, name: str, department: str, hours: float, rate: float) -> None:
+        """
+        Добавляет запись о сотруднике.
+        
+        Args:
+            name: Имя сотрудника
+            department: Отдел
+            hours: Отработанные часы
+            rate: Ставка
+        """
+        self.names.append(sys.intern(name))
+        self.department_codes.append(self._encode_department(department))
+        self.hours.append(hours)
+        self.rates.append(rate)
+    
+    def extend_columns(self, names: Iterable[str], departments: Iterable[str],
+                       hours: Iterable[float], rates: Iterable[float]) -> None:
+        """
+        Добавляет записи, заданные колонками уже преобразованных значений.
+        
+        Args:
+            names: Имена сотрудников
+            departments: Отделы
+            hours: Отработанные часы
+            rates: Ставки
+        """
+        self.names.extend(map(sys.intern, names))
+        self.department_codes.extend(map(self._encode_department, departments))
+        self.hours.extend(hours)
+        self.rates.extend(rates)
+    
+    def extend(self, other: 'EmployeeTable') -> None:
+        """
+        Добавляет в конец таблицы все записи другой таблицы.
+        
+        Args:
+            other: Таблица, записи которой добавляются
+        """
+        recode = array('I', (self._encode_department(department) for department in other.departments))
+        
+        self.names.extend(other.names)
+        self.department_codes.extend(recode[code] for code in other.department_codes)
+        self.hours.extend(other.hours)
+        self.rates.extend(other.rates)
+    
+    def department(self, index: int) -> str:
+        """
+        Возвращает название отдела для записи с заданным номером.
+        
+        Args:
+            index: Номер записи
+            
+        Returns:
+            Название отдела
+        """
+        return self.departments[self.department_codes[index]]
+    
+    def memory_size(self) -> int:
+        """
+        Оценивает объем памяти, занимаемой таблицей.
+        
+        Каждая уникальная строка имени учитывается один раз, поэтому
+        интернированные имена не завышают оценку.
+        
+        Returns:
+            Приблизительный размер в байтах
+        """
+        unique_names = {id(name): name for name in self.names}.values()
+        
+        return (sys.getsizeof(self.names) + sum(map(sys.getsizeof, unique_names))
+                + sys.getsizeof(self.department_codes) + sys.getsizeof(self.hours) + sys.getsizeof(self.rates)
+                + sum(map(sys.getsizeof, self.departments)) + sys.getsizeof(self._department_index))
+    
+    def iter_columns(self) -> Iterator[Tuple[str, str, float, float]]:
+        """
+        Обходит записи таблицы без создания промежуточных словарей.
+        
+        Yields:
+            Кортежи (имя, отдел, часы, ставка)
+        """
+        departments = self.departments
+        
+        for name, code, hours, rate in zip(self.names, self.department_codes, self.hours, self.rates):
+            yield name, departments[code], hours, rate
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Обходит записи таблицы в виде словарей, совместимых с CSVReader.
+        
+        Yields:
+            Словари с данными сотрудников
+        """
+        for name, department, hours, rate in self.iter_columns():
+            yield {
+                'name': name,
+                'department': department,
+                'hours_worked': hours,
+                'hourly_rate': rate
+            }
+    
+    def append_row(self, employee: Dict[str, Any], rate_key: Optional[str] = None,
+                   diagnostics: Optional[Diagnostics] = None) -> bool:
+        """
+        Преобразует словарь с данными сотрудника и добавляет его в таблицу.
+        
+        Args:
+            employee: Словарь с данными сотрудника
+            rate_key: Название колонки со ставкой. Если не указано,
+                определяется по ключам словаря
+            diagnostics: Сборщик предупреждений. Если указан, некорректные
+                значения учитываются в нем, а не выводятся
+            
+        Returns:
+            True если запись добавлена, False если значения некорректны
+        """
+        name = employee.get('name', '')
+        
+        if rate_key is None:
+            rate_key = resolve_rate_column(employee)
+        
+        try:
+            hours = float(employee.get('hours_worked', 0))
+            rate = float(employee[rate_key]) if rate_key else 0.0
+        except (ValueError, TypeError) as e:
+            if diagnostics is not None:
+                diagnostics.add(None, INVALID_VALUE, f"{name}: {str(e)}")
+            else:
+                print(f"Ошибка обработки данных для {name}: {str(e)}")
+            return False
+        
+        self.append(name, employee.get('department', ''), hours, rate)
+        return True
+    
+    @classmethod
+    def from_rows(cls, employees_data: Iterable[Dict[str, Any]],
+                  diagnostics: Optional[Diagnostics] = None) -> 'EmployeeTable':
+        """
+        Строит таблицу из набора словарей с данными сотрудников.
+        
+        Args:
+            employees_data: Итерируемый набор словарей с данными сотрудников
+            diagnostics: Сборщик предупреждений о некорректных значениях
+            
+        Returns:
+            Заполненная таблица
+        """
+        table = cls()
+        
+        for employee in employees_data:
+            table.append_row(employee, diagnostics=diagnostics)
+        
+        return table
+
+
+def resolve_rate_column(columns: Container[str]) -> Optional[str]:
+    """
+    Определяет название колонки со ставкой.
+    
+    Args:
+        columns: Названия доступных колонок
+        
+    Returns:
+        Название колонки со ставкой или None, если ни одна не найдена
+    """
+    for rate_key in RATE_COLUMNS:
+        if rate_key in columns:
+            return rate_key
+    
+    return None
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+import heapq
+import os
+import pickle
+import tempfile
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.utils.defaults import DEFAULT_RUN_SIZE, PICKLE_PROTOCOL
+
+# Максимальное число отрезков, сливаемых за один проход
+DEFAULT_FAN_IN = 64
+
+# Количество элементов в одном блоке при записи отрезка на диск
+BLOCK_SIZE = 1024
+
+
+class ExternalSorter:
+    """
+    Внешняя сортировка элементов отчета.
+    
+    Элементы накапливаются в памяти отрезками по run_size штук; каждый
+    заполненный отрезок сортируется и сбрасывается во временный файл.
+    Затем отрезки сливаются k-путевым слиянием и выдаются лениво, поэтому
+    в памяти одновременно находятся один отрезок при записи и по одному
+    блоку каждого отрезка при слиянии. Если все элементы уместились в
+    один отрезок, временные файлы не создаются. Сортировка устойчива:
+    элементы с равными ключами сохраняют исходный порядок.
+    """
+    
+    def __init__(self, key: Callable[[Any], Any], reverse: bool = False, run_size: int = DEFAULT_RUN_SIZE,
+                 fan_in: int = DEFAULT_FAN_IN, temp_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            key: Функция, возвращающая ключ сортировки элемента
+            reverse: Сортировать ли по убыванию
+            run_size: Количество элементов в отрезке, сортируемом в памяти
+            fan_in: Максимальное число отрезков, сливаемых за один проход.
+                Если отрезков больше, они предварительно сливаются группами
+            temp_dir: Каталог для временных файлов (по умолчанию системный)
+        """
+        self.key = key
+        self.reverse = reverse
+        self.run_size = max(run_size, 1)
+        self.fan_in = max(fan_in, 2)
+        self.temp_dir = temp_dir
+    
+    def sort(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Лениво возвращает элементы в отсортированном порядке.
+        
+        Входные данные читаются целиком при получении первого элемента.
+        Временные файлы удаляются, когда результат прочитан до конца или
+        итератор закрыт.
+        
+        Args:
+            items: Итерируемый набор элементов
+            
+        Yields:
+            Элементы в отсортированном порядке
+        """
+        iterator = iter(items)
+        run = self._next_run(iterator)
+        
+        if len(run) < self.run_size:
+            yield from run
+            return
+        
+        with tempfile.TemporaryDirectory(prefix='reports-sort-', dir=self.temp_dir) as work_dir:
+            paths = []
+            
+            while run:
+                paths.append(self._write_run(work_dir, run))
+                run = self._next_run(iterator)
+            
+            while len(paths) > self.fan_in:
+                paths = [self._merge_to_file(work_dir, paths[start:start + self.fan_in])
+                         for start in range(0, len(paths), self.fan_in)]
+            
+            yield from self._merge(paths)
+    
+    def _next_run(self, iterator: Iterator[Any]) -> List[Any]:
+        """
+        Читает и сортирует в памяти очередной отрезок.
+        
+        Args:
+            iterator: Итератор входных элементов
+            
+        Returns:
+            Отсортированный список не более чем из run_size элементов
+        """
+        run = list(islice(iterator, self.run_size))
+        run.sort(key=self.key, reverse=self.reverse)
+        
+        return run
+    
+    def _write_run(self, work_dir: str, items: Iterable[Any]) -> str:
+        """
+        Записывает отсортированный отрезок во временный файл блоками.
+        
+        Args:
+            work_dir: Каталог временных файлов
+            items: Отсортированные элементы
+            
+        Returns:
+            Путь к файлу отрезка
+        """
+        fd, path = tempfile.mkstemp(prefix='run-', suffix='.bin', dir=work_dir)
+        iterator = iter(items)
+        
+        with os.fdopen(fd, 'wb') as file:
+            while True:
+                block = list(islice(iterator, BLOCK_SIZE))
+                
+                if not block:
+                    break
+                
+                pickle.dump(block, file, protocol=PICKLE_PROTOCOL)
+        
+        return path
+    
+    def _merge_to_file(self, work_dir: str, paths: List[str]) -> str:
+        """
+        Сливает группу отрезков в один новый отрезок и удаляет исходные.
+        
+        Args:
+            work_dir: Каталог временных файлов
+            paths: Пути к файлам отрезков в исходном порядке
+            
+        Returns:
+            Путь к файлу нового отрезка
+        """
+        merged = self._write_run(work_dir, self._merge(paths))
+        
+        for path in paths:
+            os.remove(path)
+        
+        return merged
+    
+    def _merge(self, paths: List[str]) -> Iterator[Any]:
+        """
+        Выполняет k-путевое слияние отрезков.
+        
+        Args:
+            paths: Пути к файлам отрезков в исходном порядке
+            
+        Yields:
+            Элементы в отсортированном порядке
+        """
+        files = [open(path, 'rb') for path in paths]
+        
+        try:
+            yield from heapq.merge(*(_read_run(file) for file in files), key=self.key, reverse=self.reverse)
+        finally:
+            for file in files:
+                file.close()
+
+
+def _read_run(file: BinaryIO) -> Iterator[Any]:
+    """
+    Читает отрезок из файла по одному блоку.
+    
+    Args:
+        file: Открытый файл отрезка
+        
+    Yields:
+        Элементы отрезка
+    """
+    while True:
+        try:
+            block = pickle.load(file)
+        except EOFError:
+            return
+        
+        yield from block
+
+
+def sort_items(items: Iterable[Dict[str, Any]], field: str, reverse: bool = False,
+               run_size: int = DEFAULT_RUN_SIZE, temp_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Лениво сортирует элементы отчета по значению поля с ограниченным потреблением памяти.
+    
+    Args:
+        items: Элементы отчета
+        field: Поле, по которому выполняется сортировка
+        reverse: Сортировать ли по убыванию
+        run_size: Количество элементов в отрезке, сортируемом в памяти
+        temp_dir: Каталог для временных файлов (по умолчанию системный)
+        
+    Returns:
+        Итератор элементов отчета в отсортированном порядке. Ошибка
+        отсутствия поля возникает при его обходе
+        
+    Raises:
+        ValueError: Если в элементе нет поля сортировки
+    """
+    def key(item: Dict[str, Any]) -> Any:
+        try:
+            return item[field]
+        except KeyError:
+            raise ValueError(f"Поле сортировки '{field}' отсутствует в элементах отчета") from None
+    
+    return ExternalSorter(key, reverse=reverse, run_size=run_size, temp_dir=temp_dir).sort(items)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+import mmap
+import os
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
+
+from src.utils.csv_reader import CSVReader
+from src.utils.employee_table import EmployeeTable, TABLE_COLUMNS, resolve_rate_column
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE
+from src.utils.schema import Schema, ConversionErrors
+
+
+class MmapCSVReader:
+    """
+    Класс для чтения CSV файла через отображение в память.
+    
+    Файл не декодируется целиком: строки ищутся по сырым байтам, число
+    полей проверяется подсчетом разделителей, а декодируются только
+    колонки, нужные отчету. Строка разбивается лишь до последней нужной
+    колонки, поэтому лишние колонки широких выгрузок почти ничего не стоят.
+    
+    Без диапазона предупреждения о некорректных строках выводятся сразу
+    или учитываются в сборщике предупреждений. При чтении диапазона байтов
+    они накапливаются в malformed с номерами строк относительно начала
+    диапазона, как в CSVRangeReader.
+    """
+    
+    def __init__(self, file_path: str, columns: Optional[Sequence[str]] = None,
+                 start: Optional[int] = None, end: Optional[int] = None, schema: Optional[Schema] = None,
+                 diagnostics: Optional[Diagnostics] = None) -> None:
+        """
+        Args:
+            file_path: Путь к CSV файлу
+            columns: Названия нужных колонок. Если не указаны, читаются все
+            start: Начало диапазона в байтах. Если не указано, читается
+                весь файл после заголовка
+            end: Конец диапазона в байтах
+            schema: Схема типов колонок для iter_rows. Если не указана,
+                значения остаются строками
+            diagnostics: Сборщик предупреждений. Если указан, проблемы
+                во входных данных учитываются в нем, а не выводятся
+        """
+        self.file_path = file_path
+        self.columns = columns
+        self.schema = schema
+        self.diagnostics = diagnostics
+        self.start = start
+        self.end = end
+        self.lines_read = 0
+        self.malformed: List[Tuple[int, str]] = []
+    
+    def _iter_fields(self, columns: Optional[Sequence[str]]) -> Iterator[Tuple[List[str], List[int], List[bytes]]]:
+        """
+        Сканирует строки файла и разбивает их на поля в виде байтов.
+        
+        Первым возвращается кортеж с заголовком и индексами нужных колонок
+        (список полей в нем пуст), затем кортежи с полями строк.
+        
+        Args:
+            columns: Названия нужных колонок или None для всех колонок
+            
+        Yields:
+            Кортежи (заголовок, индексы нужных колонок, поля строки)
+        """
+        if not os.path.exists(self.file_path):
+            print(f"Ошибка: Файл {self.file_path} не найден")
+            return
+        
+        if os.path.getsize(self.file_path) == 0:
+            print(f"Предупреждение: Файл {self.file_path} пуст")
+            return
+        
+        with open(self.file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            header_end = data.find(b'\n')
+            if header_end == -1:
+                header_end = len(data)
+            
+            header = data[:header_end].decode('utf-8').strip().split(',')
+            
+            keys, max_split = CSVReader.project(header, columns)
+            indexes = [index for _, index in keys]
+            
+            yield header, indexes, []
+            
+            separators = len(header) - 1
+            
+            if self.start is None:
+                pos, end, line_num = header_end + 1, len(data), 1
+            else:
+                pos, end, line_num = self.start, self.end, 0
+            
+            while pos < end:
+                line_end = data.find(b'\n', pos, end)
+                if line_end == -1:
+                    line_end = end
+                
+                line = data[pos:line_end].strip()
+                pos = line_end + 1
+                line_num += 1
+                self.lines_read += 1
+                
+                if not line:
+                    continue
+                
+                if line.count(b',') != separators:
+                    self._on_malformed(line_num, line.decode('utf-8'))
+                    continue
+                
+                yield header, indexes, line.split(b',', max_split)
+    
+    def _on_malformed(self, line_num: int, line: str) -> None:
+        if self.start is not None:
+            self.malformed.append((line_num, line))
+        elif self.diagnostics is not None:
+            self.diagnostics.add(self.file_path, MALFORMED_LINE, f"строка {line_num}: {line}")
+        else:
+            print(f"Предупреждение: Некорректная строка {line_num} в файле {self.file_path}: {line}")
+    
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво возвращает словари с данными строк, содержащие только нужные колонки.
+        
+        Yields:
+            Словари с данными отдельных строк
+        """
+        fields = self._iter_fields(self.columns)
+        first = next(fields, None)
+        
+        if first is None:
+            return
+        
+        header, indexes, _ = first
+        keys = [(header[index], index) for index in indexes]
+        
+        if self.schema is not None:
+            # Декодируются только нужные колонки; схема получает заголовок,
+            # суженный до них
+            lines = ([values[index].decode('utf-8') for index in indexes] for _, _, values in fields)
+            errors = ConversionErrors(self.diagnostics)
+            yield from CSVReader._build_typed_rows([header[index] for index in indexes], lines, self.columns,
+                                                   self.schema, errors)
+            errors.report(self.file_path)
+            return
+        
+        for _, _, values in fields:
+            yield {key: values[index].decode('utf-8') for key, index in keys}
+    
+    def read_table(self, table: Optional[EmployeeTable] = None) -> EmployeeTable:
+        """
+        Читает строки в колоночную таблицу.
+        
+        Часы и ставка преобразуются в числа прямо из байтов, без
+        промежуточного декодирования в строки.
+        
+        Args:
+            table: Таблица, в которую добавляются записи. Если не указана,
+                создается новая
+            
+        Returns:
+            Таблица с данными сотрудников
+        """
+        if table is None:
+            table = EmployeeTable()
+        
+        fields = self._iter_fields(TABLE_COLUMNS)
+        first = next(fields, None)
+        
+        if first is None:
+            return table
+        
+        header = first[0]
+        
+        def column_index(column: Optional[str]) -> Optional[int]:
+            return header.index(column) if column in header else None
+        
+        name_index = column_index('name')
+        department_index = column_index('department')
+        hours_index = column_index('hours_worked')
+        rate_index = column_index(resolve_rate_column(header))
+        errors = ConversionErrors(self.diagnostics)
+        
+        for _, _, values in fields:
+            name = values[name_index].decode('utf-8') if name_index is not None else ''
+            department = values[department_index].decode('utf-8') if department_index is not None else ''
+            
+            try:
+                hours = float(values[hours_index]) if hours_index is not None else 0.0
+                rate = float(values[rate_index]) if rate_index is not None else 0.0
+            except ValueError:
+                for index in (hours_index, rate_index):
+                    if index is not None and not _is_float(values[index]):
+                        errors.add(header[index], name, values[index].decode('utf-8'))
+                
+                errors.rows += 1
+                continue
+            
+            table.append(name, department, hours, rate)
+        
+        errors.report(self.file_path)
+        
+        return table
+
+def _is_float(raw_value: bytes) -> bool:
+    """
+    Проверяет, является ли значение поля числом.
+    
+    Args:
+        raw_value: Значение поля в виде байтов
+        
+    Returns:
+        True если значение преобразуется в число, иначе False
+    """
+    try:
+        float(raw_value)
+    except ValueError:
+        return False
+    
+    return True
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from typing import Callable, List, Optional, TextIO, Tuple
+
+from src.utils.defaults import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, PICKLE_PROTOCOL
+from src.utils.diagnostics import Diagnostics
+from src.utils.employee_table import EmployeeTable
+
+
+# Версия формата кэша: при изменении структуры таблицы старые записи
+# перестают находиться и со временем вытесняются
+CACHE_VERSION = 2
+
+
+class ParseCache:
+    """
+    Дисковый кэш разобранных CSV файлов.
+    
+    Хранит колоночные таблицы сотрудников вместе с сообщениями, выведенными
+    при разборе, и собранными предупреждениями. Ключ записи строится по абсолютному пути файла, времени
+    изменения, размеру и хэшу содержимого, поэтому измененный файл всегда
+    разбирается заново. При превышении предельного размера вытесняются
+    записи, которые дольше всего не использовались.
+    """
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Args:
+            cache_dir: Каталог для хранения записей кэша
+            max_size: Предельный размер кэша в байтах
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+    
+    @staticmethod
+    def file_key(file_path: str, variant: str = '') -> str:
+        """
+        Вычисляет ключ записи кэша для файла.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            variant: Параметры разбора, от которых зависит результат
+                (например, диалект CSV); пустая строка - параметры по умолчанию
+            
+        Returns:
+            Шестнадцатеричный ключ записи
+        """
+        stat = os.stat(file_path)
+        key = hashlib.blake2b(digest_size=20)
+        key.update(f"{CACHE_VERSION}|{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|".encode('utf-8'))
+        
+        if variant:
+            key.update(f"{variant}|".encode('utf-8'))
+        
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                key.update(block)
+        
+        return key.hexdigest()
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pickle")
+    
+    def load(self, key: str) -> Optional[Tuple[EmployeeTable, str, Optional[Diagnostics]]]:
+        """
+        Загружает разобранный файл из кэша.
+        
+        Args:
+            key: Ключ записи, полученный через file_key
+            
+        Returns:
+            Кортеж (таблица, сообщения разбора, предупреждения разбора)
+            или None, если записи нет
+        """
+        entry_path = self._entry_path(key)
+        
+        try:
+            with open(entry_path, 'rb') as entry:
+                table, messages, diagnostics = pickle.load(entry)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        
+        # Время изменения записи используется как время последнего обращения
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        
+        return table, messages, diagnostics
+    
+    def store(self, key: str, table: EmployeeTable, messages: str = '',
+              diagnostics: Optional[Diagnostics] = None) -> None:
+        """
+        Сохраняет разобранный файл в кэш и вытесняет старые записи.
+        
+        Args:
+            key: Ключ записи, полученный через file_key
+            table: Таблица с данными сотрудников
+            messages: Сообщения, выведенные при разборе
+            diagnostics: Предупреждения, собранные при разборе
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Запись сначала пишется во временный файл, чтобы параллельные
+        # запуски не прочитали ее частично
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as entry:
+                pickle.dump((table, messages, diagnostics), entry, protocol=PICKLE_PROTOCOL)
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        self.evict()
+    
+    def get_or_parse(self, file_path: str, parse: Callable[..., EmployeeTable],
+                     diagnostics: Optional[Diagnostics] = None, variant: str = '') -> EmployeeTable:
+        """
+        Возвращает таблицу файла из кэша или разбирает файл и сохраняет результат.
+        
+        Сообщения, выведенные при разборе, запоминаются вместе с таблицей
+        и выводятся повторно при загрузке из кэша. Если передан сборщик
+        предупреждений, parse вызывается с именованным аргументом
+        diagnostics - отдельным сборщиком для файла, который сохраняется
+        в кэше и при каждом обращении добавляется в общий сборщик.
+        
+        Args:
+            file_path: Путь к CSV файлу
+            parse: Функция разбора файла в таблицу
+            diagnostics: Сборщик предупреждений
+            variant: Параметры разбора, которыми различаются записи одного файла
+            
+        Returns:
+            Таблица с данными сотрудников
+        """
+        key = self.file_key(file_path, variant)
+        cached = self.load(key)
+        
+        if cached is not None:
+            table, messages, file_diagnostics = cached
+            sys.stdout.write(messages)
+            _merge_diagnostics(diagnostics, file_diagnostics)
+            return table
+        
+        file_diagnostics = Diagnostics(diagnostics.max_examples) if diagnostics is not None else None
+        messages = io.StringIO()
+        
+        with redirect_stdout(_TeeWriter(sys.stdout, messages)):
+            if file_diagnostics is not None:
+                table = parse(file_path, diagnostics=file_diagnostics)
+            else:
+                table = parse(file_path)
+        
+        _merge_diagnostics(diagnostics, file_diagnostics)
+        
+        try:
+            self.store(key, table, messages.getvalue(), file_diagnostics)
+        except OSError as e:
+            print(f"Предупреждение: Не удалось сохранить кэш для файла {file_path}: {str(e)}")
+        
+        return table
+    
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Возвращает записи кэша.
+        
+        Returns:
+            Список кортежей (время последнего обращения, размер, путь)
+        """
+        entries = []
+        
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pickle'):
+                continue
+            
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        return entries
+    
+    def evict(self) -> None:
+        """
+        Удаляет давно не использовавшиеся записи, пока размер кэша
+        превышает предельный.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+        
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            
+            total_size -= size
+    
+    def clear(self) -> None:
+        """
+        Удаляет все записи кэша.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _merge_diagnostics(diagnostics: Optional[Diagnostics], file_diagnostics: Optional[Diagnostics]) -> None:
+    """
+    Добавляет предупреждения разбора файла в общий сборщик.
+    
+    Если общий сборщик не передан, а предупреждения были сохранены
+    в кэше другим запуском, выводится их сводка.
+    
+    Args:
+        diagnostics: Общий сборщик предупреждений
+        file_diagnostics: Предупреждения разбора файла
+    """
+    if file_diagnostics is None:
+        return
+    
+    if diagnostics is not None:
+        diagnostics.merge(file_diagnostics)
+    elif file_diagnostics:
+        print(file_diagnostics.summary())
+
+
+class _TeeWriter:
+    """
+    Поток вывода, дублирующий запись в два потока.
+    """
+    
+    def __init__(self, primary: TextIO, copy: TextIO) -> None:
+        self.primary = primary
+        self.copy = copy
+    
+    def write(self, text: str) -> int:
+        self.copy.write(text)
+        return self.primary.write(text)
+    
+    def flush(self) -> None:
+        self.primary.flush()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import io
+import queue
+import threading
+from itertools import islice
+from typing import Any, BinaryIO, Dict, IO, Iterable, Iterator, List, Union
+
+from src.utils.compression import CHUNK_SIZE, BackgroundWriter, is_compressed, open_output
+
+
+# Количество строк или элементов отчета в пакете, который этап передает
+# следующему: очередь синхронизируется один раз на пакет, а не на строку
+BATCH_SIZE = 4096
+
+# Количество пакетов в очереди между соседними этапами; когда очередь
+# заполнена, предыдущий этап ждет, поэтому память ограничена
+QUEUE_SIZE = 4
+
+# Интервал, с которым этап проверяет, не остановлен ли конвейер
+_POLL_INTERVAL = 0.1
+
+
+class PipelineStage:
+    """
+    Этап конвейера: обходит источник в фоновом потоке и передает его
+    элементы следующему этапу пакетами через ограниченную очередь.
+    
+    Следующий этап обходит сам объект этапа. Исключение источника
+    передается следующему этапу и выбрасывается при обходе.
+    Предполагается один потребитель элементов.
+    """
+    
+    def __init__(self, name: str, source: Iterable[Any], batch_size: int = BATCH_SIZE,
+                 queue_size: int = QUEUE_SIZE) -> None:
+        """
+        Args:
+            name: Название этапа (используется в имени потока)
+            source: Источник элементов, обходимый в фоновом потоке
+            batch_size: Количество элементов в пакете
+            queue_size: Количество пакетов в очереди
+        """
+        self.name = name
+        self.count = 0
+        self._source = source
+        self._batch_size = batch_size
+        self._queue: 'queue.Queue[Union[List[Any], BaseException, None]]' = queue.Queue(queue_size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'reports-{name}', daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        iterator = iter(self._source)
+        
+        try:
+            while True:
+                batch = list(islice(iterator, self._batch_size))
+                
+                if not batch:
+                    break
+                
+                if not self._put(batch):
+                    return
+            
+            self._put(None)
+        except BaseException as e:
+            self._put(e)
+        finally:
+            # Остановленный источник закрывается в своем потоке, чтобы
+            # освободить открытые им файлы
+            if self._stop.is_set() and hasattr(iterator, 'close'):
+                iterator.close()
+    
+    def _put(self, item: Union[List[Any], BaseException, None]) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        
+        return False
+    
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            item = self._queue.get()
+            
+            if item is None:
+                return
+            
+            if isinstance(item, BaseException):
+                raise item
+            
+            self.count += len(item)
+            yield from item
+    
+    def close(self) -> None:
+        """
+        Останавливает этап, не дожидаясь окончания источника.
+        """
+        self._stop.set()
+        self._thread.join()
+    
+    def __enter__(self) -> 'PipelineStage':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def pipeline_report(report_data: Dict[str, Any], batch_size: int = BATCH_SIZE,
+                    queue_size: int = QUEUE_SIZE) -> Dict[str, Any]:
+    """
+    Переносит вычисление элементов отчета в отдельный этап конвейера.
+    
+    Ленивые итоги (функции без аргументов) вызываются форматером после
+    обхода элементов, когда этап уже обработал весь источник.
+    
+    Args:
+        report_data: Данные отчета, возможно с ленивыми значениями
+        batch_size: Количество элементов в пакете
+        queue_size: Количество пакетов в очереди
+        
+    Returns:
+        Данные отчета, в которых 'items' вычисляются в фоновом потоке
+    """
+    report_data = dict(report_data)
+    report_data['items'] = iter(PipelineStage('generate', report_data['items'], batch_size, queue_size))
+    
+    return report_data
+
+
+def background_output(raw: BinaryIO, binary: bool = False, encoding: str = 'utf-8',
+                      close_raw: bool = True) -> IO[Any]:
+    """
+    Оборачивает двоичный поток так, что запись в него выполняется в фоновом потоке.
+    
+    Args:
+        raw: Двоичный поток, например файл или sys.stdout.buffer
+        binary: Вернуть ли двоичный поток вместо текстового
+        encoding: Кодировка текстового потока
+        close_raw: Закрывать ли исходный поток вместе с возвращенным
+        
+    Returns:
+        Текстовый или двоичный поток
+    """
+    stream = io.BufferedWriter(BackgroundWriter(raw, close_raw=close_raw), CHUNK_SIZE)
+    
+    return stream if binary else io.TextIOWrapper(stream, encoding=encoding)
+
+
+def open_pipeline_output(file_path: str, binary: bool = False) -> IO[Any]:
+    """
+    Открывает выходной файл этапа записи конвейера.
+    
+    Запись (и сжатие для файла со сжатым расширением) выполняется
+    в фоновом потоке параллельно с форматированием.
+    
+    Args:
+        file_path: Путь к файлу
+        binary: Открыть ли файл в двоичном режиме
+        
+    Returns:
+        Текстовый поток в кодировке UTF-8 или двоичный поток
+    """
+    if is_compressed(file_path):
+        return open_output(file_path, binary)
+    
+    return background_output(open(file_path, 'wb'), binary)
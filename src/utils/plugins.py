@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import importlib
+from typing import Any, List, Optional
+
+
+def load_object(path: str) -> Any:
+    """
+    Импортирует объект по пути вида 'пакет.модуль:Имя'.
+    
+    Args:
+        path: Путь к объекту
+        
+    Returns:
+        Импортированный объект
+        
+    Raises:
+        ImportError: Если модуль или объект не найден
+    """
+    module_name, _, attribute = path.partition(':')
+    module = importlib.import_module(module_name)
+    
+    if not attribute:
+        return module
+    
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ImportError(f"В модуле {module_name} нет объекта {attribute}") from None
+
+
+def _entry_points(group: str) -> List[Any]:
+    # importlib.metadata импортируется и просматривает установленные пакеты
+    # заметно дольше остального запуска, поэтому он загружается только
+    # когда запрошенного типа нет среди встроенных
+    from importlib.metadata import entry_points
+    
+    points = entry_points()
+    
+    # До Python 3.10 entry_points() возвращает словарь групп и не принимает group
+    if hasattr(points, 'select'):
+        return list(points.select(group=group))
+    
+    return list(points.get(group, ()))
+
+
+def entry_point_names(group: str) -> List[str]:
+    """
+    Возвращает имена точек входа группы, не загружая их.
+    
+    Args:
+        group: Группа точек входа (например, reports.generators)
+        
+    Returns:
+        Список имен
+    """
+    return [entry_point.name for entry_point in _entry_points(group)]
+
+
+def load_entry_point(group: str, name: str) -> Optional[Any]:
+    """
+    Загружает объект, зарегистрированный установленным пакетом как точка входа.
+    
+    Args:
+        group: Группа точек входа
+        name: Имя точки входа
+        
+    Returns:
+        Загруженный объект или None, если точки входа нет
+    """
+    for entry_point in _entry_points(group):
+        if entry_point.name == name:
+            return entry_point.load()
+    
+    return None
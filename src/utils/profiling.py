@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+import sys
+import time
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Количество элементов, которое обертка итератора получает за один замер,
+# чтобы накладные расходы на часы не зависели от числа строк
+PROFILE_CHUNK_SIZE = 1024
+
+
+def peak_rss(children: bool = False) -> Optional[int]:
+    """
+    Возвращает пиковый размер резидентной памяти процесса.
+    
+    Args:
+        children: Вернуть пиковый размер среди завершенных дочерних
+            процессов вместо текущего процесса
+        
+    Returns:
+        Размер в байтах или None, если платформа его не сообщает
+    """
+    if resource is None:
+        return None
+    
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    
+    # В macOS значение возвращается в байтах, в Linux - в килобайтах
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def children_cpu_time() -> float:
+    """
+    Возвращает процессорное время завершенных дочерних процессов в секундах.
+    """
+    if resource is None:
+        return 0.0
+    
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    
+    return usage.ru_utime + usage.ru_stime
+
+
+class StageStats:
+    """
+    Накопленные измерения одного этапа обработки.
+    
+    Время вложенных этапов учитывается отдельно и вычитается из времени
+    этапа, поэтому wall и cpu - собственное время этапа.
+    """
+    
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_wall = 0.0
+        self.total_cpu = 0.0
+        self.nested_wall = 0.0
+        self.nested_cpu = 0.0
+        self.peak_rss: Optional[int] = None
+    
+    @property
+    def wall(self) -> float:
+        return self.total_wall - self.nested_wall
+    
+    @property
+    def cpu(self) -> float:
+        return self.total_cpu - self.nested_cpu
+
+
+class Profiler:
+    """
+    Измерение времени и памяти этапов построения отчета.
+    
+    Для каждого этапа (чтение, генерация, сортировка, запись и т.д.)
+    накапливаются собственное астрономическое и процессорное время, а
+    также пиковый RSS процесса к концу этапа. Этапы потоковой обработки
+    чередуются: запись запрашивает элементы у генератора, генератор -
+    строки у читателя. Поэтому ленивые источники оборачиваются через
+    iterate, а время вложенных этапов вычитается из объемлющего.
+    
+    Дополнительно можно сохранить дамп cProfile всего запуска и снимок
+    tracemalloc на момент его окончания. Выключенный профилировщик
+    ничего не измеряет и возвращает источники без оберток.
+    """
+    
+    def __init__(self, enabled: bool = True, profile_file: Optional[str] = None,
+                 snapshot_file: Optional[str] = None) -> None:
+        """
+        Args:
+            enabled: Выполнять ли измерения
+            profile_file: Путь к файлу для дампа cProfile (формат pstats)
+            snapshot_file: Путь к файлу для снимка tracemalloc
+        """
+        self.enabled = enabled or bool(profile_file or snapshot_file)
+        self.profile_file = profile_file
+        self.snapshot_file = snapshot_file
+        self.rows = 0
+        self.stages: Dict[str, StageStats] = {}
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.children_cpu = 0.0
+        self.traced_peak: Optional[int] = None
+        self._stack: List[StageStats] = []
+        self._started: Optional[tuple] = None
+        self._cprofile: Optional[Any] = None
+    
+    def start(self) -> None:
+        """
+        Начинает измерение всего запуска.
+        """
+        if not self.enabled:
+            return
+        
+        # cProfile и tracemalloc импортируются, только если они запрошены
+        if self.snapshot_file:
+            import tracemalloc
+            tracemalloc.start()
+        
+        if self.profile_file:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        
+        self._started = (time.perf_counter(), time.process_time(), children_cpu_time())
+    
+    def stop(self) -> None:
+        """
+        Завершает измерение и сохраняет дамп cProfile и снимок tracemalloc, если они заданы.
+        """
+        if not self.enabled or self._started is None:
+            return
+        
+        wall, cpu, children_cpu = self._started
+        self.wall = time.perf_counter() - wall
+        self.cpu = time.process_time() - cpu
+        self.children_cpu = children_cpu_time() - children_cpu
+        self._started = None
+        
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.profile_file)
+            self._cprofile = None
+        
+        if self.snapshot_file:
+            import tracemalloc
+            
+            if tracemalloc.is_tracing():
+                self.traced_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.take_snapshot().dump(self.snapshot_file)
+                tracemalloc.stop()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Учитывает время выполнения блока в этапе name.
+        
+        Args:
+            name: Название этапа
+            
+        Yields:
+            None
+        """
+        if not self.enabled:
+            yield
+            return
+        
+        stats = self.stages.setdefault(name, StageStats())
+        parent = self._stack[-1] if self._stack else None
+        self._stack.append(stats)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self._stack.pop()
+            
+            stats.calls += 1
+            stats.total_wall += wall
+            stats.total_cpu += cpu
+            stats.peak_rss = peak_rss()
+            
+            if parent is not None:
+                parent.nested_wall += wall
+                parent.nested_cpu += cpu
+    
+    def iterate(self, name: str, iterable: Iterable[Any], count_rows: bool = False) -> Iterator[Any]:
+        """
+        Оборачивает ленивый источник так, что его вычисление учитывается в этапе name.
+        
+        Элементы запрашиваются у источника по PROFILE_CHUNK_SIZE штук.
+        
+        Args:
+            name: Название этапа
+            iterable: Источник элементов
+            count_rows: Учитывать ли элементы как прочитанные строки
+            
+        Returns:
+            Итератор тех же элементов
+        """
+        if not self.enabled:
+            return iter(iterable)
+        
+        return self._iterate(name, iter(iterable), count_rows)
+    
+    def _iterate(self, name: str, iterator: Iterator[Any], count_rows: bool) -> Iterator[Any]:
+        while True:
+            with self.stage(name):
+                chunk = list(islice(iterator, PROFILE_CHUNK_SIZE))
+            
+            if not chunk:
+                return
+            
+            if count_rows:
+                self.rows += len(chunk)
+            
+            yield from chunk
+    
+    def wrap_report(self, name: str, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Оборачивает ленивые значения отчета так, что их вычисление учитывается в этапе name.
+        
+        Args:
+            name: Название этапа
+            report_data: Данные отчета, возможно с ленивыми значениями
+            
+        Returns:
+            Данные отчета с обернутыми итераторами и функциями
+        """
+        if not self.enabled:
+            return report_data
+        
+        wrapped = {}
+        
+        for key, value in report_data.items():
+            if isinstance(value, Iterator):
+                value = self.iterate(name, value)
+            elif callable(value):
+                value = self._wrap_call(name, value)
+            
+            wrapped[key] = value
+        
+        return wrapped
+    
+    def _wrap_call(self, name: str, function: Any) -> Any:
+        def call() -> Any:
+            with self.stage(name):
+                return function()
+        
+        return call
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает измерения в виде, пригодном для сохранения в JSON.
+        
+        Returns:
+            Словарь с итогами запуска и измерениями по этапам. Строки в
+            секунду считаются по числу прочитанных строк и собственному
+            времени этапа
+        """
+        stages = {}
+        
+        for name, stats in self.stages.items():
+            stages[name] = {
+                'calls': stats.calls,
+                'wall': stats.wall,
+                'cpu': stats.cpu,
+                'rows_per_second': self.rows / stats.wall if stats.wall > 0 else None,
+                'peak_rss': stats.peak_rss,
+            }
+        
+        return {
+            'rows': self.rows,
+            'wall': self.wall,
+            'cpu': self.cpu,
+            'children_cpu': self.children_cpu,
+            'rows_per_second': self.rows / self.wall if self.wall > 0 else None,
+            'peak_rss': peak_rss(),
+            'children_peak_rss': peak_rss(children=True),
+            'traced_peak': self.traced_peak,
+            'profile_file': self.profile_file,
+            'snapshot_file': self.snapshot_file,
+            'stages': stages,
+        }
+    
+    def summary(self) -> str:
+        """
+        Формирует текстовую таблицу измерений.
+        
+        Returns:
+            Текст таблицы
+        """
+        data = self.to_dict()
+        lines = [f"Статистика выполнения: строк {data['rows']}, время {data['wall']:.3f} с, "
+                 f"процессор {data['cpu']:.3f} с, пиковый RSS {_format_bytes(data['peak_rss'])}",
+                 f"  {'Этап':<12}{'Время, с':>12}{'ЦП, с':>12}{'Строк/с':>14}{'RSS':>12}"]
+        
+        for name, stage in data['stages'].items():
+            rate = f"{stage['rows_per_second']:.0f}" if stage['rows_per_second'] else '-'
+            lines.append(f"  {name:<12}{stage['wall']:>12.3f}{stage['cpu']:>12.3f}{rate:>14}"
+                         f"{_format_bytes(stage['peak_rss']):>12}")
+        
+        if data['children_cpu']:
+            lines.append(f"  Процессорное время дочерних процессов: {data['children_cpu']:.3f} с, "
+                         f"пиковый RSS {_format_bytes(data['children_peak_rss'])}")
+        
+        if data['traced_peak'] is not None:
+            lines.append(f"  Пик памяти по tracemalloc: {_format_bytes(data['traced_peak'])}")
+        
+        return '\n'.join(lines)
+    
+    def report(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Выводит таблицу измерений.
+        
+        Args:
+            stream: Поток вывода (по умолчанию sys.stderr, чтобы статистика
+                не смешивалась с отчетом, выводимым в консоль)
+        """
+        if self.enabled:
+            print(self.summary(), file=stream or sys.stderr)
+    
+    def write_json(self, output_file: str) -> None:
+        """
+        Сохраняет измерения в JSON файл.
+        
+        Args:
+            output_file: Путь к файлу
+        """
+        import json
+        
+        with open(output_file, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2, ensure_ascii=False)
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return '-'
+    
+    return f"{size / 2 ** 20:.1f} МБ"
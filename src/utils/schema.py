@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.diagnostics import Diagnostics, INVALID_VALUE
+from src.utils.employee_table import RATE_COLUMNS
+
+
+# Типы колонок: строка, число с плавающей точкой и категория (строка
+# из небольшого набора значений, например название отдела)
+STRING = 'str'
+FLOAT = 'float'
+CATEGORY = 'category'
+
+COLUMN_TYPES = (STRING, FLOAT, CATEGORY)
+
+# Типы известных колонок; остальные колонки считаются строками
+DEFAULT_TYPES: Dict[str, str] = dict({'hours_worked': FLOAT, 'department': CATEGORY},
+                                     **{column: FLOAT for column in RATE_COLUMNS})
+
+# Количество строк, колонки которых преобразуются за один раз
+CONVERT_BATCH_SIZE = 8192
+
+# Количество примеров некорректных значений в сводке ошибок
+MAX_EXAMPLES = 3
+
+
+class ConversionErrors:
+    """
+    Сводка ошибок преобразования значений одного файла.
+    
+    Вместо сообщения на каждую строку накапливает количество пропущенных
+    строк, число ошибок по колонкам и несколько примеров, которые после
+    чтения файла выводятся одним предупреждением или передаются в общий
+    сборщик предупреждений.
+    """
+    
+    def __init__(self, diagnostics: Optional[Diagnostics] = None) -> None:
+        """
+        Args:
+            diagnostics: Сборщик предупреждений. Если указан, сводка
+                передается в него, а не выводится
+        """
+        self.diagnostics = diagnostics
+        self.max_examples = diagnostics.max_examples if diagnostics is not None else MAX_EXAMPLES
+        self.rows = 0
+        self.columns: Dict[str, int] = {}
+        self.examples: List[Tuple[str, str, str]] = []
+    
+    def __bool__(self) -> bool:
+        return self.rows > 0
+    
+    def add(self, column: str, label: str, value: Any) -> None:
+        """
+        Учитывает некорректное значение колонки.
+        
+        Args:
+            column: Название колонки
+            label: Имя сотрудника из строки с ошибкой
+            value: Значение, которое не удалось преобразовать
+        """
+        self.columns[column] = self.columns.get(column, 0) + 1
+        
+        if len(self.examples) < self.max_examples:
+            self.examples.append((label, column, value))
+    
+    def summary(self, file_path: str) -> str:
+        """
+        Формирует текст сводки ошибок.
+        
+        Args:
+            file_path: Путь к файлу, при чтении которого возникли ошибки
+            
+        Returns:
+            Текст предупреждения
+        """
+        columns = ', '.join(f"{column}: {count}" for column, count in self.columns.items())
+        
+        return (f"Предупреждение: В файле {file_path} пропущено строк с некорректными значениями: "
+                f"{self.rows} ({columns}). Примеры: {', '.join(self._format_examples())}")
+    
+    def _format_examples(self) -> List[str]:
+        return [f"{label} ({column}={value!r})" for label, column, value in self.examples]
+    
+    def report(self, file_path: str) -> None:
+        """
+        Выводит сводку ошибок или передает ее в сборщик предупреждений, если ошибки были.
+        
+        Args:
+            file_path: Путь к файлу, при чтении которого возникли ошибки
+        """
+        if not self:
+            return
+        
+        if self.diagnostics is not None:
+            self.diagnostics.extend(file_path, INVALID_VALUE, self.rows, self._format_examples())
+        else:
+            print(self.summary(file_path))
+
+
+class Schema:
+    """
+    Схема типов колонок CSV файла.
+    
+    Типы определяются один раз на файл по заголовку: явно объявленные
+    типы имеют приоритет над известными (часы и ставки - числа, отдел -
+    категория), остальные колонки остаются строками. Значения
+    преобразуются не построчно, а целыми колонками пакета строк.
+    """
+    
+    def __init__(self, types: Optional[Dict[str, str]] = None) -> None:
+        """
+        Args:
+            types: Явно объявленные типы колонок
+            
+        Raises:
+            ValueError: Если указан неизвестный тип
+        """
+        for column, column_type in (types or {}).items():
+            if column_type not in COLUMN_TYPES:
+                raise ValueError(f"Неизвестный тип '{column_type}' колонки {column}")
+        
+        self.types = dict(DEFAULT_TYPES, **(types or {}))
+    
+    def infer(self, header: Sequence[str]) -> Dict[str, str]:
+        """
+        Определяет типы колонок по заголовку файла.
+        
+        Args:
+            header: Заголовок файла
+            
+        Returns:
+            Словарь типов колонок по их названиям
+        """
+        return {column: self.types.get(column, STRING) for column in header}
+    
+    def convert(self, header: Sequence[str], rows: List[List[str]], columns: Sequence[str],
+                errors: ConversionErrors) -> Dict[str, List[Any]]:
+        """
+        Преобразует колонки пакета строк в значения своих типов.
+        
+        Строки, в которых не удалось преобразовать хотя бы одно значение,
+        исключаются из всех колонок и учитываются в сводке ошибок.
+        
+        Args:
+            header: Заголовок файла
+            rows: Списки значений строк
+            columns: Названия колонок, которые нужно извлечь. Колонки,
+                отсутствующие в заголовке, пропускаются
+            errors: Сводка ошибок файла
+            
+        Returns:
+            Словарь списков значений по названию колонки
+        """
+        positions = {column: index for index, column in enumerate(header)}
+        name_index = positions['name'] if 'name' in columns and 'name' in positions else None
+        types = self.infer(header)
+        converted: Dict[str, List[Any]] = {}
+        invalid = set()
+        
+        for column in columns:
+            if column not in positions:
+                continue
+            
+            index = positions[column]
+            values = [row[index] for row in rows]
+            converted[column], failed = _CONVERTERS[types[column]](values)
+            
+            for position in failed:
+                label = rows[position][name_index] if name_index is not None else ''
+                errors.add(column, label, values[position])
+            
+            invalid.update(failed)
+        
+        if invalid:
+            errors.rows += len(invalid)
+            
+            for column, values in converted.items():
+                converted[column] = [value for position, value in enumerate(values) if position not in invalid]
+        
+        return converted
+
+
+def _convert_strings(values: List[str]) -> Tuple[List[Any], List[int]]:
+    return values, []
+
+
+def _convert_categories(values: List[str]) -> Tuple[List[Any], List[int]]:
+    """
+    Преобразует значения категориальной колонки, интернируя повторяющиеся строки.
+    
+    Args:
+        values: Значения колонки
+        
+    Returns:
+        Кортеж (значения, позиции некорректных значений)
+    """
+    return [sys.intern(value) for value in values], []
+
+
+def _convert_floats(values: List[str]) -> Tuple[List[Any], List[int]]:
+    """
+    Преобразует значения колонки в числа.
+    
+    Сначала колонка преобразуется целиком; только если в ней есть
+    некорректное значение, значения проверяются по одному.
+    
+    Args:
+        values: Значения колонки
+        
+    Returns:
+        Кортеж (значения, позиции некорректных значений)
+    """
+    try:
+        return list(map(float, values)), []
+    except ValueError:
+        pass
+    
+    converted = []
+    failed = []
+    
+    for position, value in enumerate(values):
+        try:
+            converted.append(float(value))
+        except ValueError:
+            converted.append(0.0)
+            failed.append(position)
+    
+    return converted, failed
+
+
+_CONVERTERS: Dict[str, Callable[[List[str]], Tuple[List[Any], List[int]]]] = {
+    STRING: _convert_strings,
+    FLOAT: _convert_floats,
+    CATEGORY: _convert_categories,
+}
+
+DEFAULT_SCHEMA = Schema()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+from src.reports.aggregation import HashAggregator
+
+
+def test_add_columns():
+    """
+    Тест агрегации пакетов строк по ключу.
+    """
+    aggregator = HashAggregator()
+    aggregator.add_columns(['Design', 'Sales', 'Design'], [150.0, 100.0, 170.0], [40.0, 30.0, 60.0],
+                           [6000.0, 3000.0, 10200.0])
+    aggregator.add_columns(['Design'], [120.0], [50.0], [6000.0])
+    
+    groups = dict(aggregator.items())
+    
+    assert len(aggregator) == 2
+    assert list(groups) == ['Design', 'Sales']
+    assert groups['Design'] == [3, 440.0, 150.0, 22200.0, 120.0, 170.0]
+    assert groups['Sales'] == [1, 100.0, 30.0, 3000.0, 100.0, 100.0]
+
+
+def test_add_state():
+    """
+    Тест объединения уже вычисленных счетчиков.
+    """
+    aggregator = HashAggregator()
+    aggregator.add_columns(['Design'], [150.0], [40.0], [6000.0])
+    aggregator.add_state('Design', 2, 290.0, 110.0, 13200.0, 120.0, 170.0)
+    aggregator.add_state('Sales', 1, 100.0, 30.0, 3000.0, 100.0, 100.0)
+    
+    groups = dict(aggregator.items())
+    
+    assert groups['Design'] == [3, 440.0, 150.0, 19200.0, 120.0, 170.0]
+    assert groups['Sales'] == [1, 100.0, 30.0, 3000.0, 100.0, 100.0]
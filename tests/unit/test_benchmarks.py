@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import json
+import os
+
+import pytest
+
+from benchmarks import startup
+from benchmarks.generate_data import generate_csv, ensure_dataset, parse_size
+from benchmarks.run_benchmarks import STAGES, compare, main, run
+from benchmarks.startup import parse_import_times
+from src.utils.csv_reader import CSVDialect, CSVReader, RFC4180_DIALECT
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE
+
+
+def test_parse_size():
+    """
+    Тест преобразования размера набора данных в количество строк.
+    """
+    assert parse_size('10k') == 10_000
+    assert parse_size('1M') == 1_000_000
+    assert parse_size('250') == 250
+    
+    with pytest.raises(ValueError):
+        parse_size('many')
+
+
+def test_generate_csv_with_bad_lines(tmpdir):
+    """
+    Тест генерации файла с дополнительными колонками и некорректными строками.
+    """
+    file_path = str(tmpdir.join('employees.csv'))
+    generate_csv(file_path, 1000, extra_columns=3, bad_line_rate=0.05, bad_value_rate=0.05, seed=1)
+    
+    with open(file_path, 'r', encoding='utf-8') as file:
+        lines = file.read().splitlines()
+    
+    assert len(lines) == 1001
+    assert lines[0].split(',')[-3:] == ['extra_0', 'extra_1', 'extra_2']
+    
+    diagnostics = Diagnostics()
+    rows = CSVReader.read_file(file_path, diagnostics=diagnostics)
+    malformed = diagnostics.counts[(file_path, MALFORMED_LINE)]
+    
+    assert 0 < malformed < 150
+    assert len(rows) == 1000 - malformed
+    assert sum(row['hours_worked'] == 'n/a' for row in rows) > 0
+
+
+def test_generate_csv_with_quoted_rows(tmpdir):
+    """
+    Тест генерации выгрузки со строками в кавычках: в диалекте rfc4180
+    разбираются все строки, а имена содержат разделитель.
+    """
+    file_path = str(tmpdir.join('quoted.csv'))
+    generate_csv(file_path, 1000, extra_columns=1, seed=1, quoted_rate=0.5)
+    
+    rows = CSVReader.read_file(file_path, diagnostics=Diagnostics(), dialect=CSVDialect(RFC4180_DIALECT))
+    quoted = sum(',' in row['name'] for row in rows)
+    
+    assert len(rows) == 1000
+    assert 300 < quoted < 700
+    assert len(CSVReader.read_file(file_path, diagnostics=Diagnostics())) == 1000 - quoted
+
+
+def test_ensure_dataset_reuses_file(tmpdir):
+    """
+    Тест повторного использования сгенерированного набора данных.
+    """
+    first = ensure_dataset(str(tmpdir), 10, seed=3)
+    modified = os.path.getmtime(first)
+    
+    assert ensure_dataset(str(tmpdir), 10, seed=3) == first
+    assert os.path.getmtime(first) == modified
+    assert ensure_dataset(str(tmpdir), 10, seed=4) != first
+
+
+def test_run_collects_stage_results(tmpdir):
+    """
+    Тест результатов бенчмарка по всем этапам.
+    """
+    results = run(['50'], str(tmpdir), bad_value_rate=0.1, repeat=2)
+    
+    assert json.loads(json.dumps(results)) == results
+    assert len(results['results']) == 1
+    
+    result = results['results'][0]
+    
+    assert result['rows'] == 50
+    assert list(result['stages']) == [name for name, _ in STAGES]
+    
+    for stage in result['stages'].values():
+        assert len(stage['runs']) == 2
+        assert stage['best'] <= stage['median']
+        assert stage['peak_memory'] > 0
+
+
+def test_compare_detects_regression():
+    """
+    Тест обнаружения регрессии при сравнении с базовыми результатами.
+    """
+    baseline = {'results': [{'dataset': 'a.csv', 'stages': {'read_file': {'best': 1.0}, 'generate': {'best': 1.0}}}]}
+    current = {'results': [
+        {'dataset': 'a.csv', 'stages': {'read_file': {'best': 1.05}, 'generate': {'best': 1.5}}},
+        {'dataset': 'b.csv', 'stages': {'read_file': {'best': 9.0}}},
+    ]}
+    
+    comparisons = compare(current, baseline, threshold=1.1)
+    
+    assert [(item['stage'], item['regression']) for item in comparisons] == [('read_file', False), ('generate', True)]
+
+
+def test_main_writes_results(tmpdir, capsys):
+    """
+    Тест сохранения результатов и сравнения с ними без регрессии.
+    """
+    output_file = str(tmpdir.join('results.json'))
+    args = ['--sizes', '20', '--repeat', '1', '--no-memory', '--data-dir', str(tmpdir.join('data'))]
+    
+    assert main(args + ['--output', output_file]) == 0
+    
+    with open(output_file, 'r', encoding='utf-8') as file:
+        results = json.load(file)
+    
+    assert results['results'][0]['stages']['read_file']['peak_memory'] is None
+    assert main(args + ['--compare', output_file, '--threshold', '1000']) == 0
+    assert 'РЕГРЕССИЯ' not in capsys.readouterr().out
+
+
+def test_parse_import_times():
+    """
+    Тест разбора вывода -X importtime.
+    """
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _csv\n"
+        "import time:       300 |        420 | csv\n"
+        "some other output\n"
+    )
+    
+    assert parse_import_times(output) == [
+        {'module': '_csv', 'depth': 1, 'self_us': 120, 'cumulative_us': 120},
+        {'module': 'csv', 'depth': 0, 'self_us': 300, 'cumulative_us': 420},
+    ]
+
+
+def test_startup_run():
+    """
+    Тест бенчмарка запуска: результаты содержат время запуска и импорты пакета src.
+    """
+    results = startup.run(repeat=1, rows=10)
+    
+    assert results['main_ms']['best'] > 0
+    assert results['within_budget'] == (results['overhead_ms'] <= startup.STARTUP_BUDGET_MS)
+    assert any(item['module'].startswith('src.') for item in results['slowest_imports'])
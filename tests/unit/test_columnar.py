@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+import io
+import json
+
+import pytest
+
+from src.reports.columnar import ArrowFormatter, Column, ColumnarFormatter, ColumnarReader, infer_columns
+from src.reports.department_report import DepartmentReportGenerator
+from src.reports.formatters import FormatterFactory
+from src.reports.report_generator import PayoutReportGenerator
+from src.utils.employee_table import EmployeeTable
+
+
+@pytest.fixture
+def sample_table():
+    """
+    Фикстура, создающая таблицу сотрудников с запятыми и не-ASCII символами в строках.
+    """
+    table = EmployeeTable()
+    
+    for index in range(10):
+        table.append(f"Сотрудник {index}", 'Design' if index % 2 else 'Отдел, продажи', 100.0 + index, 10.5)
+    
+    return table
+
+
+def write_report(tmpdir, formatter, report_data):
+    """
+    Записывает отчет форматером в файл и возвращает путь к нему.
+    """
+    path = str(tmpdir.join('report.bin'))
+    
+    with open(path, 'wb') as file:
+        formatter.write(report_data, file)
+    
+    return path
+
+
+def test_columnar_round_trip(tmpdir, sample_table):
+    """
+    Тест записи ленивого отчета пакетами и чтения колонок через отображение в память.
+    """
+    expected = PayoutReportGenerator().generate(sample_table)
+    path = write_report(tmpdir, ColumnarFormatter(batch_size=3), PayoutReportGenerator().generate_stream(sample_table))
+    
+    with ColumnarReader(path) as reader:
+        columns = reader.read_columns()
+        
+        assert reader.num_rows == 10
+        assert reader.num_batches == 4
+        assert reader.report == {'report_type': 'payout', 'total': expected['total']}
+        assert [column.type for column in reader.columns] == ['utf8', 'utf8', 'float64', 'float64', 'float64']
+    
+    assert [dict(zip(columns, values)) for values in zip(*columns.values())] == expected['items']
+
+
+def test_columnar_numeric_columns_are_views(tmpdir, sample_table):
+    """
+    Тест чтения числовых колонок пакета без копирования.
+    """
+    path = write_report(tmpdir, ColumnarFormatter(), DepartmentReportGenerator().generate(sample_table))
+    
+    with ColumnarReader(path) as reader:
+        batch = reader.read_batch(0)
+        employees = batch['employees']
+        
+        assert isinstance(employees, memoryview)
+        assert employees.format == 'q'
+        assert employees.tolist() == [5, 5]
+        assert batch['department'] == ['Отдел, продажи', 'Design']
+        
+        employees.release()
+        batch.clear()
+
+
+def test_columnar_empty_report(tmpdir):
+    """
+    Тест отчета без элементов: пустая схема и итог в метаданных.
+    """
+    path = write_report(tmpdir, ColumnarFormatter(), {'report_type': 'payout', 'items': iter([]), 'total': lambda: 0.0})
+    
+    with ColumnarReader(path) as reader:
+        assert reader.columns == []
+        assert reader.num_rows == 0
+        assert reader.read_columns() == {}
+        assert reader.report == {'report_type': 'payout', 'total': 0.0}
+
+
+def test_columnar_reader_rejects_other_files(tmpdir):
+    """
+    Тест чтения файла другого формата.
+    """
+    path = tmpdir.join('report.json')
+    path.write('{"items": [], "total": 0}' * 4)
+    
+    with pytest.raises(ValueError):
+        ColumnarReader(str(path))
+
+
+def test_infer_columns():
+    """
+    Тест определения типов колонок по первому пакету.
+    """
+    batch = [{'name': 'a', 'count': 1, 'amount': 1, 'flag': True},
+             {'name': 'b', 'count': 2, 'amount': 2.5, 'flag': False}]
+    
+    assert infer_columns(batch) == [Column('name', 'utf8'), Column('count', 'int64'),
+                                    Column('amount', 'float64'), Column('flag', 'bool')]
+    
+    with pytest.raises(TypeError):
+        infer_columns([{'name': None}])
+
+
+def test_columnar_rejects_values_of_other_type():
+    """
+    Тест элемента, значения которого не соответствуют схеме первого пакета.
+    """
+    items = [{'name': 'a', 'count': 1}, {'name': 'b', 'count': 'много'}]
+    
+    with pytest.raises(ValueError):
+        ColumnarFormatter(batch_size=1).format({'items': items, 'total': 0})
+    
+    with pytest.raises(ValueError):
+        ColumnarFormatter(batch_size=1).format({'items': [{'name': 'a'}, {'count': 1}], 'total': 0})
+
+
+def test_formatter_factory_binary_formats():
+    """
+    Тест регистрации двоичных форматов в фабрике.
+    """
+    formatter = FormatterFactory.get_formatter('columnar')
+    
+    assert isinstance(formatter, ColumnarFormatter)
+    assert formatter.binary
+    assert not FormatterFactory.get_formatter('json').binary
+
+
+def test_arrow_formatter(sample_table):
+    """
+    Тест файла Arrow IPC: колонки в пакетах и итог в метаданных последнего пакета.
+    """
+    pa = pytest.importorskip('pyarrow')
+    expected = PayoutReportGenerator(top=5).generate(sample_table)
+    stream = io.BytesIO()
+    
+    ArrowFormatter(batch_size=2).write(PayoutReportGenerator(top=5).generate_stream(sample_table), stream)
+    
+    reader = pa.ipc.open_file(pa.BufferReader(stream.getvalue()))
+    _, metadata = reader.get_batch_with_custom_metadata(reader.num_record_batches - 1)
+    
+    assert reader.num_record_batches == 3
+    assert reader.read_all().to_pylist() == expected['items']
+    assert json.loads(metadata[b'report']) == {'report_type': 'payout', 'total': expected['total']}
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+import bz2
+import gzip
+import lzma
+import threading
+
+import pytest
+
+from src.utils.compression import (BackgroundReader, compression_suffix, open_input, open_output,
+                                   strip_compression_suffix)
+from src.utils.csv_reader import CSVReader, CSVRangeReader
+from src.utils.diagnostics import Diagnostics
+
+
+CSV_DATA = (
+    "id,email,name,department,hours_worked,hourly_rate\n"
+    "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
+    "2,bob@example.com,Bob Smith,Design,150,40\n"
+    "3,carol@example.com,Carol Williams,Design,170,60\n"
+    "broken line\n"
+)
+
+COMPRESSORS = {
+    '.gz': gzip.compress,
+    '.bz2': bz2.compress,
+    '.xz': lzma.compress,
+}
+
+
+@pytest.fixture(params=sorted(COMPRESSORS))
+def compressed_file(request, tmpdir):
+    """
+    Фикстура, создающая сжатый CSV файл и такой же несжатый.
+    """
+    plain = tmpdir.join('data.csv')
+    plain.write(CSV_DATA)
+    compressed = tmpdir.join('data.csv' + request.param)
+    compressed.write_binary(COMPRESSORS[request.param](CSV_DATA.encode('utf-8')))
+    
+    return str(compressed), str(plain)
+
+
+def test_compression_suffix():
+    """
+    Тест определения расширения сжатия.
+    """
+    assert compression_suffix('data.CSV.GZ') == '.gz'
+    assert compression_suffix('data.csv.zst') == '.zst'
+    assert compression_suffix('data.csv') is None
+    assert strip_compression_suffix('archive/data.csv.bz2') == 'archive/data.csv'
+
+
+def test_read_compressed_file(compressed_file):
+    """
+    Тест чтения сжатого файла: результат совпадает с несжатым, включая предупреждения.
+    """
+    compressed, plain = compressed_file
+    diagnostics = Diagnostics()
+    
+    assert list(CSVReader.iter_rows(compressed)) == list(CSVReader.iter_rows(plain))
+    assert list(CSVReader.read_table(compressed, diagnostics=diagnostics)) == list(CSVReader.read_table(plain))
+    assert diagnostics.total == 1
+    assert CSVReader.read_header(compressed) == CSVReader.read_header(plain)
+
+
+def test_compressed_file_is_one_range(compressed_file):
+    """
+    Тест диапазонов сжатого файла: файл не делится, диапазон читается целиком.
+    """
+    compressed, plain = compressed_file
+    ranges = CSVReader.split_ranges(compressed, 16)
+    
+    assert len(ranges) == 1
+    
+    reader = CSVRangeReader(compressed, *ranges[0])
+    
+    assert list(reader.iter_rows()) == list(CSVReader.iter_rows(plain))
+    assert reader.lines_read == 4
+    assert reader.malformed == [(4, 'broken line')]
+
+
+@pytest.mark.parametrize('suffix', sorted(COMPRESSORS))
+def test_open_output_compresses(tmpdir, suffix):
+    """
+    Тест сжатия выходного файла по расширению.
+    """
+    path = str(tmpdir.join('report.json' + suffix))
+    
+    with open_output(path) as file:
+        file.write(CSV_DATA * 1000)
+    
+    with open(path, 'rb') as file:
+        assert file.read(len(CSV_DATA)) != CSV_DATA.encode('utf-8')
+    
+    with open_input(path) as file:
+        assert file.read() == CSV_DATA * 1000
+
+
+def test_background_reader_propagates_errors(tmpdir):
+    """
+    Тест передачи ошибки распаковки из фонового потока читателю.
+    """
+    path = tmpdir.join('data.csv.gz')
+    path.write_binary(gzip.compress(CSV_DATA.encode('utf-8') * 1000)[:500])
+    
+    with pytest.raises(EOFError):
+        with open_input(str(path)) as file:
+            file.read()
+
+
+def test_background_reader_stops_on_close(tmpdir):
+    """
+    Тест закрытия читателя до конца файла: фоновый поток завершается.
+    """
+    path = tmpdir.join('data.csv.gz')
+    path.write_binary(gzip.compress(CSV_DATA.encode('utf-8') * 100000))
+    reader = BackgroundReader(gzip.open(str(path), 'rb'), chunk_size=1024, queue_size=2)
+    
+    assert reader.read(10) == CSV_DATA[:10].encode('utf-8')
+    
+    reader.close()
+    
+    assert not any(thread.name == 'reports-decompress' for thread in threading.enumerate())
+
+
+def test_read_zstandard_file(tmpdir):
+    """
+    Тест чтения файла .zst при установленном пакете zstandard.
+    """
+    zstandard = pytest.importorskip('zstandard')
+    path = tmpdir.join('data.csv.zst')
+    path.write_binary(zstandard.ZstdCompressor().compress(CSV_DATA.encode('utf-8')))
+    
+    assert [row['name'] for row in CSVReader.iter_rows(str(path))] == ['Alice Johnson', 'Bob Smith', 'Carol Williams']
+    assert len(CSVReader.split_ranges(str(path), 16)) == 1
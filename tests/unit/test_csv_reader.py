@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
+import csv
 import os
 import pytest
 import tempfile
 from typing import List, Dict, Any
 
-from src.utils.csv_reader import CSVReader
+from src.utils.csv_reader import CSVDialect, CSVReader, CSVRangeReader, QUOTED_SAMPLE_LINES, RFC4180_DIALECT
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE, INVALID_VALUE
+from src.utils.schema import Schema
 
 
 @pytest.fixture
@@ -102,4 +105,299 @@ def test_read_file_with_different_rate_column():
         assert result[0]['salary'] == '50'
     finally:
         if os.path.exists(temp_file_path):
-            os.remove(temp_file_path) 
\ No newline at end of file
+            os.remove(temp_file_path) 
+
+def test_iter_rows_is_lazy(sample_csv_file):
+    """
+    Тест ленивого построчного чтения CSV файла.
+    """
+    rows = CSVReader.iter_rows(sample_csv_file)
+    
+    # Генератор не читает файл до первого обращения
+    assert not isinstance(rows, list)
+    
+    first_row = next(rows)
+    assert first_row['name'] == 'Alice Johnson'
+    
+    remaining = list(rows)
+    assert len(remaining) == 2
+    assert remaining[-1]['hourly_rate'] == '60'
+
+
+def test_iter_rows_skips_malformed_lines(capsys):
+    """
+    Тест пропуска некорректных строк при потоковом чтении.
+    """
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
+        temp_file.write("id,email,name,department,hours_worked,hourly_rate\n")
+        temp_file.write("1,alice@example.com,Alice Johnson,Marketing,160,50\n")
+        temp_file.write("broken,line\n")
+        temp_file.write("\n")
+        temp_file.write("2,bob@example.com,Bob Smith,Design,150,40\n")
+        temp_file_path = temp_file.name
+    
+    try:
+        result = list(CSVReader.iter_rows(temp_file_path))
+        
+        assert [row['name'] for row in result] == ['Alice Johnson', 'Bob Smith']
+        assert "Некорректная строка 3" in capsys.readouterr().out
+    finally:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+
+def test_read_table(sample_csv_file):
+    """
+    Тест чтения CSV файла в колоночную таблицу.
+    """
+    table = CSVReader.read_table(sample_csv_file)
+    
+    assert len(table) == 3
+    assert table.names[0] == 'Alice Johnson'
+    assert table.department(1) == 'Design'
+    assert list(table.hours) == [160.0, 150.0, 170.0]
+    assert list(table.rates) == [50.0, 40.0, 60.0]
+    
+    # Повторное чтение дописывает строки в существующую таблицу
+    CSVReader.read_table(sample_csv_file, table)
+    assert len(table) == 6
+    assert table.departments == ['Marketing', 'Design']
+
+
+def test_split_ranges_aligned_to_lines(sample_csv_file):
+    """
+    Тест разбиения файла на диапазоны по границам строк.
+    """
+    with open(sample_csv_file, 'rb') as file:
+        content = file.read()
+    
+    ranges = CSVReader.split_ranges(sample_csv_file, 10)
+    
+    # Диапазоны идут подряд от конца заголовка до конца файла
+    assert ranges[0][0] == content.index(b'\n') + 1
+    assert ranges[-1][1] == len(content)
+    for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert end == next_start
+        assert content[end - 1:end] == b'\n'
+    
+    rows = [row for start, end in ranges for row in CSVRangeReader(sample_csv_file, start, end).iter_rows()]
+    assert rows == CSVReader.read_file(sample_csv_file)
+
+
+def test_split_ranges_empty_file(empty_csv_file):
+    """
+    Тест разбиения пустого файла.
+    """
+    assert CSVReader.split_ranges(empty_csv_file, 10) == []
+
+
+def test_range_reader_collects_malformed_lines(sample_csv_file):
+    """
+    Тест накопления некорректных строк с номерами относительно диапазона.
+    """
+    with open(sample_csv_file, 'a') as file:
+        file.write("broken,line\n")
+        file.write("4,dan@example.com,Dan Brown,Sales,100,30\n")
+    
+    start, end = CSVReader.split_ranges(sample_csv_file, 1024)[0]
+    reader = CSVRangeReader(sample_csv_file, start, end)
+    table = reader.read_table()
+    
+    assert len(table) == 4
+    assert reader.lines_read == 5
+    assert reader.malformed == [(4, 'broken,line')]
+
+
+def test_iter_rows_projection(sample_csv_file):
+    """
+    Тест чтения только нужных колонок.
+    """
+    result = list(CSVReader.iter_rows(sample_csv_file, ['name', 'hourly_rate', 'salary']))
+    
+    assert result[0] == {'name': 'Alice Johnson', 'hourly_rate': '50'}
+    assert len(result) == 3
+    
+    start, end = CSVReader.split_ranges(sample_csv_file, 1024)[0]
+    range_rows = list(CSVRangeReader(sample_csv_file, start, end, ['department']).iter_rows())
+    assert range_rows == [{'department': 'Marketing'}, {'department': 'Design'}, {'department': 'Design'}]
+
+
+def test_iter_rows_projection_keeps_malformed_check(capsys):
+    """
+    Тест проверки числа колонок при частичном разборе строки.
+    """
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
+        temp_file.write("name,department,hours_worked,hourly_rate,comment\n")
+        temp_file.write("Alice Johnson,Marketing,160,50,ok\n")
+        temp_file.write("Bob Smith,Design,150,40,extra,column\n")
+        temp_file_path = temp_file.name
+    
+    try:
+        result = list(CSVReader.iter_rows(temp_file_path, ['name']))
+        
+        assert result == [{'name': 'Alice Johnson'}]
+        assert "Некорректная строка 3" in capsys.readouterr().out
+    finally:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+
+def test_iter_rows_with_schema(capsys):
+    """
+    Тест чтения строк с преобразованием значений по схеме и сводкой ошибок.
+    """
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
+        temp_file.write("name,department,hours_worked,rate\n")
+        temp_file.write("Alice Johnson,Marketing,160,50\n")
+        temp_file.write("Bob Smith,Design,n/a,40\n")
+        temp_file.write("Carol Williams,Design,170,?\n")
+        temp_file.write("Dan Brown,Design,120,45\n")
+        temp_file_path = temp_file.name
+    
+    try:
+        result = list(CSVReader.iter_rows(temp_file_path, schema=Schema()))
+        output = capsys.readouterr().out
+        
+        assert result == [
+            {'name': 'Alice Johnson', 'department': 'Marketing', 'hours_worked': 160.0, 'rate': 50.0},
+            {'name': 'Dan Brown', 'department': 'Design', 'hours_worked': 120.0, 'rate': 45.0},
+        ]
+        assert output.count("Предупреждение") == 1
+        assert "пропущено строк с некорректными значениями: 2 (hours_worked: 1, rate: 1)" in output
+    finally:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+
+def test_iter_rows_collects_diagnostics(capsys):
+    """
+    Тест учета проблем во входных данных в сборщике вместо вывода.
+    """
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
+        temp_file.write("name,department,hours_worked,rate\n")
+        temp_file.write("Alice Johnson,Marketing,160,50\n")
+        temp_file.write("broken,line\n")
+        temp_file.write("Bob Smith,Design,n/a,40\n")
+        temp_file_path = temp_file.name
+    
+    try:
+        diagnostics = Diagnostics()
+        result = list(CSVReader.iter_rows(temp_file_path, schema=Schema(), diagnostics=diagnostics))
+        
+        assert len(result) == 1
+        assert capsys.readouterr().out == ''
+        assert diagnostics.counts == {(temp_file_path, MALFORMED_LINE): 1, (temp_file_path, INVALID_VALUE): 1}
+        assert diagnostics.examples[(temp_file_path, MALFORMED_LINE)] == ["строка 3: broken,line"]
+    finally:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+
+def test_rfc4180_dialect(tmpdir):
+    """
+    Тест диалекта rfc4180: кавычки, разделители и переводы строк внутри полей, BOM.
+    """
+    csv_file = tmpdir.join("export.csv")
+    csv_file.write_binary(
+        '\ufeffname,department,hours_worked,hourly_rate\r\n'
+        '"Smith, John","Sales, EMEA",160,50\r\n'
+        '"Multi\r\nLine ""Q""",Design,150,40\r\n'
+        '\r\n'
+        'Carol,Design,170\r\n'
+        'Dan,Design,100,20\r\n'.encode('utf-8'))
+    
+    diagnostics = Diagnostics()
+    rows = list(CSVReader.iter_rows(str(csv_file), diagnostics=diagnostics, dialect=CSVDialect(RFC4180_DIALECT)))
+    
+    assert [row['name'] for row in rows] == ['Smith, John', 'Multi\r\nLine "Q"', 'Dan']
+    assert rows[0] == {'name': 'Smith, John', 'department': 'Sales, EMEA', 'hours_worked': '160', 'hourly_rate': '50'}
+    assert diagnostics.examples[(str(csv_file), MALFORMED_LINE)] == ["строка 6: Carol,Design,170"]
+    
+    # В диалекте simple кавычки не учитываются: строка с запятой в поле
+    # некорректна, а поле с переводом строки разрывает запись
+    simple_rows = CSVReader.read_file(str(csv_file), diagnostics=Diagnostics())
+    assert [row['hours_worked'] for row in simple_rows] == ['150', '100']
+
+
+def test_rfc4180_custom_delimiter(tmpdir):
+    """
+    Тест диалекта rfc4180 с другим разделителем и чтения в колоночную таблицу.
+    """
+    csv_file = tmpdir.join("export.csv")
+    csv_file.write('name;department;hours_worked;rate\n"Smith; John";Sales;160;50\nBob;Design;150;40\n')
+    dialect = CSVDialect(RFC4180_DIALECT, ';')
+    
+    table = CSVReader.read_table(str(csv_file), dialect=dialect)
+    
+    assert table.names == ['Smith; John', 'Bob']
+    assert list(table.hours) == [160.0, 150.0]
+    assert CSVReader.read_file(str(csv_file), dialect=CSVDialect(delimiter=';'), diagnostics=Diagnostics()) == [
+        {'name': 'Bob', 'department': 'Design', 'hours_worked': '150', 'rate': '40'}
+    ]
+
+
+def test_rfc4180_mostly_quoted_file(tmpdir):
+    """
+    Тест файла, в котором кавычки есть в каждой строке: после выборки
+    строк остаток файла разбирается модулем csv, номера строк сохраняются.
+    """
+    lines = ['"name","hours_worked"\n']
+    lines += [f'"Name\n{index}","{index}"\n' for index in range(QUOTED_SAMPLE_LINES)]
+    lines += ['"broken"\n', '"Last","1"\n']
+    csv_file = tmpdir.join("quoted.csv")
+    csv_file.write(''.join(lines))
+    
+    diagnostics = Diagnostics()
+    rows = list(CSVReader.iter_rows(str(csv_file), diagnostics=diagnostics, dialect=CSVDialect(RFC4180_DIALECT)))
+    
+    assert len(rows) == QUOTED_SAMPLE_LINES + 1
+    assert rows[-2] == {'name': f'Name\n{QUOTED_SAMPLE_LINES - 1}', 'hours_worked': str(QUOTED_SAMPLE_LINES - 1)}
+    assert diagnostics.examples[(str(csv_file), MALFORMED_LINE)] == [f"строка {2 * QUOTED_SAMPLE_LINES + 2}: broken"]
+
+
+@pytest.mark.parametrize('sample_lines', [QUOTED_SAMPLE_LINES, 1])
+def test_rfc4180_matches_csv_module(tmpdir, monkeypatch, sample_lines):
+    """
+    Тест пробелов по краям строк: как и в модуле csv, отрезается только
+    перевод строки, и строки с кавычками и без них разбираются одинаково
+    (в том числе после перехода на модуль csv).
+    """
+    monkeypatch.setattr('src.utils.csv_reader.QUOTED_SAMPLE_LINES', sample_lines)
+    content = ('name,department,hours_worked,hourly_rate\r\n'
+               '"Alice" ,Sales,160, 50 \n'
+               '  Bob ,Sales,10, 5 \r\n'
+               '\tCarol,"Design",170,60\t\n'
+               '   \n'
+               'Dan,Design,170 \n')
+    csv_file = tmpdir.join("spaces.csv")
+    csv_file.write_binary(content.encode('utf-8'))
+    header, *records = csv.reader(content.splitlines(keepends=True))
+    
+    diagnostics = Diagnostics()
+    rows = CSVReader.read_file(str(csv_file), diagnostics=diagnostics, dialect=CSVDialect(RFC4180_DIALECT))
+    
+    assert rows == [dict(zip(header, record)) for record in records if len(record) == len(header)]
+    assert rows[1] == {'name': '  Bob ', 'department': 'Sales', 'hours_worked': '10', 'hourly_rate': ' 5 '}
+    assert diagnostics.examples[(str(csv_file), MALFORMED_LINE)] == ['строка 6: Dan,Design,170 ']
+
+
+@pytest.mark.parametrize('sample_lines', [QUOTED_SAMPLE_LINES, 2])
+def test_rfc4180_unterminated_quote(tmpdir, monkeypatch, sample_lines):
+    """
+    Тест незакрытой кавычки: строка учитывается как некорректная, а разбор
+    продолжается со следующей строки (в том числе после перехода на модуль csv).
+    """
+    monkeypatch.setattr('src.utils.csv_reader.QUOTED_SAMPLE_LINES', sample_lines)
+    csv_file = tmpdir.join("broken.csv")
+    csv_file.write('name,department,hours_worked,hourly_rate\n'
+                   '"Alice","Sales",160,50\n'
+                   '"Bob","Design",150,40\n'
+                   '"Carol,Design,170,60\n'
+                   'Dan,Design,100,20\n'
+                   'Eve,Sales,120,30\n')
+    
+    diagnostics = Diagnostics()
+    rows = list(CSVReader.iter_rows(str(csv_file), diagnostics=diagnostics, dialect=CSVDialect(RFC4180_DIALECT)))
+    
+    assert [row['name'] for row in rows] == ['Alice', 'Bob', 'Dan', 'Eve']
+    assert diagnostics.examples[(str(csv_file), MALFORMED_LINE)] == ['строка 4: незакрытая кавычка: "Carol,Design,170,60']
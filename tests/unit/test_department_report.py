@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.reports.department_report import DepartmentReportGenerator
+from src.reports.report_generator import ReportFactory
+from src.utils.employee_table import EmployeeTable
+
+
+@pytest.fixture
+def sample_employees_data():
+    """
+    Фикстура, создающая тестовые данные сотрудников.
+    """
+    return [
+        {'name': 'Alice Johnson', 'department': 'Marketing', 'hours_worked': '160', 'hourly_rate': '50'},
+        {'name': 'Bob Smith', 'department': 'Design', 'hours_worked': '150', 'rate': '40'},
+        {'name': 'Carol Williams', 'department': 'Design', 'hours_worked': '170', 'salary': '60'},
+        {'name': 'Dan Brown', 'department': 'Design', 'hours_worked': 'n/a', 'hourly_rate': '60'},
+    ]
+
+
+def test_department_report(sample_employees_data):
+    """
+    Тест агрегации выплат по отделам.
+    """
+    report_data = DepartmentReportGenerator().generate(sample_employees_data)
+    
+    assert report_data['report_type'] == 'department'
+    assert report_data['total'] == 24200.0
+    assert report_data['items'] == [
+        {
+            'department': 'Marketing',
+            'employees': 1,
+            'hours': 160.0,
+            'mean_rate': 50.0,
+            'min_hours': 160.0,
+            'max_hours': 160.0,
+            'amount': 8000.0
+        },
+        {
+            'department': 'Design',
+            'employees': 2,
+            'hours': 320.0,
+            'mean_rate': 50.0,
+            'min_hours': 150.0,
+            'max_hours': 170.0,
+            'amount': 16200.0
+        },
+    ]
+    # Сумма ставок нужна только для объединения и в выводимые поля не входит
+    assert [item.rate_sum for item in report_data['items']] == [50.0, 100.0]
+
+
+def test_department_report_from_table(sample_employees_data):
+    """
+    Тест отчета по отделам на колоночной таблице.
+    """
+    generator = DepartmentReportGenerator()
+    table = EmployeeTable.from_rows(sample_employees_data)
+    
+    assert generator.generate(table) == generator.generate(sample_employees_data)
+
+
+def test_department_report_merge(sample_employees_data):
+    """
+    Тест объединения частичных отчетов по отделам.
+    """
+    generator = DepartmentReportGenerator()
+    
+    merged = generator.merge([
+        generator.generate(sample_employees_data[:2]),
+        generator.generate(sample_employees_data[2:]),
+    ])
+    
+    assert merged == generator.generate(sample_employees_data)
+
+
+def test_department_report_registered():
+    """
+    Тест регистрации отчета по отделам в фабрике.
+    """
+    assert isinstance(ReportFactory.get_generator('department'), DepartmentReportGenerator)
+    assert 'department' in ReportFactory.get_report_types()
+
+
+def test_department_report_merge_keeps_rate_sum():
+    """
+    Тест объединения частичных отчетов: сумма ставок переносится точно,
+    а не восстанавливается по средней ставке.
+    """
+    generator = DepartmentReportGenerator()
+    employees_data = [{'name': f'Name {i}', 'department': 'Sales', 'hours_worked': '1', 'hourly_rate': rate}
+                      for i, rate in enumerate(['27.74', '45.03', '49.66'])]
+    partial_report = generator.generate(employees_data)
+    
+    merged = generator.merge([partial_report, generator.merge([partial_report])])
+    
+    assert merged['items'][0].rate_sum == 2 * partial_report['items'][0].rate_sum
+    assert merged['items'][0]['mean_rate'] == 2 * partial_report['items'][0].rate_sum / 6
+
+
+def test_department_report_rejects_top():
+    """
+    Тест отчета по отделам: параметры отбора лучших записей не принимаются.
+    """
+    assert ReportFactory.get_unsupported_options('department', {'top': 5, 'top_by': 'department'}) == \
+        ['top', 'top_by']
+    assert ReportFactory.get_unsupported_options('department', {'include_items': False}) == []
+    assert ReportFactory.get_unsupported_options('payout', {'top': 5, 'top_by': 'department'}) == []
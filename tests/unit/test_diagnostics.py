@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+import json
+
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE, INVALID_VALUE
+
+
+def test_add_keeps_first_examples():
+    """
+    Тест подсчета проблем с сохранением только первых примеров.
+    """
+    diagnostics = Diagnostics(max_examples=2)
+    
+    for line_num in range(2, 7):
+        diagnostics.add('a.csv', MALFORMED_LINE, f"строка {line_num}: bad")
+    
+    diagnostics.add(None, INVALID_VALUE, "Bob: could not convert string to float: 'x'")
+    
+    assert diagnostics.total == 6
+    assert diagnostics.counts == {('a.csv', MALFORMED_LINE): 5, ('', INVALID_VALUE): 1}
+    assert diagnostics.examples[('a.csv', MALFORMED_LINE)] == ["строка 2: bad", "строка 3: bad"]
+    
+    summary = diagnostics.summary()
+    assert "a.csv: некорректные строки - 5" in summary
+    assert "... и еще 3" in summary
+    assert "источник не указан: некорректные значения - 1" in summary
+
+
+def test_merge():
+    """
+    Тест объединения сборщиков, например рабочих процессов.
+    """
+    first = Diagnostics(max_examples=2)
+    first.add('a.csv', MALFORMED_LINE, "строка 2: bad")
+    
+    second = Diagnostics()
+    second.extend('a.csv', MALFORMED_LINE, 3, ["строка 10: bad", "строка 11: bad"])
+    second.add('b.csv', INVALID_VALUE, "Dan (hours_worked='x')")
+    
+    first.merge(second)
+    
+    assert first.counts == {('a.csv', MALFORMED_LINE): 4, ('b.csv', INVALID_VALUE): 1}
+    assert first.examples[('a.csv', MALFORMED_LINE)] == ["строка 2: bad", "строка 10: bad"]
+
+
+def test_report_and_json(tmpdir, capsys):
+    """
+    Тест вывода сводки и ее сохранения в JSON.
+    """
+    diagnostics = Diagnostics()
+    diagnostics.report()
+    assert capsys.readouterr().err == ''
+    
+    diagnostics.add('a.csv', MALFORMED_LINE, "строка 2: bad")
+    diagnostics.report()
+    assert "Предупреждения при обработке данных: 1" in capsys.readouterr().err
+    
+    json_file = tmpdir.join("diagnostics.json")
+    diagnostics.write_json(str(json_file))
+    
+    assert json.loads(json_file.read_text('utf-8')) == {
+        'total': 1,
+        'files': {'a.csv': {MALFORMED_LINE: {'count': 1, 'examples': ["строка 2: bad"]}}}
+    }
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+import os
+
+import pytest
+
+from src.utils.employee_merge import EmployeeMerger
+
+
+@pytest.fixture
+def duplicated_rows():
+    """
+    Фикстура, создающая строки сотрудников, встречающихся в нескольких файлах.
+    """
+    return [
+        {'email': 'alice@example.com', 'name': 'Alice Johnson', 'department': 'Marketing',
+         'hours_worked': '160', 'hourly_rate': '50'},
+        {'email': 'bob@example.com', 'name': 'Bob Smith', 'department': 'Design',
+         'hours_worked': '150', 'hourly_rate': '40'},
+        {'email': 'carol@example.com', 'name': 'Carol Williams', 'department': 'Design',
+         'hours_worked': '170', 'rate': '60'},
+        {'email': 'alice@example.com', 'name': 'Alice J.', 'department': 'Marketing',
+         'hours_worked': '40', 'hourly_rate': '50'},
+        {'email': 'bob@example.com', 'name': 'Bob Smith', 'department': 'Design',
+         'hours_worked': '50', 'hourly_rate': '80'},
+    ]
+
+
+@pytest.mark.parametrize('max_keys', [100, 1])
+def test_merge_sums_hours(duplicated_rows, tmpdir, max_keys):
+    """
+    Тест объединения строк по ключу в памяти и через дисковые разделы.
+    """
+    merger = EmployeeMerger('email', max_keys=max_keys, partitions=3, temp_dir=str(tmpdir))
+    rows = list(merger.merge(duplicated_rows))
+    
+    assert rows == [
+        {'name': 'Alice Johnson', 'department': 'Marketing', 'hours_worked': 200.0, 'hourly_rate': 50.0},
+        {'name': 'Bob Smith', 'department': 'Design', 'hours_worked': 200.0, 'hourly_rate': 50.0},
+        {'name': 'Carol Williams', 'department': 'Design', 'hours_worked': 170.0, 'hourly_rate': 60.0},
+    ]
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_merge_skips_invalid_rows(capsys):
+    """
+    Тест пропуска строк с некорректными числами и строк без ключа.
+    """
+    rows = [
+        {'name': 'Alice', 'hours_worked': 'x', 'hourly_rate': '50'},
+        {'name': 'Bob', 'hours_worked': None, 'hourly_rate': '50'},
+        {'name': '', 'hours_worked': '10', 'hourly_rate': '5'},
+        {'name': '', 'hours_worked': '20', 'hourly_rate': '5'},
+    ]
+    
+    merged = list(EmployeeMerger('name').merge(rows))
+    
+    assert [row['hours_worked'] for row in merged] == [10.0, 20.0]
+    output = capsys.readouterr().out
+    assert "Ошибка обработки данных для Alice" in output
+    assert "Ошибка обработки данных для Bob" in output
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+import pytest
+from array import array
+
+from src.utils.diagnostics import Diagnostics, INVALID_VALUE
+from src.utils.employee_table import EmployeeTable, resolve_rate_column
+
+
+@pytest.fixture
+def sample_table():
+    """
+    Фикстура, создающая таблицу с тестовыми данными сотрудников.
+    """
+    table = EmployeeTable()
+    table.append('Alice Johnson', 'Marketing', 160.0, 50.0)
+    table.append('Bob Smith', 'Design', 150.0, 40.0)
+    table.append('Carol Williams', 'Design', 170.0, 60.0)
+    return table
+
+
+def test_table_columns(sample_table):
+    """
+    Тест колоночного хранения данных.
+    """
+    assert len(sample_table) == 3
+    assert isinstance(sample_table.hours, array)
+    assert isinstance(sample_table.rates, array)
+    assert list(sample_table.hours) == [160.0, 150.0, 170.0]
+    
+    # Отделы хранятся в виде словаря уникальных значений
+    assert sample_table.departments == ['Marketing', 'Design']
+    assert list(sample_table.department_codes) == [0, 1, 1]
+    assert sample_table.department(2) == 'Design'
+
+
+def test_table_iter_rows(sample_table):
+    """
+    Тест обхода таблицы в виде словарей.
+    """
+    rows = list(sample_table)
+    
+    assert rows[0] == {
+        'name': 'Alice Johnson',
+        'department': 'Marketing',
+        'hours_worked': 160.0,
+        'hourly_rate': 50.0
+    }
+
+
+def test_table_extend_recodes_departments(sample_table):
+    """
+    Тест объединения таблиц с разными словарями отделов.
+    """
+    other = EmployeeTable()
+    other.append('Dan Brown', 'Sales', 100.0, 30.0)
+    other.append('Eve Black', 'Design', 120.0, 45.0)
+    
+    sample_table.extend(other)
+    
+    assert len(sample_table) == 5
+    assert sample_table.departments == ['Marketing', 'Design', 'Sales']
+    assert sample_table.department(3) == 'Sales'
+    assert sample_table.department(4) == 'Design'
+
+
+def test_table_from_rows_skips_invalid_values():
+    """
+    Тест построения таблицы из словарей с разными колонками ставки.
+    """
+    table = EmployeeTable.from_rows([
+        {'name': 'Alice', 'department': 'Marketing', 'hours_worked': '160', 'hourly_rate': '50'},
+        {'name': 'Bob', 'department': 'Design', 'hours_worked': '150', 'salary': '40'},
+        {'name': 'Carol', 'department': 'Design', 'hours_worked': 'n/a', 'rate': '60'},
+    ])
+    
+    assert table.names == ['Alice', 'Bob']
+    assert list(table.rates) == [50.0, 40.0]
+
+
+def test_table_from_rows_collects_diagnostics(capsys):
+    """
+    Тест построения таблицы: некорректные значения учитываются в сборщике
+    предупреждений, а не выводятся.
+    """
+    diagnostics = Diagnostics()
+    
+    table = EmployeeTable.from_rows([
+        {'name': 'Alice', 'department': 'Marketing', 'hours_worked': '160', 'hourly_rate': '50'},
+        {'name': 'Carol', 'department': 'Design', 'hours_worked': None, 'rate': '60'},
+    ], diagnostics=diagnostics)
+    
+    assert table.names == ['Alice']
+    assert diagnostics.counts == {('', INVALID_VALUE): 1}
+    assert capsys.readouterr().out == ''
+
+
+def test_resolve_rate_column():
+    """
+    Тест определения колонки со ставкой.
+    """
+    assert resolve_rate_column(['name', 'rate', 'salary']) == 'rate'
+    assert resolve_rate_column(['name', 'salary', 'hourly_rate']) == 'hourly_rate'
+    assert resolve_rate_column(['name']) is None
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+import os
+import random
+
+import pytest
+
+from src.utils.external_sort import ExternalSorter, sort_items
+
+
+@pytest.mark.parametrize('run_size, fan_in', [(1000, 64), (7, 64), (3, 2)])
+def test_sort_matches_sorted(tmpdir, run_size, fan_in):
+    """
+    Тест совпадения внешней сортировки со встроенной, в том числе при нескольких проходах слияния.
+    """
+    values = [random.Random(seed).randint(0, 20) for seed in range(100)]
+    sorter = ExternalSorter(lambda value: value, run_size=run_size, fan_in=fan_in, temp_dir=str(tmpdir))
+    
+    assert list(sorter.sort(values)) == sorted(values)
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_sort_items_is_stable_descending(tmpdir):
+    """
+    Тест устойчивой сортировки элементов отчета по убыванию.
+    """
+    items = [{'name': name, 'amount': amount}
+             for name, amount in [('A', 10.0), ('B', 30.0), ('C', 10.0), ('D', 30.0), ('E', 20.0)]]
+    
+    result = sort_items(items, 'amount', reverse=True, run_size=2, temp_dir=str(tmpdir))
+    
+    assert [item['name'] for item in result] == ['B', 'D', 'E', 'A', 'C']
+
+
+def test_sort_items_missing_field():
+    """
+    Тест ошибки при сортировке по отсутствующему полю.
+    """
+    with pytest.raises(ValueError):
+        list(sort_items([{'amount': 1.0}, {'amount': 2.0}], 'name'))
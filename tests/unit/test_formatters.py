@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
+import io
 import json
 import pytest
 from typing import Dict, Any
 
-from src.reports.formatters import FormatterFactory, JsonFormatter, ReportFormatter, TextFormatter
+from src.reports.formatters import FormatterFactory, JsonFormatter, ReportFormatter, TextFormatter, TextTableWriter
 
 
 @pytest.fixture
@@ -119,4 +120,129 @@ def test_text_formatter(sample_report_data):
     
     # Проверяем наличие итоговой суммы
     assert "Итого" in result
-    assert "24200.00" in result 
\ No newline at end of file
+    assert "24200.00" in result 
+
+@pytest.mark.parametrize('data', [
+    {},
+    {'report_type': 'payout', 'items': [], 'total': 0},
+    {'report_type': 'payout', 'items': [{}], 'total': 0.5},
+    {'report_type': 'отчет', 'items': [{'name': 'Иван "Ваня"\n', 'tags': [1, [2, {}]]}], 'meta': {'a': [], 'b': None}},
+    {'report_type': 'payout', 'items': [{'name': 'Иван, "Ваня"', 'hours': 1.5, 'rate': float('nan'), 'ok': True, 'n': None}],
+     'meta': {'count': 1, 'max': float('inf')}},
+    [1, 2, 3],
+])
+def test_json_formatter_matches_json_dumps(data):
+    """
+    Тест побайтового совпадения потокового JSON с json.dumps.
+    """
+    assert JsonFormatter().format(data) == json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def test_json_formatter_write_streams_items(sample_report_data):
+    """
+    Тест потоковой записи отчета с ленивыми элементами.
+    """
+    expected = json.dumps(sample_report_data, ensure_ascii=False, indent=2)
+    consumed = []
+    
+    def iter_items():
+        for item in sample_report_data['items']:
+            consumed.append(item['name'])
+            yield item
+    
+    lazy_data = {
+        'report_type': 'payout',
+        'items': iter_items(),
+        # Итог вычисляется только после записи всех элементов
+        'total': lambda: 24200.0 if len(consumed) == 3 else None
+    }
+    
+    stream = io.StringIO()
+    formatter = JsonFormatter()
+    formatter.buffer_size = 2
+    formatter.write(lazy_data, stream)
+    
+    assert stream.getvalue() == expected
+
+
+def test_text_formatter_write(sample_report_data):
+    """
+    Тест записи текстового отчета в поток.
+    """
+    stream = io.StringIO()
+    TextFormatter().write(sample_report_data, stream)
+    
+    assert stream.getvalue() == TextFormatter().format(sample_report_data)
+
+
+def test_text_table_writer_streams_rows(sample_report_data):
+    """
+    Тест потоковой записи строк таблицы до получения итога.
+    """
+    stream = io.StringIO()
+    writer = TextTableWriter(stream, buffer_size=1)
+    
+    writer.write_header()
+    writer.write_row(sample_report_data['items'][0])
+    
+    # Строка записана в поток до вызова write_footer
+    assert "Alice Johnson" in stream.getvalue()
+    assert "Итого" not in stream.getvalue()
+    
+    writer.write_footer(8000.0)
+    lines = stream.getvalue().split("\n")
+    
+    assert lines[-2].startswith("Итого")
+    assert lines[-2].endswith("8000.00")
+    assert lines[-1] == "-" * 80
+
+
+def test_text_formatter_lazy_items(sample_report_data):
+    """
+    Тест текстового форматера с ленивыми элементами и итогом.
+    """
+    lazy_data = {
+        'report_type': 'payout',
+        'items': iter(sample_report_data['items']),
+        'total': lambda: 24200.0
+    }
+    
+    assert TextFormatter().format(lazy_data) == TextFormatter().format(sample_report_data)
+    assert TextFormatter().format({}) == "Нет данных для форматирования"
+
+
+def test_text_formatter_department_layout():
+    """
+    Тест текстовой таблицы отчета по отделам.
+    """
+    report_data = {
+        'report_type': 'department',
+        'items': [{
+            'department': 'Design',
+            'employees': 2,
+            'hours': 320.0,
+            'mean_rate': 50.0,
+            'min_hours': 150.0,
+            'max_hours': 170.0,
+            'amount': 16200.0
+        }],
+        'total': 16200.0
+    }
+    
+    lines = TextFormatter().format(report_data).split("\n")
+    
+    assert "Сотрудники" in lines[1]
+    assert lines[3].split(" | ")[1].strip() == "2"
+    assert lines[3].endswith("16200.00")
+    assert lines[-2].endswith("16200.00")
+
+
+def test_formatter_factory_register_formatter_by_path():
+    """
+    Тест регистрации форматера по пути к классу.
+    """
+    FormatterFactory.register_formatter('text_by_path', 'src.reports.formatters:TextFormatter')
+    
+    assert FormatterFactory.get_formatter_class('text_by_path') is TextFormatter
+    assert isinstance(FormatterFactory.get_formatter('text_by_path'), TextFormatter)
+    assert 'text_by_path' in FormatterFactory.get_format_types()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.reports import incremental
+from src.reports.incremental import CheckpointStore, generate_incremental
+from src.reports.report_generator import PayoutReportGenerator
+from src.utils.csv_reader import CSVReader
+
+
+HEADER = "id,email,name,department,hours_worked,hourly_rate\n"
+
+
+@pytest.fixture
+def timesheet(tmpdir):
+    """
+    Фикстура, создающая дописываемый CSV файл.
+    """
+    csv_file = tmpdir.join("timesheet.csv")
+    csv_file.write(
+        HEADER +
+        "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
+        "2,bob@example.com,Bob Smith,Design,150,40\n"
+    )
+    return csv_file
+
+
+@pytest.fixture
+def store(tmpdir):
+    """
+    Фикстура, создающая хранилище контрольных точек.
+    """
+    return CheckpointStore(str(tmpdir.join("state")))
+
+
+def full_report(csv_file):
+    return PayoutReportGenerator().generate(CSVReader.iter_rows(str(csv_file)))
+
+
+def test_appended_rows_are_merged(timesheet, store, monkeypatch):
+    """
+    Тест разбора только дописанных строк.
+    """
+    report_data, rows = generate_incremental('payout', str(timesheet), store)
+    assert rows == 2
+    assert report_data == full_report(timesheet)
+    
+    size_before = timesheet.size()
+    timesheet.write("3,carol@example.com,Carol Williams,Design,170,60\n", mode='a')
+    
+    ranges = []
+    original = incremental._generate_range
+    
+    def tracking_generate_range(report_generator, file_path, start, end, *args):
+        ranges.append((start, end))
+        return original(report_generator, file_path, start, end, *args)
+    
+    monkeypatch.setattr(incremental, '_generate_range', tracking_generate_range)
+    report_data, rows = generate_incremental('payout', str(timesheet), store)
+    
+    assert ranges == [(size_before, timesheet.size())]
+    assert rows == 3
+    assert report_data['items'] == full_report(timesheet)['items']
+    assert report_data['total'] == pytest.approx(24200.0)
+
+
+def test_incomplete_last_line_is_reparsed(timesheet, store, capsys):
+    """
+    Тест учета незавершенной последней строки с корректными номерами строк.
+    """
+    generate_incremental('payout', str(timesheet), store)
+    
+    timesheet.write("3,carol@example.com,Carol Williams,Design,170,60\nbroken", mode='a')
+    report_data, rows = generate_incremental('payout', str(timesheet), store)
+    assert rows == 3
+    assert "Некорректная строка 5" in capsys.readouterr().out
+    
+    timesheet.write(",line\n4,dan@example.com,Dan Brown,Sales,100,30\n", mode='a')
+    report_data, rows = generate_incremental('payout', str(timesheet), store)
+    
+    assert rows == 4
+    assert [item['name'] for item in report_data['items']] == [
+        'Alice Johnson', 'Bob Smith', 'Carol Williams', 'Dan Brown'
+    ]
+    assert "Некорректная строка 5 в файле" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('content', [
+    HEADER + "1,alice@example.com,Alice Johnson,Marketing,160,50\n",
+    HEADER + "1,alice@example.com,Alice Johnson,Marketing,100,50\n"
+             "2,bob@example.com,Bob Smith,Design,150,40\n"
+             "3,carol@example.com,Carol Williams,Design,170,60\n",
+])
+def test_rewritten_file_is_rebuilt(timesheet, store, content):
+    """
+    Тест полного перестроения отчета после усечения или перезаписи файла.
+    """
+    generate_incremental('payout', str(timesheet), store)
+    
+    with open(str(timesheet), 'r+') as file:
+        file.write(content)
+        file.truncate()
+    
+    report_data, _ = generate_incremental('payout', str(timesheet), store)
+    
+    assert report_data == full_report(timesheet)
+
+
+def test_compressed_file_is_reparsed_only_when_changed(tmpdir, store, monkeypatch):
+    """
+    Тест сжатого файла: разбирается целиком, отчет переиспользуется, пока файл не изменился.
+    """
+    import gzip
+    
+    path = tmpdir.join("timesheet.csv.gz")
+    rows = HEADER + "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
+    path.write_binary(gzip.compress(rows.encode('utf-8')))
+    
+    report_data, count = generate_incremental('payout', str(path), store)
+    
+    assert count == 1
+    assert report_data == full_report(path)
+    
+    ranges = []
+    original = incremental._generate_range
+    monkeypatch.setattr(incremental, '_generate_range', lambda *args: ranges.append(args[2:4]) or original(*args))
+    
+    assert generate_incremental('payout', str(path), store) == (report_data, 1)
+    assert ranges == []
+    
+    rows += "2,bob@example.com,Bob Smith,Design,150,40\n"
+    path.write_binary(gzip.compress(rows.encode('utf-8')))
+    
+    report_data, count = generate_incremental('payout', str(path), store)
+    
+    assert count == 2
+    assert report_data == full_report(path)
+    assert len(ranges) == 1
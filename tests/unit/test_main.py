@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
+import json
 import os
+import subprocess
+import sys
 import tempfile
 import pytest
 
-from main import validate_files, validate_report_type, validate_format_type, save_to_file
+from main import validate_files, validate_report_type, validate_format_type, save_to_file, write_report
+from src.reports.columnar import ColumnarFormatter
+from src.reports.formatters import JsonFormatter
 
 
 def test_validate_files(tmpdir):
@@ -28,11 +33,25 @@ def test_validate_files(tmpdir):
     assert nonexistent_file not in result
 
 
+def test_validate_compressed_files(tmpdir):
+    """
+    Тест валидации сжатых CSV файлов.
+    """
+    gz_file = tmpdir.join("test.csv.gz")
+    gz_file.write_binary(b"")
+    
+    txt_file = tmpdir.join("test.txt.gz")
+    txt_file.write_binary(b"")
+    
+    assert validate_files([str(gz_file), str(txt_file)]) == [str(gz_file)]
+
+
 def test_validate_report_type():
     """
     Тест функции валидации типа отчета.
     """
     assert validate_report_type('payout') is True
+    assert validate_report_type('department') is True
     assert validate_report_type('nonexistent') is False
 
 
@@ -69,4 +88,172 @@ def test_save_to_file():
     finally:
         # Очистка
         if os.path.exists(temp_file_path):
-            os.remove(temp_file_path) 
\ No newline at end of file
+            os.remove(temp_file_path) 
+
+def test_write_report(tmpdir):
+    """
+    Тест потоковой записи отчета в файл.
+    """
+    output_file = str(tmpdir.join("report.json"))
+    report_data = {'report_type': 'payout', 'items': iter([{'name': 'Alice'}]), 'total': lambda: 1.0}
+    
+    assert write_report(JsonFormatter(), report_data, output_file) is True
+    
+    with open(output_file, 'r', encoding='utf-8') as file:
+        assert json.load(file) == {'report_type': 'payout', 'items': [{'name': 'Alice'}], 'total': 1.0}
+    
+    assert write_report(JsonFormatter(), {}, "/nonexistent/directory/file.json") is False
+
+
+def test_import_does_not_load_optional_modules():
+    """
+    Тест запуска: модули отдельных режимов не импортируются вместе с main.
+    """
+    modules = ['multiprocessing', 'concurrent.futures', 'importlib.metadata', 'numpy', 'tracemalloc', 'cProfile',
+               'mmap', 'src.reports.parallel', 'src.reports.incremental', 'src.reports.department_report',
+               'src.utils.pipeline', 'src.utils.employee_merge', 'src.utils.external_sort', 'src.utils.parse_cache',
+               'tempfile', 'hashlib', 'pickle', 'json', 'csv']
+    code = f"import sys, main; print([name for name in {modules!r} if name in sys.modules])"
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    result = subprocess.run([sys.executable, '-c', code], cwd=root_dir, capture_output=True, text=True, check=True)
+    
+    assert result.stdout.strip() == '[]'
+
+
+def test_write_report_binary(tmpdir):
+    """
+    Тест записи отчета двоичным форматером.
+    """
+    output_file = str(tmpdir.join("report.bin"))
+    formatter = ColumnarFormatter()
+    report_data = {'report_type': 'payout', 'items': [{'name': 'Alice', 'amount': 1.0}], 'total': 1.0}
+    
+    assert write_report(formatter, report_data, output_file) is True
+    
+    with open(output_file, 'rb') as file:
+        assert file.read() == formatter.format(report_data)
+
+
+def test_write_report_pipeline(tmpdir):
+    """
+    Тест записи отчета в фоновом потоке конвейера.
+    """
+    output_file = str(tmpdir.join("report.json"))
+    report_data = {'report_type': 'payout', 'items': iter([{'name': 'Alice'}]), 'total': lambda: 1.0}
+    
+    assert write_report(JsonFormatter(), report_data, output_file, pipeline=True) is True
+    
+    with open(output_file, 'r', encoding='utf-8') as file:
+        assert json.load(file) == {'report_type': 'payout', 'items': [{'name': 'Alice'}], 'total': 1.0}
+
+
+def test_main_pipeline_matches_sequential(tmpdir):
+    """
+    Тест конвейерного режима: вывод совпадает с последовательным выполнением.
+    """
+    csv_file = tmpdir.join("data.csv")
+    csv_file.write("id,email,name,department,hours_worked,hourly_rate\n" +
+                   "".join(f"{i},e{i}@example.com,Name {i},Dept {i % 3},{100 + i},{40 + i % 7}\n" for i in range(5000)) +
+                   "broken line\n")
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    outputs = []
+    
+    for extra in ([], ['--pipeline', '--stats']):
+        result = subprocess.run([sys.executable, 'main.py', str(csv_file), '--report', 'payout', '--no-cache',
+                                 '--sort-by', 'amount', '--format', 'text'] + extra,
+                                cwd=root_dir, capture_output=True, text=True, check=True)
+        outputs.append(result.stdout)
+    
+    assert outputs[0] == outputs[1]
+    assert 'Name 4999' in outputs[1]
+    # Этапы конвейера учитываются вместе, отдельного этапа generate нет
+    assert 'pipeline' in result.stderr
+    assert 'generate' not in result.stderr
+
+
+def test_main_csv_dialect(tmpdir):
+    """
+    Тест параметров --csv-dialect и --delimiter.
+    """
+    csv_file = tmpdir.join("export.csv")
+    csv_file.write('name;department;hours_worked;hourly_rate\n"Smith; John";"Sales; EMEA";10;5\n')
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    command = [sys.executable, 'main.py', str(csv_file), '--report', 'payout', '--no-cache',
+               '--csv-dialect', 'rfc4180', '--delimiter', ';']
+    
+    result = subprocess.run(command, cwd=root_dir, capture_output=True, text=True, check=True)
+    
+    assert json.loads(result.stdout)['items'][0]['name'] == 'Smith; John'
+    
+    result = subprocess.run(command + ['--jobs', '2'], cwd=root_dir, capture_output=True, text=True)
+    
+    assert result.returncode == 1
+    assert '--csv-dialect' in result.stdout
+
+
+def test_main_cache_is_opt_in(tmpdir):
+    """
+    Тест кэша разобранных файлов: обычный запуск и --columnar его не
+    используют, а --cache-dir и переменная окружения включают.
+    """
+    csv_file = tmpdir.join("data.csv")
+    csv_file.write("name,department,hours_worked,hourly_rate\nAlice,Sales,10,5\n")
+    home_dir = tmpdir.mkdir("home")
+    env_dir = tmpdir.join("env_cache")
+    cache_dir = tmpdir.join("cache")
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {name: value for name, value in os.environ.items() if name != 'REPORTS_CACHE_DIR'}
+    env['HOME'] = str(home_dir)
+    command = [sys.executable, 'main.py', str(csv_file), '--report', 'payout']
+    
+    for extra in ([], ['--columnar']):
+        subprocess.run(command + extra, cwd=root_dir, env=env, capture_output=True, text=True, check=True)
+    
+    assert home_dir.listdir() == []
+    
+    subprocess.run(command + ['--cache-dir', str(cache_dir)], cwd=root_dir, env=env, capture_output=True,
+                   text=True, check=True)
+    
+    assert len(cache_dir.listdir()) == 1
+    
+    subprocess.run(command, cwd=root_dir, env=dict(env, REPORTS_CACHE_DIR=str(env_dir)), capture_output=True,
+                   text=True, check=True)
+    
+    assert len(env_dir.listdir()) == 1
+
+
+@pytest.mark.parametrize('extra', [['--columnar'], ['--cache-dir', 'cache'], ['--jobs', '2']])
+def test_main_merge_key_rejects_incompatible_options(tmpdir, extra):
+    """
+    Тест --merge-key: режимы, которые объединение строк не поддерживает,
+    отклоняются, а не отключаются молча.
+    """
+    csv_file = tmpdir.join("data.csv")
+    csv_file.write("name,department,hours_worked,hourly_rate\nAlice,Sales,10,5\n")
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    result = subprocess.run([sys.executable, 'main.py', str(csv_file), '--report', 'payout', '--merge-key', 'name']
+                            + extra, cwd=root_dir, capture_output=True, text=True)
+    
+    assert result.returncode == 1
+    assert '--merge-key' in result.stdout
+
+
+def test_main_profile_written_on_error(tmpdir):
+    """
+    Тест --profile и --trace-memory: файлы сохраняются и при завершении с ошибкой.
+    """
+    csv_file = tmpdir.join("data.csv")
+    csv_file.write("name,department,hours_worked,hourly_rate\n")
+    profile_file = tmpdir.join("run.prof")
+    snapshot_file = tmpdir.join("run.snapshot")
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    result = subprocess.run([sys.executable, 'main.py', str(csv_file), '--report', 'payout',
+                             '--profile', str(profile_file), '--trace-memory', str(snapshot_file)],
+                            cwd=root_dir, capture_output=True, text=True)
+    
+    assert result.returncode == 1
+    assert profile_file.size() > 0
+    assert snapshot_file.size() > 0
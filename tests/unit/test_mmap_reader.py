@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.utils.csv_reader import CSVReader
+from src.utils.employee_table import TABLE_COLUMNS
+from src.utils.mmap_reader import MmapCSVReader
+from src.utils.schema import DEFAULT_SCHEMA
+
+
+@pytest.fixture
+def wide_csv_file(tmpdir):
+    """
+    Фикстура, создающая CSV файл с лишними колонками и некорректной строкой.
+    """
+    csv_file = tmpdir.join("wide.csv")
+    csv_file.write(
+        "id,email,name,department,hours_worked,hourly_rate,comment\r\n"
+        "1,alice@example.com,Alice Johnson,Marketing,160,50,Отпуск\r\n"
+        "broken,line\r\n"
+        "\r\n"
+        "2,bob@example.com,Bob Smith,Design,150,40,\r\n"
+        "3,carol@example.com,Carol Williams,Design,n/a,60,Новый сотрудник\r\n"
+    )
+    return str(csv_file)
+
+
+def test_iter_rows_all_columns(wide_csv_file):
+    """
+    Тест чтения всех колонок через отображение в память.
+    """
+    rows = list(MmapCSVReader(wide_csv_file).iter_rows())
+    
+    assert rows == CSVReader.read_file(wide_csv_file)
+    assert rows[0]['comment'] == 'Отпуск'
+
+
+def test_iter_rows_projection(wide_csv_file, capsys):
+    """
+    Тест декодирования только нужных колонок.
+    """
+    rows = list(MmapCSVReader(wide_csv_file, TABLE_COLUMNS).iter_rows())
+    
+    assert rows[0] == {
+        'name': 'Alice Johnson',
+        'department': 'Marketing',
+        'hours_worked': '160',
+        'hourly_rate': '50'
+    }
+    assert len(rows) == 3
+    assert "Некорректная строка 3" in capsys.readouterr().out
+
+
+def test_iter_rows_schema_skips_unused_columns(tmpdir):
+    """
+    Тест чтения по схеме: ненужные колонки не декодируются, поэтому
+    некорректный UTF-8 в них не мешает чтению.
+    """
+    csv_file = tmpdir.join("binary.csv")
+    csv_file.write_binary(b"name,department,hours_worked,hourly_rate,comment\n"
+                          b"Alice Johnson,Marketing,160,50,\xff\xfe\n")
+    
+    rows = list(MmapCSVReader(str(csv_file), TABLE_COLUMNS, schema=DEFAULT_SCHEMA).iter_rows())
+    
+    assert rows == [{'name': 'Alice Johnson', 'department': 'Marketing', 'hours_worked': 160.0, 'hourly_rate': 50.0}]
+
+
+def test_read_table(wide_csv_file, capsys):
+    """
+    Тест чтения в колоночную таблицу с преобразованием чисел из байтов.
+    """
+    table = MmapCSVReader(wide_csv_file).read_table()
+    
+    assert table.names == ['Alice Johnson', 'Bob Smith']
+    assert list(table.hours) == [160.0, 150.0]
+    assert list(table.rates) == [50.0, 40.0]
+    assert "пропущено строк с некорректными значениями: 1 (hours_worked: 1)" in capsys.readouterr().out
+
+
+def test_read_range_collects_malformed_lines(wide_csv_file):
+    """
+    Тест чтения диапазона байтов с накоплением некорректных строк.
+    """
+    ranges = CSVReader.split_ranges(wide_csv_file, 1)
+    readers = [MmapCSVReader(wide_csv_file, TABLE_COLUMNS, start, end) for start, end in ranges]
+    rows = [row for reader in readers for row in reader.iter_rows()]
+    
+    assert [row['name'] for row in rows] == ['Alice Johnson', 'Bob Smith', 'Carol Williams']
+    assert sum(reader.lines_read for reader in readers) == 5
+    assert readers[1].malformed == [(1, 'broken,line')]
+
+
+def test_empty_file(tmpdir):
+    """
+    Тест чтения пустого файла.
+    """
+    csv_file = tmpdir.join("empty.csv")
+    csv_file.write("")
+    
+    assert list(MmapCSVReader(str(csv_file)).iter_rows()) == []
+    assert len(MmapCSVReader(str(csv_file)).read_table()) == 0
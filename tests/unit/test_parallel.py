@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.reports.parallel import generate_range_report, generate_parallel
+from src.reports.report_generator import PayoutReportGenerator
+from src.utils.csv_reader import CSVReader
+
+
+@pytest.fixture
+def department_files(tmpdir):
+    """
+    Фикстура, создающая несколько CSV файлов по отделам.
+    """
+    marketing = tmpdir.join("marketing.csv")
+    marketing.write(
+        "id,email,name,department,hours_worked,hourly_rate\n"
+        "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
+        "2,dan@example.com,Dan Brown,Marketing,120,45\n"
+    )
+    
+    design = tmpdir.join("design.csv")
+    design.write(
+        "id,email,name,department,hours_worked,rate\n"
+        "3,bob@example.com,Bob Smith,Design,150,40\n"
+        "4,carol@example.com,Carol Williams,Design,170,60\n"
+    )
+    
+    return [str(marketing), str(design)]
+
+
+def test_generate_range_report(department_files):
+    """
+    Тест построения частичного отчета по диапазону файла.
+    """
+    (start, end), = CSVReader.split_ranges(department_files[1], 1024)
+    report_data, rows_read, lines_read, malformed, diagnostics = generate_range_report('payout', department_files[1],
+                                                                                       start, end)
+    
+    assert rows_read == 2
+    assert lines_read == 2
+    assert malformed == []
+    assert diagnostics is None
+    assert [item['name'] for item in report_data['items']] == ['Bob Smith', 'Carol Williams']
+    assert report_data['total'] == 16200.0
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_generate_parallel_keeps_file_order(department_files, columnar):
+    """
+    Тест параллельной обработки файлов с сохранением их порядка.
+    """
+    report_data, rows_read = generate_parallel('payout', department_files, jobs=2, columnar=columnar)
+    
+    rows = [row for file_path in department_files for row in CSVReader.iter_rows(file_path)]
+    expected = PayoutReportGenerator().generate(rows)
+    
+    assert rows_read == 4
+    assert report_data['items'] == expected['items']
+    assert report_data['total'] == pytest.approx(expected['total'])
+
+
+def test_generate_parallel_single_file_chunks(tmpdir, capsys):
+    """
+    Тест разбора одного файла по фрагментам с корректными номерами строк.
+    """
+    csv_file = tmpdir.join("large.csv")
+    lines = ["id,email,name,department,hours_worked,hourly_rate"]
+    for i in range(1, 41):
+        lines.append(f"{i},user{i}@example.com,User {i},Dept {i % 3},{100 + i},{10 + i}")
+    lines[17] = "broken,line"
+    lines[33] = "another,broken,line"
+    csv_file.write("\n".join(lines) + "\n")
+    
+    report_data, rows_read = generate_parallel('payout', [str(csv_file)], jobs=2, chunk_size=100)
+    expected = PayoutReportGenerator().generate(CSVReader.iter_rows(str(csv_file)))
+    output = capsys.readouterr().out
+    
+    assert rows_read == 38
+    assert report_data['items'] == expected['items']
+    assert report_data['total'] == pytest.approx(expected['total'])
+    assert "Некорректная строка 18 в файле" in output
+    assert "Некорректная строка 34 в файле" in output
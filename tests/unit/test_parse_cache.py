@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+import os
+import pytest
+
+from src.utils.csv_reader import CSVReader
+from src.utils.diagnostics import Diagnostics, MALFORMED_LINE
+from src.utils.employee_table import EmployeeTable
+from src.utils.parse_cache import ParseCache
+
+
+@pytest.fixture
+def sample_csv_file(tmpdir):
+    """
+    Фикстура, создающая CSV файл с тестовыми данными.
+    """
+    csv_file = tmpdir.join("data.csv")
+    csv_file.write(
+        "id,email,name,department,hours_worked,hourly_rate\n"
+        "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
+        "broken,line\n"
+        "2,bob@example.com,Bob Smith,Design,150,40\n"
+    )
+    return str(csv_file)
+
+
+def test_get_or_parse_uses_cache(tmpdir, sample_csv_file, capsys):
+    """
+    Тест повторной загрузки разобранного файла из кэша.
+    """
+    cache = ParseCache(str(tmpdir.join("cache")))
+    calls = []
+    
+    def parse(file_path):
+        calls.append(file_path)
+        return CSVReader.read_table(file_path)
+    
+    first = cache.get_or_parse(sample_csv_file, parse)
+    first_output = capsys.readouterr().out
+    second = cache.get_or_parse(sample_csv_file, parse)
+    second_output = capsys.readouterr().out
+    
+    assert calls == [sample_csv_file]
+    assert second.names == first.names
+    assert list(second.hours) == list(first.hours)
+    assert second.departments == first.departments
+    
+    # Сообщения разбора повторяются при загрузке из кэша
+    assert "Некорректная строка 3" in first_output
+    assert second_output == first_output
+
+
+def test_get_or_parse_keeps_diagnostics(tmpdir, sample_csv_file, capsys):
+    """
+    Тест сохранения собранных предупреждений вместе с таблицей.
+    """
+    cache = ParseCache(str(tmpdir.join("cache")))
+    
+    for _ in range(2):
+        diagnostics = Diagnostics()
+        cache.get_or_parse(sample_csv_file, CSVReader.read_table, diagnostics)
+        
+        assert diagnostics.counts == {(sample_csv_file, MALFORMED_LINE): 1}
+    
+    assert "Некорректная строка" not in capsys.readouterr().out
+
+
+def test_changed_file_is_parsed_again(tmpdir, sample_csv_file):
+    """
+    Тест повторного разбора измененного файла.
+    """
+    cache = ParseCache(str(tmpdir.join("cache")))
+    key = cache.file_key(sample_csv_file)
+    
+    cache.get_or_parse(sample_csv_file, CSVReader.read_table)
+    
+    with open(sample_csv_file, 'a') as file:
+        file.write("3,carol@example.com,Carol Williams,Design,170,60\n")
+    
+    assert cache.file_key(sample_csv_file) != key
+    
+    table = cache.get_or_parse(sample_csv_file, CSVReader.read_table)
+    assert len(table) == 3
+
+
+def test_variant_has_separate_entry(tmpdir, sample_csv_file):
+    """
+    Тест отдельных записей кэша для разных параметров разбора.
+    """
+    cache = ParseCache(str(tmpdir.join("cache")))
+    
+    assert cache.file_key(sample_csv_file, 'rfc4180|;') != cache.file_key(sample_csv_file)
+    
+    cache.get_or_parse(sample_csv_file, CSVReader.read_table)
+    table = cache.get_or_parse(sample_csv_file, lambda file_path: EmployeeTable(), variant='rfc4180|;')
+    
+    assert len(table) == 0
+    assert len(cache.get_or_parse(sample_csv_file, CSVReader.read_table)) == 2
+
+
+def test_evict_removes_least_recently_used(tmpdir, sample_csv_file):
+    """
+    Тест вытеснения записей при превышении размера кэша.
+    """
+    cache_dir = str(tmpdir.join("cache"))
+    cache = ParseCache(cache_dir)
+    table = CSVReader.read_table(sample_csv_file)
+    
+    cache.store('old', table)
+    cache.store('new', table)
+    entry_size = os.path.getsize(os.path.join(cache_dir, 'new.pickle'))
+    os.utime(os.path.join(cache_dir, 'old.pickle'), (0, 0))
+    
+    cache.max_size = entry_size
+    cache.evict()
+    
+    assert cache.load('old') is None
+    assert cache.load('new') is not None
+
+
+def test_clear(tmpdir, sample_csv_file):
+    """
+    Тест очистки кэша.
+    """
+    cache = ParseCache(str(tmpdir.join("cache")))
+    cache.store('entry', CSVReader.read_table(sample_csv_file))
+    
+    cache.clear()
+    
+    assert cache.load('entry') is None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import random
+import pytest
+from array import array
+
+from src.reports import payout_engine
+from src.reports.payout_engine import parse_float_columns, compute_amounts
+
+
+def test_parse_float_columns_valid():
+    """
+    Тест пакетного преобразования корректных колонок.
+    """
+    hours, rates, errors = parse_float_columns(['160', '150.5'], ['50', 40])
+    
+    assert hours == [160.0, 150.5]
+    assert rates == [50.0, 40.0]
+    assert errors == []
+
+
+def test_parse_float_columns_reports_invalid_rows():
+    """
+    Тест поиска некорректных строк при преобразовании колонок.
+    """
+    hours, rates, errors = parse_float_columns(['160', 'abc', '170', '10'], ['50', '40', None, '5'])
+    
+    assert hours == [160.0, 10.0]
+    assert rates == [50.0, 5.0]
+    assert [index for index, _ in errors] == [1, 2]
+    assert isinstance(errors[0][1], ValueError)
+    assert isinstance(errors[1][1], TypeError)
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_compute_amounts_matches_row_by_row(monkeypatch, use_numpy):
+    """
+    Тест совпадения векторного расчета с построчным сложением.
+    """
+    if use_numpy and not payout_engine.HAS_NUMPY:
+        pytest.skip("NumPy не установлен")
+    
+    monkeypatch.setattr(payout_engine, 'HAS_NUMPY', use_numpy)
+    
+    rng = random.Random(42)
+    hours = array('d', (rng.uniform(0, 200) for _ in range(1000)))
+    rates = array('d', (rng.uniform(0, 100) for _ in range(1000)))
+    
+    expected_total = 0.5
+    expected_amounts = []
+    for hours_worked, rate in zip(hours, rates):
+        expected_amounts.append(hours_worked * rate)
+        expected_total += hours_worked * rate
+    
+    amounts, total = compute_amounts(hours, rates, 0.5)
+    
+    assert amounts == expected_amounts
+    assert total == expected_total
+
+
+def test_compute_amounts_empty():
+    """
+    Тест расчета по пустым колонкам.
+    """
+    assert compute_amounts([], [], 0) == ([], 0)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import io
+import threading
+
+import pytest
+
+from src.utils.pipeline import PipelineStage, background_output, open_pipeline_output, pipeline_report
+
+
+def test_stage_passes_items_in_order():
+    """
+    Тест этапа конвейера: элементы передаются в исходном порядке и подсчитываются.
+    """
+    stage = PipelineStage('read', range(10), batch_size=3, queue_size=1)
+    
+    assert list(stage) == list(range(10))
+    assert stage.count == 10
+
+
+def test_stage_raises_source_error():
+    """
+    Тест этапа конвейера: ошибка источника выбрасывается у потребителя.
+    """
+    def source():
+        yield 1
+        raise ValueError('ошибка чтения')
+    
+    with pytest.raises(ValueError, match='ошибка чтения'):
+        list(PipelineStage('read', source(), batch_size=1))
+
+
+def test_stage_close_stops_source():
+    """
+    Тест остановки этапа: заблокированный на полной очереди поток
+    завершается, а источник закрывается.
+    """
+    closed = threading.Event()
+    
+    def source():
+        try:
+            while True:
+                yield 0
+        finally:
+            closed.set()
+    
+    with PipelineStage('read', source(), batch_size=2, queue_size=1) as stage:
+        assert next(iter(stage)) == 0
+    
+    assert closed.is_set()
+
+
+def test_pipeline_report_total_after_items():
+    """
+    Тест отчета в конвейере: итог вычисляется после обхода всех элементов.
+    """
+    state = {'total': 0}
+    
+    def items():
+        for value in range(100):
+            state['total'] += value
+            yield {'amount': value}
+    
+    report_data = pipeline_report({'report_type': 'payout', 'items': items(), 'total': lambda: state['total']},
+                                  batch_size=7)
+    
+    assert [item['amount'] for item in report_data['items']] == list(range(100))
+    assert report_data['total']() == sum(range(100))
+
+
+def test_background_output(tmpdir):
+    """
+    Тест фонового вывода: в файл и в поток, который не закрывается.
+    """
+    output_file = str(tmpdir.join('report.txt'))
+    
+    with open_pipeline_output(output_file) as stream:
+        stream.write('Отчет\n')
+    
+    with open(output_file, 'r', encoding='utf-8') as file:
+        assert file.read() == 'Отчет\n'
+    
+    raw = io.BytesIO()
+    
+    with background_output(raw, binary=True, close_raw=False) as stream:
+        stream.write(b'data')
+    
+    assert not raw.closed
+    assert raw.getvalue() == b'data'
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+import importlib.metadata
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.plugins import entry_point_names, load_object
+
+
+class _SelectablePoints(list):
+    """
+    Точки входа в виде, который возвращает entry_points() начиная с Python 3.10.
+    """
+    
+    def select(self, group):
+        return [point for point in self if point.group == group]
+
+
+@pytest.mark.parametrize('make_points', [
+    lambda points: _SelectablePoints(points),
+    lambda points: {'reports.generators': tuple(point for point in points if point.group == 'reports.generators')},
+])
+def test_entry_point_names(monkeypatch, make_points):
+    """
+    Тест поиска точек входа в форматах entry_points() разных версий Python.
+    """
+    points = [SimpleNamespace(name='hours', group='reports.generators'),
+              SimpleNamespace(name='xml', group='reports.formatters')]
+    monkeypatch.setattr(importlib.metadata, 'entry_points', lambda: make_points(points))
+    
+    assert entry_point_names('reports.generators') == ['hours']
+    assert entry_point_names('reports.missing') == []
+
+
+def test_load_object():
+    """
+    Тест импорта объекта по пути к нему.
+    """
+    assert load_object('src.utils.plugins:load_object') is load_object
+    
+    with pytest.raises(ImportError):
+        load_object('src.utils.plugins:missing')
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import io
+import json
+import pstats
+import time
+import tracemalloc
+
+from src.utils.profiling import Profiler, PROFILE_CHUNK_SIZE
+
+
+def test_nested_stage_time_is_excluded():
+    """
+    Тест вычитания времени вложенного этапа из времени объемлющего.
+    """
+    profiler = Profiler()
+    
+    with profiler.stage('write'):
+        with profiler.stage('read'):
+            time.sleep(0.05)
+    
+    assert profiler.stages['read'].wall >= 0.05
+    assert profiler.stages['write'].wall < 0.05
+    assert profiler.stages['write'].total_wall >= 0.05
+
+
+def test_iterate_counts_rows_and_preserves_items():
+    """
+    Тест обертки источника: элементы не меняются, строки считаются, этап учитывается по пакетам.
+    """
+    profiler = Profiler()
+    rows = list(range(PROFILE_CHUNK_SIZE * 2 + 5))
+    
+    assert list(profiler.iterate('read', rows, count_rows=True)) == rows
+    assert profiler.rows == len(rows)
+    assert profiler.stages['read'].calls == 4
+
+
+def test_wrap_report_measures_lazy_values():
+    """
+    Тест учета ленивых значений отчета в этапе генерации.
+    """
+    profiler = Profiler()
+    report_data = profiler.wrap_report('generate', {'report_type': 'payout', 'items': iter([1, 2]), 'total': lambda: 3})
+    
+    with profiler.stage('write'):
+        assert list(report_data['items']) == [1, 2]
+        assert report_data['total']() == 3
+    
+    assert report_data['report_type'] == 'payout'
+    assert profiler.stages['generate'].calls == 3
+
+
+def test_disabled_profiler_returns_sources():
+    """
+    Тест выключенного профилировщика: источники возвращаются без оберток, вывода нет.
+    """
+    profiler = Profiler(enabled=False)
+    report_data = {'items': iter([1])}
+    stream = io.StringIO()
+    
+    with profiler.stage('read'):
+        pass
+    
+    assert profiler.wrap_report('generate', report_data) is report_data
+    assert list(profiler.iterate('read', [1, 2])) == [1, 2]
+    
+    profiler.report(stream)
+    
+    assert profiler.stages == {}
+    assert stream.getvalue() == ''
+
+
+def test_stop_writes_profile_snapshot_and_json(tmpdir):
+    """
+    Тест сохранения дампа cProfile, снимка tracemalloc и статистики в JSON.
+    """
+    profile_file = str(tmpdir.join('run.prof'))
+    snapshot_file = str(tmpdir.join('run.snapshot'))
+    json_file = str(tmpdir.join('stats.json'))
+    profiler = Profiler(enabled=False, profile_file=profile_file, snapshot_file=snapshot_file)
+    profiler.start()
+    
+    rows = list(profiler.iterate('read', ([index] * 10 for index in range(100)), count_rows=True))
+    
+    profiler.stop()
+    profiler.write_json(json_file)
+    
+    with open(json_file, 'r', encoding='utf-8') as file:
+        stats = json.load(file)
+    
+    assert len(rows) == 100
+    assert stats['rows'] == 100
+    assert stats['traced_peak'] > 0
+    assert stats['stages']['read']['rows_per_second'] > 0
+    assert pstats.Stats(profile_file).total_calls > 0
+    assert tracemalloc.Snapshot.load(snapshot_file).traces
+    assert not tracemalloc.is_tracing()
+    assert 'read' in profiler.summary()
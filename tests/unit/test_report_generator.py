@@ -2,7 +2,8 @@
 import pytest
 from typing import List, Dict, Any
 
-from src.reports.report_generator import ReportFactory, PayoutReportGenerator, ReportGenerator
+from src.reports.report_generator import ReportFactory, PayoutReportGenerator, ReportGenerator, materialize_report
+from src.utils.employee_table import EmployeeTable
 
 
 @pytest.fixture
@@ -155,4 +156,151 @@ def test_report_factory_register_generator():
     
     # Проверяем работу нового генератора
     report_data = generator.generate([])
-    assert report_data == {"report_type": "test", "items": [], "total": 0} 
\ No newline at end of file
+    assert report_data == {"report_type": "test", "items": [], "total": 0} 
+
+def test_payout_report_generator_from_table(sample_employees_data):
+    """
+    Тест генератора отчетов на колоночной таблице.
+    """
+    generator = PayoutReportGenerator()
+    expected = generator.generate(sample_employees_data)
+    
+    table = EmployeeTable.from_rows(sample_employees_data)
+    report_data = generator.generate(table)
+    
+    assert report_data == expected
+
+
+def test_payout_report_generator_reports_invalid_rows(sample_employees_data, capsys):
+    """
+    Тест построчного сообщения об ошибках при пакетной обработке.
+    """
+    sample_employees_data[1]['hours_worked'] = 'abc'
+    
+    generator = PayoutReportGenerator()
+    generator.batch_size = 2
+    report_data = generator.generate(iter(sample_employees_data))
+    
+    assert [item['name'] for item in report_data['items']] == ['Alice Johnson', 'Carol Williams']
+    assert report_data['total'] == 18200.0
+    assert "Ошибка обработки данных для Bob Smith" in capsys.readouterr().out
+
+
+def test_payout_report_generator_merge(sample_employees_data):
+    """
+    Тест объединения частичных отчетов.
+    """
+    generator = PayoutReportGenerator()
+    
+    merged = generator.merge([
+        generator.generate(sample_employees_data[:1]),
+        generator.generate(sample_employees_data[1:]),
+    ])
+    
+    assert merged == generator.generate(sample_employees_data)
+    assert generator.merge([]) == {'report_type': 'payout', 'items': [], 'total': 0}
+
+
+def test_report_factory_get_required_columns():
+    """
+    Тест получения колонок, нужных генератору отчетов.
+    """
+    columns = ReportFactory.get_required_columns('payout')
+    
+    assert 'name' in columns
+    assert 'hours_worked' in columns
+    assert {'hourly_rate', 'rate', 'salary'} <= set(columns)
+    assert 'email' not in columns
+    
+    assert ReportFactory.get_required_columns('nonexistent') is None
+
+
+def test_payout_report_generator_stream(sample_employees_data):
+    """
+    Тест генерации отчета с ленивыми элементами.
+    """
+    generator = PayoutReportGenerator()
+    generator.batch_size = 2
+    report_data = generator.generate_stream(iter(sample_employees_data))
+    
+    assert report_data['report_type'] == 'payout'
+    assert next(report_data['items'])['name'] == 'Alice Johnson'
+    
+    rest = list(report_data['items'])
+    assert [item['name'] for item in rest] == ['Bob Smith', 'Carol Williams']
+    assert report_data['total']() == 24200.0
+
+
+def test_materialize_report():
+    """
+    Тест вычисления ленивых значений отчета.
+    """
+    items = iter([{'amount': 1.0}])
+    report_data = materialize_report({'items': items, 'total': lambda: 1.0, 'report_type': 'test'})
+    
+    assert report_data == {'items': [{'amount': 1.0}], 'total': 1.0, 'report_type': 'test'}
+
+
+def test_payout_report_generator_without_items(sample_employees_data):
+    """
+    Тест генерации отчета без элементов по сотрудникам.
+    """
+    generator = ReportFactory.get_generator('payout', include_items=False)
+    report_data = generator.generate(sample_employees_data)
+    
+    assert report_data == {'report_type': 'payout', 'items': [], 'total': 24200.0}
+
+
+def test_payout_report_generator_top(sample_employees_data):
+    """
+    Тест отчета, содержащего только сотрудников с наибольшими выплатами.
+    """
+    generator = ReportFactory.get_generator('payout', top=2)
+    report_data = generator.generate(sample_employees_data)
+    
+    assert [item['name'] for item in report_data['items']] == ['Carol Williams', 'Alice Johnson']
+    assert report_data['total'] == 24200.0
+
+
+def test_report_factory_register_generator_by_path():
+    """
+    Тест регистрации генератора по пути к классу: класс импортируется при первом обращении.
+    """
+    ReportFactory.register_generator('department_by_path', 'src.reports.department_report:DepartmentReportGenerator')
+    
+    from src.reports.department_report import DepartmentReportGenerator
+    
+    assert ReportFactory.get_generator_class('department_by_path') is DepartmentReportGenerator
+    assert ReportFactory.get_required_columns('department_by_path') == DepartmentReportGenerator.required_columns
+    assert 'department_by_path' in ReportFactory.get_report_types()
+
+
+def test_report_factory_register_generator_by_missing_path():
+    """
+    Тест регистрации генератора по несуществующему пути.
+    """
+    ReportFactory.register_generator('missing', 'src.reports.report_generator:MissingGenerator')
+    
+    with pytest.raises(ImportError):
+        ReportFactory.get_generator('missing')
+
+
+def test_report_factory_get_unsupported_options():
+    """
+    Тест проверки параметров конструктора: генератор без параметров
+    создается без аргументов, а переданные ему параметры определяются заранее.
+    """
+    class PlainReportGenerator(ReportGenerator):
+        def __init__(self) -> None:
+            super().__init__()
+        
+        def generate(self, employees_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+            return {"report_type": "plain", "items": [], "total": 0}
+    
+    ReportFactory.register_generator('plain', PlainReportGenerator)
+    
+    assert ReportFactory.get_unsupported_options('plain', {}) == []
+    assert isinstance(ReportFactory.get_generator('plain'), PlainReportGenerator)
+    assert ReportFactory.get_unsupported_options('plain', {'include_items': False, 'top': 1}) == \
+        ['include_items', 'top']
+    assert ReportFactory.get_unsupported_options('nonexistent', {'top': 1}) == []
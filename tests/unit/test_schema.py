@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+import pytest
+
+from src.utils.schema import Schema, ConversionErrors, FLOAT, CATEGORY, STRING
+
+
+def test_infer_known_columns():
+    """
+    Тест определения типов известных колонок по заголовку.
+    """
+    schema = Schema({'id': FLOAT})
+    
+    assert schema.infer(['id', 'name', 'department', 'hours_worked', 'salary']) == {
+        'id': FLOAT,
+        'name': STRING,
+        'department': CATEGORY,
+        'hours_worked': FLOAT,
+        'salary': FLOAT,
+    }
+
+
+def test_unknown_type():
+    """
+    Тест ошибки при объявлении неизвестного типа.
+    """
+    with pytest.raises(ValueError):
+        Schema({'id': 'int64'})
+
+
+def test_convert_drops_invalid_rows():
+    """
+    Тест преобразования колонок с исключением строк с некорректными значениями.
+    """
+    header = ['name', 'department', 'hours_worked', 'hourly_rate']
+    rows = [['Alice', 'Sales', '10', '5'], ['Bob', 'Sales', 'x', 'y'], ['Carol', 'IT', '2.5', '4']]
+    errors = ConversionErrors()
+    
+    converted = Schema().convert(header, rows, ['name', 'hours_worked', 'hourly_rate', 'salary'], errors)
+    
+    assert converted == {'name': ['Alice', 'Carol'], 'hours_worked': [10.0, 2.5], 'hourly_rate': [5.0, 4.0]}
+    assert errors.rows == 1
+    assert errors.columns == {'hours_worked': 1, 'hourly_rate': 1}
+    assert errors.examples == [('Bob', 'hours_worked', 'x'), ('Bob', 'hourly_rate', 'y')]
+    assert not ConversionErrors()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+import asyncio
+import json
+import os
+
+import pytest
+
+from src.reports.columnar import ColumnarReader
+from src.reports.formatters import JsonFormatter
+from src.reports.report_generator import PayoutReportGenerator
+from src.server import ReportServer, TableCache
+from src.utils.csv_reader import CSVReader
+from src.utils.diagnostics import Diagnostics
+from src.utils.employee_table import EmployeeTable
+
+
+CSV_DATA = (
+    "id,email,name,department,hours_worked,hourly_rate\n"
+    "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
+    "2,bob@example.com,Bob Smith,Design,150,40\n"
+    "3,carol@example.com,Carol Williams,Design,n/a,60\n"
+)
+
+
+def request(server, target, binary=False):
+    """
+    Запускает сервер, выполняет GET запрос и возвращает (статус, заголовки, тело).
+    """
+    async def run():
+        listener = await server.start('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        
+        head, body = response.split(b'\r\n\r\n', 1)
+        lines = head.decode('latin-1').split('\r\n')
+        headers = dict(line.split(': ', 1) for line in lines[1:])
+        
+        return int(lines[0].split()[1]), headers, body if binary else body.decode('utf-8')
+    
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def server(tmpdir):
+    tmpdir.join('data.csv').write(CSV_DATA)
+    
+    return ReportServer(str(tmpdir))
+
+
+def test_report_matches_formatter_and_uses_cache(server, tmpdir):
+    """
+    Тест отчета сервера: совпадает с отчетом форматера, повторный запрос берет файл из кэша.
+    """
+    table = CSVReader.read_table(str(tmpdir.join('data.csv')), diagnostics=Diagnostics())
+    expected = JsonFormatter().format(PayoutReportGenerator().generate(table))
+    
+    status, headers, body = request(server, '/report?report=payout&file=data.csv')
+    
+    assert status == 200
+    assert headers['Content-Type'].startswith('application/json')
+    assert headers['X-Report-Warnings'] == '1'
+    assert body == expected
+    
+    assert request(server, '/report?report=payout&file=data.csv')[2] == expected
+    assert server.cache.stats()['hits'] == 1
+    assert server.cache.stats()['misses'] == 1
+
+
+def test_report_options(server):
+    """
+    Тест параметров отчета: отбор, сортировка, текстовый формат и несколько файлов.
+    """
+    status, _, body = request(server, '/report?report=payout&file=data.csv&top=1')
+    
+    assert status == 200
+    assert [item['name'] for item in json.loads(body)['items']] == ['Alice Johnson']
+    
+    _, _, body = request(server, '/report?report=payout&file=data.csv&sort_by=name&sort_desc=1')
+    
+    assert [item['name'] for item in json.loads(body)['items']] == ['Bob Smith', 'Alice Johnson']
+    
+    status, headers, body = request(server, '/report?report=department&format=text&file=data.csv&file=data.csv')
+    
+    assert status == 200
+    assert headers['Content-Type'].startswith('text/plain')
+    assert 'Design' in body
+
+
+@pytest.mark.parametrize('target, status', [
+    ('/report?report=unknown&file=data.csv', 400),
+    ('/report?report=payout&format=xml&file=data.csv', 400),
+    ('/report?report=payout', 400),
+    ('/report?report=payout&file=data.csv&top=0', 400),
+    ('/report?report=payout&file=data.csv&by=department', 400),
+    ('/report?report=department&file=data.csv&top=1', 400),
+    ('/report?report=payout&file=missing.csv', 404),
+    ('/report?report=payout&file=../outside.csv', 403),
+    ('/report?report=payout&file=data.csv&sort_by=unknown', 500),
+    ('/unknown', 404),
+])
+def test_invalid_requests(server, target, status):
+    """
+    Тест ответов на некорректные запросы.
+    """
+    assert request(server, target)[0] == status
+
+
+def test_binary_report(server, tmpdir):
+    """
+    Тест двоичного колоночного отчета.
+    """
+    status, headers, body = request(server, '/report?report=payout&format=columnar&file=data.csv', binary=True)
+    
+    assert status == 200
+    assert headers['Content-Type'] == 'application/octet-stream'
+    
+    tmpdir.join('report.bin').write_binary(body)
+    
+    with ColumnarReader(str(tmpdir.join('report.bin'))) as reader:
+        assert reader.read_columns()['name'] == ['Alice Johnson', 'Bob Smith']
+        assert reader.report['total'] == 14000.0
+
+
+def test_health(server):
+    """
+    Тест статистики кэша.
+    """
+    status, _, body = request(server, '/health')
+    
+    assert status == 200
+    assert json.loads(body)['cache']['entries'] == 0
+
+
+def test_table_cache_evicts_least_recently_used(tmpdir):
+    """
+    Тест вытеснения давно не использовавшихся записей и устаревания измененного файла.
+    """
+    paths = []
+    
+    for index in range(3):
+        path = tmpdir.join(f'{index}.csv')
+        path.write(CSV_DATA)
+        paths.append(str(path))
+    
+    table = EmployeeTable()
+    table.append('Alice', 'Design', 1.0, 2.0)
+    cache = TableCache(max_size=table.memory_size() * 2)
+    
+    for path in paths[:2]:
+        cache.put(path, cache.file_version(path), table, Diagnostics())
+    
+    assert cache.get(paths[0]) is not None
+    
+    cache.put(paths[2], cache.file_version(paths[2]), table, Diagnostics())
+    
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[0]) is not None
+    assert cache.size <= cache.max_size
+    
+    tmpdir.join('0.csv').write(CSV_DATA + "4,dan@example.com,Dan,Design,10,10\n")
+    os.utime(paths[0], ns=(0, 0))
+    
+    assert cache.get(paths[0]) is None
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+from src.reports.report_generator import ReportFactory
+from src.reports.top_n import TopNSelector
+
+
+def test_add_columns_keeps_largest():
+    """
+    Тест отбора записей с наибольшими выплатами.
+    """
+    selector = TopNSelector(2)
+    selector.add_columns(['A', 'B', 'C'], ['X', 'Y', 'X'], [1.0, 2.0, 3.0], [10.0, 10.0, 10.0], [10.0, 20.0, 30.0])
+    selector.add_columns(['D'], ['Y'], [1.5], [10.0], [15.0])
+    
+    assert [item['name'] for item in selector.items()] == ['C', 'B']
+    assert selector.items()[0] == {'name': 'C', 'department': 'X', 'hours': 3.0, 'rate': 10.0, 'amount': 30.0}
+
+
+def test_add_columns_by_department():
+    """
+    Тест отбора записей отдельно в каждом отделе.
+    """
+    selector = TopNSelector(1, group_by='department')
+    selector.add_columns(['A', 'B', 'C', 'D'], ['Sales', 'Design', 'Sales', 'Design'],
+                         [1.0, 2.0, 3.0, 1.0], [10.0] * 4, [10.0, 20.0, 30.0, 10.0])
+    
+    assert [(item['department'], item['name']) for item in selector.items()] == [('Design', 'B'), ('Sales', 'C')]
+
+
+def test_ties_keep_first_seen():
+    """
+    Тест сохранения более ранней записи при равных суммах.
+    """
+    selector = TopNSelector(2)
+    selector.add_columns(['A', 'B', 'C'], ['X'] * 3, [1.0] * 3, [10.0] * 3, [10.0] * 3)
+    
+    assert [item['name'] for item in selector.items()] == ['A', 'B']
+
+
+def test_merge_reselects_top():
+    """
+    Тест повторного отбора при объединении частичных отчетов.
+    """
+    generator = ReportFactory.get_generator('payout', top=2)
+    first = generator.generate([{'name': 'A', 'department': 'X', 'hours_worked': '1', 'rate': '10'},
+                                {'name': 'B', 'department': 'X', 'hours_worked': '5', 'rate': '10'}])
+    second = generator.generate([{'name': 'C', 'department': 'Y', 'hours_worked': '3', 'rate': '10'}])
+    
+    merged = generator.merge([first, second])
+    
+    assert [item['name'] for item in merged['items']] == ['B', 'C']
+    assert merged['total'] == 90.0